@@ -1,42 +1,78 @@
-import sys
-import os
 import re
 import time
-from datetime import datetime
-import csv
-import random
+from datetime import datetime, timedelta
 import logging
-import pandas as pd
-import traceback
-from typing import List, Dict, Optional, Tuple
-
-# Selenium Imports
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+
+# Selenium / BeautifulSoup ถูก import ตอนใช้งานครั้งแรก (setup_driver / fetch_page_content / การ parse HTML)
+# process ที่ไม่เปิด Chrome (เช่น replay snapshot) หรือแค่ดูสรุปผลจึงเริ่มได้เร็ว
+import bank_registry
+from log_setup import setup_logging
+from output_sinks import get_sinks
+from page_status import PageCheck, classify_page, retry_hint
+from fetch_scheduler import FetchScheduler
+from job_queue import JOB_QUEUE_PATH, JobQueue
+from snapshot_store import SNAPSHOT_DIR, SnapshotStore
+from browser_session import BrowserSession, create_chrome_driver
+from resource_blocking import (
+    DEFAULT_BLOCKING, NetworkStats, ResourceBlockingConfig,
+    collect_network_stats, drain_network_log, enable_resource_blocking,
+)
+from dom_capture import capture_visible_dom
+from pattern_scanner import scan_name_position_pairs
+from executive_record import ExecutiveBatch, ExecutiveRecord
+from position_taxonomy import position_rank, tag_position
+from extraction_profiles import ExtractionProfile, ProfileRegistry, PROFILE_MIN_YIELD_RATIO, profile_key
+
+if TYPE_CHECKING:
+    from bs4 import Tag
 
 # --- CONFIG ---
 port = 11434
 OLLAMA_API_URL = f"http://localhost:{port}/api/generate"
 OLLAMA_MODEL = "llama3.2"
+OUTPUT_BACKENDS = ['csv', 'sqlite', 'people']  # เพิ่ม 'parquet' ได้ถ้าติดตั้ง pyarrow
+USE_DOM_CAPTURE = True  # ดึงเฉพาะข้อความที่มองเห็นจาก DOM ใน browser แทน page_source ทั้งหน้า
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
-logger = logging.getLogger(__name__)
+# Tag ที่ใช้เป็น text block ในการหาชื่อ/ตำแหน่ง และขนาด text ที่ยอมรับ
+TEXT_BLOCK_TAGS = frozenset(['p', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'li', 'td', 'th', 'a'])
+TEXT_BLOCK_MIN_LEN = 4
+TEXT_BLOCK_MAX_LEN = 300
+
+# Scroll-to-load: เลื่อนทีละหน้าจอ หยุดเมื่อความสูงหน้าและจำนวนชื่อใน DOM ไม่เพิ่มแล้ว
+SCROLL_STEP_PAUSE = 0.8      # วินาทีที่รอหลังเลื่อนแต่ละครั้ง
+SCROLL_STABLE_ROUNDS = 2     # จำนวนครั้งติดกันที่ต้องไม่มีอะไรเพิ่ม (ที่ท้ายหน้า) ถึงจะหยุด
+SCROLL_MAX_SECONDS = 45      # เวลาสูงสุดของการ scroll ต่อหน้า
+# ก่อน scroll: รอจนมีชื่อคนแรกใน DOM หรือหน้าโหลดเสร็จและ scrollHeight นิ่ง (แทน sleep ตายตัว)
+CONTENT_POLL_INTERVAL = 0.25 # วินาทีระหว่างการตรวจแต่ละครั้ง
+CONTENT_SETTLE_SECONDS = 2.0 # หน้าที่ยังไม่มีชื่อ: scrollHeight ต้องไม่เปลี่ยนนานเท่านี้ถึงจะเริ่ม scroll
+CONTENT_WAIT_MAX = 10        # เวลารอสูงสุด (วินาที) ก่อนเริ่ม scroll (บวก extra_wait ของ retry)
+
+SCROLL_PROBE_JS = r"""
+const text = document.body ? document.body.innerText : '';
+const names = text.match(/(?:นางสาว|นาย|นาง|ดร\.?|คุณ)\s?[\u0E00-\u0E7F]{2,}/g);
+const doc = document.scrollingElement || document.documentElement;
+return [doc.scrollHeight, window.innerHeight, window.scrollY, names ? names.length : 0,
+        document.readyState === 'complete'];
+"""
+
+setup_logging()
+# ชื่อ logger คงที่ (__name__ เป็น '__main__' เมื่อรันไฟล์นี้ตรงๆ) ตั้งระดับแยกได้ผ่าน log_setup
+logger = logging.getLogger('scraper')
+progress_log = logging.getLogger('scraper.progress')   # ขั้นตอนระหว่างทำแต่ละ URL (profile quiet ปิด)
+extract_log = logging.getLogger('scraper.extract')
+detect_log = logging.getLogger('scraper.detect')
 
 # --- VERIFIER HANDLING ---
 # พยายาม Import Verifier ของจริง ถ้าไม่มีจะใช้ Mock Class เพื่อให้โปรแกรมไม่ Crash
 try:
     from verifier import Verifier
 except ImportError:
-    logging.warning("⚠️ Could not import 'verifier.py'. Using DummyVerifier instead.")
+    logger.warning("⚠️ Could not import 'verifier.py'. Using DummyVerifier instead.")
     class Verifier:
+        def __init__(self, *args, **kwargs):
+            pass
+
         def verify(self, executives, html_content, bank_name):
             return {
                 'is_complete': True,
@@ -46,100 +82,65 @@ except ImportError:
             }
 
 class FlexibleBankScraper:
-    def __init__(self, base_url):
+    def __init__(self, base_url, session: Optional[BrowserSession] = None,
+                 blocking: Optional[ResourceBlockingConfig] = DEFAULT_BLOCKING,
+                 dom_capture: bool = USE_DOM_CAPTURE, keep_raw_page: bool = False):
         self.base_url = base_url
+        self.session = session
+        self.blocking = blocking  # None = โหลดทุก resource
+        self.dom_capture = dom_capture
+        self.keep_raw_page = keep_raw_page  # True = อ่าน page_source ทั้งหน้าเก็บไว้เสมอ (ใช้เมื่อเก็บคลัง snapshot)
+        self.network_stats: Optional[NetworkStats] = None
         self.driver = None
         self.bank_name = None
         self.busi_dt = datetime.now().strftime("%Y-%m-%d")
         self.verified_executives = []
+        self.profiles = ProfileRegistry()
+        self.page_check: Optional[PageCheck] = None
+        self.raw_page: Optional[str] = None   # page_source ทั้งหน้าของการโหลดล่าสุด (None = ไม่ได้อ่าน)
 
 
     def detect_bank_name(self, url: str, html_content: Optional[str] = None) -> str:
-        url_lower = url.lower()
-        logging.info(f"\n{'='*80}")
-        logging.info(f"🔍 BANK DETECTION DEBUG")
-        logging.info(f"{'='*80}")
-        logging.info(f"🔗 URL: {url}")
-        
-        bank_keywords = {
-            'bangkokbank': 'ธนาคารกรุงเทพ',
-            'bbl': 'ธนาคารกรุงเทพ',
-            'kasikorn': 'ธนาคารกสิกรไทย',
-            'kbank': 'ธนาคารกสิกรไทย',
-            'kasikornbank': 'ธนาคารกสิกรไทย',
-            'scb': 'ธนาคารไทยพาณิชย์',
-            'siamcommercial': 'ธนาคารไทยพาณิชย์',
-            'ktb': 'ธนาคารกรุงไทย',
-            'krungthai': 'ธนาคารกรุงไทย',
-            'krungsri': 'ธนาคารกรุงศรีอยุธยา',
-            'ttb': 'ธนาคารทหารไทยธนชาต',
-            'tmbthanachart': 'ธนาคารทหารไทยธนชาต',
-            'kiatnakin': 'ธนาคารเกียรตินาคินภัทร',
-            'kkp': 'ธนาคารเกียรตินาคินภัทร',
-            'thanachart': 'ธนาคารธนชาต',
-            'tisco': 'ธนาคารทิสโก้',
-            'icbc': 'ธนาคารไอซีบีซี (ไทย)',
-            'cimb': 'ธนาคารซีไอเอ็มบี ไทย',
-        }
-        
-        for keyword, bank_name in bank_keywords.items():
-            if keyword in url_lower:
-                logging.info(f" MATCH FOUND!!!")
-                logging.info(f"    Keyword: '{keyword}'")
-                logging.info(f"    Bank: {bank_name}")
-                logging.info(f"{'='*80}\n")
-                return bank_name
+        # 1. Domain lookup จาก registry (กรณีส่วนใหญ่จบที่นี่)
+        bank = bank_registry.bank_from_url(url)
+        if bank:
+            detect_log.debug(" ---- Bank detected from domain: %s (%s) ---- ", bank.name, url)
+            return bank.name
+        
+        # 2. Keyword ใน URL
+        match = bank_registry.KEYWORD_MATCHER.search(url.lower())
+        if match:
+            detect_log.debug(" ---- Bank detected from URL keyword '%s': %s ---- ", match[0], match[1])
+            return match[1]
         
-        logging.warning(f"⚠️ No bank detected from URL!")
-        logging.warning(f"⚠️ Checking page content...\n")
+        detect_log.warning("⚠️ No bank detected from URL, checking page content... (%s)", url)
 
         if html_content:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, 'html.parser')
             title = soup.find('title')
             if title:
-                title_text = title.get_text().lower()
-                for keyword, bank_name in bank_keywords.items():
-                    if keyword in title_text:
-                        logging.info(f" Bank detected from page title: {bank_name}")
-                        return bank_name
+                match = bank_registry.KEYWORD_MATCHER.search(title.get_text().lower())
+                if match:
+                    detect_log.info(" Bank detected from page title: %s", match[1])
+                    return match[1]
             
             meta_tags = soup.find_all('meta', attrs={'name': ['description', 'title', 'og:title']})
-            for meta in meta_tags:
-                content = meta.get('content', '').lower()
-                for keyword, bank_name in bank_keywords.items():
-                    if keyword in content:
-                        logging.info(f"🏦 Bank detected from meta tags: {bank_name}")
-                        return bank_name
-            
-            page_text = soup.get_text()
-            
-            thai_bank_exact = {
-                'ธนาคารกรุงเทพ': 'ธนาคารกรุงเทพ',
-                'กรุงเทพ': 'ธนาคารกรุงเทพ',
-                'Bangkok Bank': 'ธนาคารกรุงเทพ',
-                'ธนาคารกสิกรไทย': 'ธนาคารกสิกรไทย',
-                'กสิกรไทย': 'ธนาคารกสิกรไทย',
-                'Kasikornbank': 'ธนาคารกสิกรไทย',
-                'ธนาคารไทยพาณิชย์': 'ธนาคารไทยพาณิชย์',
-                'ไทยพาณิชย์': 'ธนาคารไทยพาณิชย์',
-                'ธนาคารกรุงไทย': 'ธนาคารกรุงไทย',
-                'กรุงไทย': 'ธนาคารกรุงไทย',
-                'ธนาคารออมสิน': 'ธนาคารออมสิน',
-                'ออมสิน': 'ธนาคารออมสิน',
-                'gsb': 'ธนาคารออมสิน',
-                'ธนาคารกรุงศรีอยุธยา': 'ธนาคารกรุงศรีอยุธยา',
-                'กรุงศรีอยุธยา': 'ธนาคารกรุงศรีอยุธยา',
-            }
+            meta_text = "\n".join(meta.get('content', '') for meta in meta_tags).lower()
+            match = bank_registry.KEYWORD_MATCHER.search(meta_text)
+            if match:
+                detect_log.info("🏦 Bank detected from meta tags: %s", match[1])
+                return match[1]
             
-            for thai_keyword, bank_name in thai_bank_exact.items():
-                if thai_keyword in page_text:
-                    logging.info(f" Bank detected from the page text '{thai_keyword}': {bank_name}")
-                    return bank_name
+            match = bank_registry.TEXT_ALIAS_MATCHER.search(soup.get_text())
+            if match:
+                detect_log.info(" Bank detected from the page text '%s': %s", match[0], match[1])
+                return match[1]
         
         domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
         if domain_match:
             domain = domain_match.group(1)
-            logging.warning(f" Could not auto-detect bank. Domain: {domain}")
+            detect_log.warning(" Could not auto-detect bank. Domain: %s", domain)
             return f" ธนาคาร ({domain})"
         
         return "ธนาคารไม่ระบุ"
@@ -147,76 +148,159 @@ class FlexibleBankScraper:
 
     def setup_driver(self) -> bool:
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            ]
-            chrome_options.add_argument(f"user-agent={random.choice(user_agents)}")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(60)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # ถ้ามี BrowserSession จะยืม tab จาก Chrome ที่เปิดค้างไว้ ไม่ต้องเปิด Chrome ใหม่ทุก URL
+            if self.session is not None:
+                self.driver = self.session.acquire()
+            else:
+                self.driver = create_chrome_driver()
+                progress_log.info(" ---- WebDriver setup completed!!! ----- ")
             
-            logging.info(" ---- WebDriver setup completed!!! ----- ")
+            # Block รูป / font / media / tracker ใน tab นี้ (เราใช้แค่ข้อความใน DOM)
+            if self.blocking is not None:
+                enable_resource_blocking(self.driver, self.blocking)
             return True
             
         except Exception as e:
-            logging.error(f"----- Error setting up WebDriver: {e} -----")
+            logger.error("----- Error setting up WebDriver: %s -----", e)
             return False
 
 
     def fetch_page_content(self, url: str, retries: int = 3) -> Optional[str]:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         if self.driver is None:
             if not self.setup_driver():
                 return None
                 
+        self.page_check = None
+        self.raw_page = None
+        extra_wait = 0
         for attempt in range(retries):
+            backoff = 5 * (attempt + 1)
             try:
-                time.sleep(random.uniform(2, 4))
-                logging.info(f" Navigating to {url} (attempt {attempt+1}/{retries})")
+                progress_log.info(" Navigating to %s (attempt %s/%s)", url, attempt+1, retries)
+                drain_network_log(self.driver)
                 self.driver.get(url)
                 
                 WebDriverWait(self.driver, 20).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
-                logging.info(" ---- Waiting for content to load... ----")
-                time.sleep(5)
+                progress_log.info(" ---- Waiting for content to load... ----")
+                self._wait_for_content(CONTENT_WAIT_MAX + extra_wait)
                 
-                logging.info(" ---- Scrolling to load dynamic content... ----")
-                for scroll_pct in [0.25, 0.5, 0.75, 1.0]:
-                    self.driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {scroll_pct});")
-                    time.sleep(2)
+                progress_log.info(" ---- Scrolling to load dynamic content... ----")
+                self._scroll_until_stable()
                 
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                page_source = self._read_page()
                 
-                page_source = self.driver.page_source
+                self.network_stats = collect_network_stats(self.driver)
+                if self.network_stats:
+                    progress_log.info(" ---- Network: %s ---- ", self.network_stats.summary())
                 
-                if len(page_source) > 500:
-                    logging.info(f" ---- Page fetched successfully ({len(page_source)} chars) ---- ")
+                # ตรวจประเภทหน้าจาก HTML ดิบ ก่อนส่งต่อไป parse / LLM
+                self.page_check = classify_page(page_source)
+                if self.page_check.ok:
+                    progress_log.info(" ---- Page fetched successfully (%s chars) ---- ", len(page_source))
                     return page_source
                 
+                logger.warning(" ---- Page classified as '%s': %s ---- ", self.page_check.status.value, self.page_check.reason)
+                hint = retry_hint(self.page_check)
+                if not hint.retry or attempt + 1 >= hint.max_attempts:
+                    break
+                backoff = hint.backoff
+                extra_wait = hint.extra_wait
+                
             except Exception as e:
-                logging.warning(f" ---- Error on attempt {attempt+1}: {e} ----")
+                logger.warning(" ---- Error on attempt %s: %s ----", attempt+1, e)
                 
             if attempt < retries - 1:
-                time.sleep(5 * (attempt + 1))
+                time.sleep(backoff)
         
-        logging.error(" ---- Failed to fetch page after all retries ----")
+        logger.error(" ---- Failed to fetch page after all retries ----")
         return None
 
 
+    def _read_page(self) -> str:
+        """
+        อ่าน HTML ของหน้าที่ render แล้ว
+        - dom_capture: ใช้ script ใน browser ดึงเฉพาะข้อความที่มองเห็นพร้อม tag/class (โครงร่างเล็ก parse เร็ว)
+        - ถ้าโครงร่างดูไม่ใช่หน้าปกติ (block / captcha / หน้าว่าง) ใช้ page_source ทั้งหน้าแทน
+          เพราะ signature ของ WAF / captcha อยู่ใน markup ที่ไม่มีข้อความ ซึ่งถูกตัดออกจากโครงร่าง
+        - page_source ทั้งหน้าที่อ่านมาเก็บไว้ที่ self.raw_page: ใช้โครงร่างได้แล้วจะอ่าน page_source
+          เพิ่มเฉพาะเมื่อ keep_raw_page (คลัง snapshot เก็บหน้าจริง ไม่ใช่โครงร่าง) เพราะ page_source หลาย MB
+          ต้องข้าม WebDriver มาทั้งก้อน
+        """
+        if self.dom_capture:
+            skeleton = capture_visible_dom(self.driver)
+            if skeleton and classify_page(skeleton).ok:
+                progress_log.info(" ---- Captured visible DOM (%s chars) ---- ", len(skeleton))
+                if self.keep_raw_page:
+                    self.raw_page = self.driver.page_source
+                return skeleton
+        self.raw_page = self.driver.page_source
+        return self.raw_page
+
+    def _wait_for_content(self, timeout: float) -> float:
+        """
+        รอจนหน้าเริ่มมีเนื้อหา: มีชื่อที่มีคำนำหน้าใน DOM แล้ว หรือโหลดเสร็จ (readyState) และ scrollHeight
+        ไม่เปลี่ยนนาน CONTENT_SETTLE_SECONDS (หน้าที่ไม่มีชื่อเลย) ไม่เกิน timeout วินาที
+        Returns:
+            วินาทีที่รอ
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        last_height, settled_since = None, start
+        while True:
+            height, _, _, name_count, loaded = self.driver.execute_script(SCROLL_PROBE_JS)
+            now = time.monotonic()
+            if name_count:
+                break
+            if height != last_height:
+                last_height, settled_since = height, now
+            elif loaded and now - settled_since >= CONTENT_SETTLE_SECONDS:
+                break
+            if now >= deadline:
+                progress_log.info(" ---- No names after %ss, scrolling anyway ---- ", timeout)
+                break
+            time.sleep(CONTENT_POLL_INTERVAL)
+        waited = time.monotonic() - start
+        logger.debug(" ---- Content ready after %.1fs (%s names) ---- ", waited, name_count)
+        return waited
+
+    def _scroll_until_stable(self):
+        """
+        เลื่อนหน้าลงทีละ viewport จนถึงท้ายหน้า แล้วรอจนทั้ง scrollHeight และจำนวนชื่อที่มีคำนำหน้า
+        ไม่เพิ่มขึ้น SCROLL_STABLE_ROUNDS ครั้งติดกัน (หน้าสั้นจบเร็ว หน้า lazy-load ยาวโหลดได้ครบ)
+        """
+        deadline = time.monotonic() + SCROLL_MAX_SECONDS
+        last_state = None
+        stable_rounds = 0
+        steps = 0
+        
+        while time.monotonic() < deadline:
+            height, viewport, scroll_y, name_count, _ = self.driver.execute_script(SCROLL_PROBE_JS)
+            
+            if scroll_y + viewport >= height - 2:
+                state = (height, name_count)
+                stable_rounds = stable_rounds + 1 if state == last_state else 0
+                last_state = state
+                if stable_rounds >= SCROLL_STABLE_ROUNDS:
+                    break
+            else:
+                self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
+                steps += 1
+            
+            time.sleep(SCROLL_STEP_PAUSE)
+        else:
+            logger.warning(" ---- Scroll budget (%ss) reached before content stopped growing ---- ", SCROLL_MAX_SECONDS)
+        
+        progress_log.info(" ---- Scrolled %s step(s), page height %spx, %s names in DOM ---- ",
+                    steps, last_state[0] if last_state else '?', last_state[1] if last_state else '?')
+        self.driver.execute_script("window.scrollTo(0, 0);")
+
     def _is_valid_thai_name(self, text: str, relaxed: bool = False) -> bool:
         if not text or len(text) < 8 or len(text) > 90:
             return False
@@ -325,10 +409,11 @@ class FlexibleBankScraper:
 
     def extract_executives_from_html(self, html_content: str) -> List[Tuple[str, str]]:
         #ฟังก์ชันสำหรับแยกชื่อและตำแหน่งออกจากเนื้อหา
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html_content, 'html.parser')
         executives = []
         
-        logging.info("\n Extracting executives from HTML...")
+        extract_log.info("\n Extracting executives from HTML...")
         
         # ลบ Element ที่ไม่ต้องการออกก่อน
         for script in soup(["script", "style", "noscript", "footer", "header"]):
@@ -337,20 +422,32 @@ class FlexibleBankScraper:
         for nav in soup.find_all('nav'):
             if nav: nav.decompose()
 
-        all_text_elements = soup.find_all(['p', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'li', 'td', 'th', 'a'])
-        
-        # Pre-process All Text
-        processed_texts = []
-        for element in all_text_elements:
-            # ใช้ separator= " " เพื่อป้องกันคำติดกันเมื่อ HTML อยู่คนละ Tag
-            # เช่น <span>นาย</span><span>กานต์</span> จะได้ "นาย กานต์" ไม่ใช่ "นายกานต์"
-            text = element.get_text(" ", strip=True) 
-            text = re.sub(r'\s+', ' ', text).strip()
+        # ===== PASS 0: Site Profile (ถ้าเคยเรียนรู้ layout ของเว็บนี้แล้ว) =====
+        domain = profile_key(self.base_url)
+        profile = self.profiles.get(domain) if domain else None
+        profile_executives = None   # ผลจาก profile ที่ต้องตรวจซ้ำกับ generic passes (ได้ไม่ครบ expected_count)
+        if profile:
+            extract_log.info("\n ---- PASS 0: Extracting with site profile (%s, %s rules)... ---- ", domain, len(profile.rules))
+            found = self._finalize_executives(self._extract_with_profile(profile, soup))
+            
+            if profile.is_complete(len(found)):
+                extract_log.info(" ---- Site profile found %s executives (expected ~%s) ---- ", len(found), profile.expected_count)
+                if len(found) > profile.expected_count:
+                    profile.expected_count = len(found)
+                    self.profiles.put(profile)
+                return found
             
-            if 4 <= len(text) <= 300:
-                processed_texts.append((text, element))
+            if profile.accepts(len(found)):
+                # ได้ไม่ครบ -> ยังใช้ profile แต่รัน generic passes เพื่อเก็บคนที่ profile ตกหล่น
+                extract_log.info(" ---- Site profile found %s/%s executives, cross-checking with generic passes ---- ", len(found), profile.expected_count)
+                profile_executives = found
+            else:
+                extract_log.warning(" ---- Site profile yield dropped (%s/%s), falling back to generic passes ---- ", len(found), profile.expected_count)
+
+        # Pre-process All Text (คำนวณ text ของแต่ละ element ครั้งเดียวแบบ bottom-up)
+        processed_texts = self._build_text_blocks(soup)
         
-        logging.info(f" ---- Total text elements to process: {len(processed_texts)} ---- ")
+        extract_log.info(" ---- Total text elements to process: %s ---- ", len(processed_texts))
         
         # ฟังก์ชันช่วยเพิ่มชื่อเข้าลิสต์
         def add_executive(name, position, source_pass):
@@ -366,10 +463,10 @@ class FlexibleBankScraper:
                     return
 
                 executives.append((name, position))
-                logging.debug(f" ---- {source_pass}: {name} | {position} ----")
+                extract_log.debug(" ---- %s: %s | %s ----", source_pass, name, position)
 
         # ===== PASS 1: Table Extraction (Strongest signal) =====
-        logging.info("\n ---- PASS 1: Extracting from tables... ---- ")
+        extract_log.info("\n ---- PASS 1: Extracting from tables... ---- ")
         tables = soup.find_all('table')
         for table in tables:
             rows = table.find_all('tr')
@@ -394,10 +491,10 @@ class FlexibleBankScraper:
                             add_executive(name_found, text, "Table (Adj)")
                             break
         
-        logging.info(f" ---- After PASS 1 (Tables): {len(executives)} executives found ----")
+        extract_log.info(" ---- After PASS 1 (Tables): %s executives found ----", len(executives))
         
         # ===== PASS 2: Adjacent Text in Containers =====
-        logging.info("\n ---- PASS 2: Extracting from adjacent elements (normal) ---- ")
+        extract_log.info("\n ---- PASS 2: Extracting from adjacent elements (normal) ---- ")
         
         for i, (text, element) in enumerate(processed_texts):
             if self._is_valid_thai_name(text):
@@ -413,10 +510,10 @@ class FlexibleBankScraper:
                 if position:
                     add_executive(name, position, "Adjacent")
         
-        logging.info(f"📊 After PASS 2 (Adjacent): {len(executives)} executives found")
+        extract_log.info("📊 After PASS 2 (Adjacent): %s executives found", len(executives))
         
         # ===== PASS 3: Relaxed Mode =====
-        logging.info("\n ---- PASS 3: Extracting with relaxed criteria... ---- ")
+        extract_log.info("\n ---- PASS 3: Extracting with relaxed criteria... ---- ")
         
         for i, (text, element) in enumerate(processed_texts):
             if self._is_valid_thai_name(text, relaxed=True):
@@ -432,15 +529,15 @@ class FlexibleBankScraper:
                 if position:
                     add_executive(name, position, "Relaxed")
         
-        logging.info(f"📊 After PASS 3 (Relaxed): {len(executives)} executives found")
+        extract_log.info("📊 After PASS 3 (Relaxed): %s executives found", len(executives))
         
         # ===== PASS 4: Pattern Matching =====
-        logging.info("\n PASS 4: Pattern-based extraction...")
+        extract_log.info("\n PASS 4: Pattern-based extraction...")
         
         full_text = soup.get_text()
         
-        pattern1 = r'((?:นาย|นาง|นางสาว|ดร\.|คุณ)[^\n]{10,80})\s+([^\n]{10,100}(?:ผู้จัดการ|กรรมการ|ประธาน|ผู้บริหาร|Director|Manager|CEO|CFO|CTO|COO|President)[^\n]{0,50})'
-        matches1 = re.findall(pattern1, full_text, re.IGNORECASE)
+        # ได้ผลเท่ากับ regex pattern1 เดิม: ใช้ regex เดิมเมื่อบรรทัดสั้น และ sweep เชิงเส้นบนบรรทัดยาวๆ ของหน้า minified
+        matches1 = scan_name_position_pairs(full_text)
         
         for name_candidate, pos_candidate in matches1:
             name_clean = re.sub(r'\s+', ' ', name_candidate.strip())
@@ -449,10 +546,10 @@ class FlexibleBankScraper:
             if self._is_valid_thai_name(name_clean, relaxed=True) and self._is_valid_position(pos_clean, relaxed=True):
                 add_executive(name_clean, pos_clean, "Pattern1")
         
-        logging.info(f" After PASS 4 (Patterns): {len(executives)} executives found")
+        extract_log.info(" After PASS 4 (Patterns): %s executives found", len(executives))
 
         # ===== PASS 5: Conjoined Name/Position Splitting =====
-        logging.info("\n🔄 PASS 5: Conjoined Name/Position Splitting/Trimming...")
+        extract_log.info("\n🔄 PASS 5: Conjoined Name/Position Splitting/Trimming...")
 
         executives_to_process = executives.copy()
         executives = [] # เคลียร์และสร้างใหม่ด้วย Logic แยกคำ
@@ -472,7 +569,7 @@ class FlexibleBankScraper:
                 
                 # ตรวจสอบว่าชื่อที่ตัดมายังเป็นชื่อที่ถูกต้อง (ต้องมีคำนำหน้า)
                 if self._is_valid_thai_name(name_candidate, relaxed=True):
-                    logging.info(f"  ✂️ SPLIT Name: '{name}' -> Name: '{name_candidate}' | Pos: '{pos_candidate}'")
+                    extract_log.debug("  ✂️ SPLIT Name: '%s' -> Name: '%s' | Pos: '%s'", name, name_candidate, pos_candidate)
                     add_executive(name_candidate, position, "Split Name")
                     name_was_split = True
             
@@ -485,7 +582,7 @@ class FlexibleBankScraper:
                     
                     # ต้องมีตำแหน่งสำคัญอยู่ในส่วนที่ตัดมาและไม่สั้นเกินไป
                     if self._is_valid_position(pos_clean, relaxed=True) and len(pos_clean) > 5:
-                        logging.info(f"  ✂️ TRIM Pos: '{position}' -> Trimmed: '{pos_clean}' (Found next name: {match_in_pos.group(0)})")
+                        extract_log.debug("  ✂️ TRIM Pos: '%s' -> Trimmed: '%s' (Found next name: %s)", position, pos_clean, match_in_pos.group(0))
                         add_executive(name, pos_clean, "Trim Pos")
                         continue
 
@@ -494,9 +591,28 @@ class FlexibleBankScraper:
                 add_executive(name, position, "Unmodified")
 
 
-        logging.info(f" ---- After PASS 5 (Splitting/Trimming): {len(executives)} executives found ---- ")
+        extract_log.info(" ---- After PASS 5 (Splitting/Trimming): %s executives found ---- ", len(executives))
         
         # Step 6: Final Filter and Clean up
+        final_executives = self._finalize_executives(executives)
+
+        extract_log.info("\n ---- Total executives found after all passes: %s ---- \n", len(final_executives))
+
+        if profile_executives is not None:
+            # รวมผล profile (ลำดับตาม layout) กับคนที่ generic passes พบเพิ่ม ไม่ต้องเรียนรู้ profile ใหม่
+            merged = self._finalize_executives(profile_executives + final_executives)
+            extract_log.info(" ---- Site profile + generic passes: %s executives (profile %s) ---- ", len(merged), len(profile_executives))
+            if len(merged) > profile.expected_count:
+                profile.expected_count = len(merged)
+                self.profiles.put(profile)
+            return merged
+
+        if domain and final_executives:
+            self._learn_profile(domain, final_executives, processed_texts, soup)
+
+        return final_executives
+
+    def _finalize_executives(self, executives: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
         final_executives = []
         seen_names_tuple = set()
         
@@ -513,10 +629,110 @@ class FlexibleBankScraper:
                 final_executives.append((name, position))
                 seen_names_tuple.add(clean_name_key) 
 
-        logging.info(f"\n ---- Total executives found after all passes: {len(final_executives)} ---- \n")
-
         return final_executives
 
+    def _extract_with_profile(self, profile: ExtractionProfile, soup) -> List[Tuple[str, str]]:
+        return profile.extract(
+            soup,
+            lambda text: self._is_valid_thai_name(text, relaxed=True),
+            lambda text: self._is_valid_position(text, relaxed=True),
+        )
+
+    def _learn_profile(self, domain: str, executives: List[Tuple[str, str]],
+                       processed_texts: List[Tuple[str, 'Tag']], soup):
+        """
+        เรียนรู้ site profile จากผลของ heuristic แล้วบันทึกไว้ใช้ในครั้งถัดไป
+        - เก็บเฉพาะ profile ที่ดึงข้อมูลจากหน้าเดิมได้ใกล้เคียงกับ heuristic
+        """
+        profile = ExtractionProfile.learn(domain, executives, processed_texts)
+        if profile is None:
+            extract_log.info(" ---- No stable layout pattern found for %s, site profile not learned ---- ", domain)
+            self.profiles.discard(domain)
+            return
+        
+        profile_yield = len(self._finalize_executives(self._extract_with_profile(profile, soup)))
+        if profile_yield < len(executives) * PROFILE_MIN_YIELD_RATIO:
+            extract_log.info(" ---- Learned profile for %s covers only %s/%s executives, not saved ---- ", domain, profile_yield, len(executives))
+            self.profiles.discard(domain)
+            return
+        
+        # expected_count = ยอดของ heuristic (ไม่ใช่ของ profile) เพื่อให้ครั้งถัดไปรู้ว่า profile ตกหล่นกี่คน
+        profile.expected_count = len(executives)
+        self.profiles.put(profile)
+        extract_log.info(" ---- Learned site profile for %s: %s rules, %s executives ---- ", domain, len(profile.rules), profile_yield)
+
+    def _build_text_blocks(self, soup) -> List[Tuple[str, 'Tag']]:
+        """
+        สร้าง text block ของทุก element ใน TEXT_BLOCK_TAGS โดยเดิน DOM รอบเดียว
+        - text ของ element = text ของลูกแต่ละตัวต่อกันด้วย " " (เหมือน get_text(" ", strip=True))
+          ลูกที่มี text เพียงก้อนเดียวจะใช้ string object เดียวกับพ่อ ไม่สร้างใหม่
+        - element ที่ text ยาวเกิน TEXT_BLOCK_MAX_LEN จะไม่ถูกต่อ string (บรรพบุรุษก็เกินเช่นกัน)
+        - wrapper ที่ซ้อนกันและมี text เดียวกันจะเหลือแค่ block เดียว (เก็บ element ในสุดไว้)
+        Returns:
+            List ของ (text, element) ตามลำดับในเอกสาร
+        """
+        from bs4 import Tag, NavigableString, CData
+
+        overflow = object()
+        texts = {}         # id(element) -> text ของ element ที่ยังไม่ถูกพ่อใช้
+        block_texts = {}   # id(element) -> text ของ element ใน TEXT_BLOCK_TAGS
+        order = []
+        
+        stack = [(soup, False)]
+        while stack:
+            node, children_done = stack.pop()
+            
+            if not children_done:
+                if node.name in TEXT_BLOCK_TAGS:
+                    order.append(node)
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.contents) if isinstance(child, Tag))
+                continue
+            
+            parts = []
+            length = -1
+            for child in node.contents:
+                if isinstance(child, Tag):
+                    part = texts.pop(id(child), None)
+                elif type(child) in (NavigableString, CData):
+                    part = re.sub(r'\s+', ' ', child.strip())
+                else:
+                    continue
+                
+                if part is overflow:
+                    parts = overflow
+                    break
+                if part:
+                    parts.append(part)
+                    length += len(part) + 1
+                    if length > TEXT_BLOCK_MAX_LEN:
+                        parts = overflow
+                        break
+            
+            if parts is overflow:
+                text = overflow
+            elif len(parts) == 1:
+                text = parts[0]
+            else:
+                text = " ".join(parts)
+            
+            texts[id(node)] = text
+            if node.name in TEXT_BLOCK_TAGS:
+                block_texts[id(node)] = text
+        
+        processed_texts = []
+        for element in order:
+            text = block_texts[id(element)]
+            if text is overflow or len(text) < TEXT_BLOCK_MIN_LEN:
+                continue
+            # wrapper ที่ใช้ string เดียวกับลูก -> เก็บไว้ block เดียว ใช้ element ที่อยู่ในสุด
+            if processed_texts and processed_texts[-1][0] is text:
+                processed_texts[-1] = (text, element)
+                continue
+            processed_texts.append((text, element))
+        
+        return processed_texts
+
     def _parse_name_components(self, Full_Name: str) -> Tuple[str, str, str, str, str]:
          #Logic การตัดคำที่แม่นยำ ไม่ใช้ Hardcode ตัวเลข ทำให้ชื่อไม่ถูกตัดขาด
         full_name = Full_Name.strip()
@@ -591,13 +807,13 @@ class FlexibleBankScraper:
                     eng_index = match_eng.start()
                     surname_clean = surname[:eng_index].strip()
                     if surname_clean:
-                        logging.debug(f"  ✂️ Trimmed English suffix: '{surname}' -> '{surname_clean}'")
+                        extract_log.debug("  ✂️ Trimmed English suffix: '%s' -> '%s'", surname, surname_clean)
                         surname = surname_clean
             
             # --- ตัดคำว่า "รอง" ที่ท้ายนามสกุล ---
             if surname.endswith("รอง"):
                 surname = re.sub(r'\s*รอง$', '', surname).strip()
-                logging.debug(f"  ✂️ Trimmed trailing 'Rong' from surname")
+                extract_log.debug("  ✂️ Trimmed trailing 'Rong' from surname")
             
             # Full_Name = คำนำหน้าไทย + ชื่อ + นามสกุล
             full_name_thai = f"{thai_prefix}{first_name} {surname}" if thai_prefix else f"{first_name} {surname}"
@@ -609,7 +825,7 @@ class FlexibleBankScraper:
         records = []
         seen_names = set()
         
-        logging.info("\n Creating executive records...")
+        extract_log.info("\n Creating executive records...")
         
         for name, position in executives:
             
@@ -620,53 +836,53 @@ class FlexibleBankScraper:
                 continue
             
             if not first_name or (not surname and len(first_name.split()) < 2 and len(first_name) < 4):
-                logging.warning(f"  ⚠️ Could not parse name/surname effectively: {name}")
+                extract_log.warning("  ⚠️ Could not parse name/surname effectively: %s", name)
                 continue
             
-            record = {
-                "BUSI_DT": self.busi_dt,
-                "Eng_Prefix": eng_prefix,
-                "Full_Name": full_name,
-                "Thai_Prefix": thai_prefix,
-                "First_Name": first_name,
-                "Surname": surname,
-                "Bank_Name": self.bank_name,
-                "Position": position,
-                "Source_URL": self.base_url,
-            }
+            record = ExecutiveRecord(
+                BUSI_DT=self.busi_dt,
+                Eng_Prefix=eng_prefix,
+                Full_Name=full_name,
+                Thai_Prefix=thai_prefix,
+                First_Name=first_name,
+                Surname=surname,
+                Bank_Name=self.bank_name,
+                Position=position,
+                Source_URL=self.base_url,
+            )
             
 
-            records.append(record)
+            records.append(tag_position(record))
             seen_names.add(clean_name_key)
-            logging.info(f" ---- {eng_prefix} | {thai_prefix} | {first_name} {surname} | {position} ----")
+            extract_log.debug(" ---- %s | %s | %s %s | %s ----", eng_prefix, thai_prefix, first_name, surname, position)
         
         return self._sort_executive_records(records)
 
 
     def intelligent_scrape(self, limit: int = 150) -> List[Dict]:
-        logging.info(" ---- Starting scraping process... ---- ")
+        progress_log.info(" ---- Starting scraping process... ---- ")
         
         html_content = self.fetch_page_content(self.base_url)
         if not html_content:
-            logging.error(" ---- Failed to fetch page content ----")
+            logger.error(" ---- Failed to fetch page content ----")
             return []
         
         self.bank_name = self.detect_bank_name(self.base_url, html_content)
-        logging.info(f" ---- Bank: {self.bank_name} ----")
-        logging.info(f" ---- Business Date: {self.busi_dt} ----")
+        progress_log.info(" ---- Bank: %s ----", self.bank_name)
+        progress_log.info(" ---- Business Date: %s ----", self.busi_dt)
         
         executives = self.extract_executives_from_html(html_content)
         
         if not executives:
-            logging.error(" ---- No executives found ---- ")
+            logger.error(" ---- No executives found ---- ")
             return []
         
         records = self.create_executive_records(executives)
         
-        logging.info(f"\n ---- Total records created: {len(records)} ---- ")
+        progress_log.info("\n ---- Total records created: %s ---- ", len(records))
         return records[:limit]
 
-    def _create_record_from_llm_data(self, full_name: str, position: str, confidence: float) -> Optional[Dict]:
+    def _create_record_from_llm_data(self, full_name: str, position: str, confidence: float) -> Optional[ExecutiveRecord]:
         """
         สร้าง executive record จากข้อมูลที่ LLM ตรวจพบ
         Args:
@@ -674,7 +890,7 @@ class FlexibleBankScraper:
             position: ตำแหน่ง เช่น "กรรมการผู้จัดการใหญ่"
             confidence: ค่าความเชื่อมั่น 0.0-1.0
         Returns:
-            Dict record หรือ None ถ้าไม่สามารถสร้างได้
+            ExecutiveRecord หรือ None ถ้าไม่สามารถสร้างได้
         """
         try:
             # Parse ชื่อเป็นส่วนประกอบ
@@ -682,106 +898,78 @@ class FlexibleBankScraper:
             
             # ตรวจสอบความถูกต้องพื้นฐาน
             if not first_name or len(first_name) < 2:
-                logger.warning(f" ----  Invalid first name: {full_name} ----")
+                extract_log.warning(" ----  Invalid first name: %s ----", full_name)
                 return None
             
             if not position or len(position) < 4:
-                logger.warning(f"  ---- Invalid position: {position} ---- ")
+                extract_log.warning("  ---- Invalid position: %s ---- ", position)
                 return None
             
             # สร้าง record ตามโครงสร้างเดียวกับ create_executive_records()
-            record = {
-                "BUSI_DT": self.busi_dt,
-                "Eng_Prefix": eng_prefix,
-                "Full_Name": full_name_parsed,
-                "Thai_Prefix": thai_prefix,
-                "First_Name": first_name,
-                "Surname": surname,
-                "Bank_Name": self.bank_name,
-                "Position": position,
-                "Source_URL": self.base_url,
-                "Recovery_Confidence": confidence
-            }
+            record = ExecutiveRecord(
+                BUSI_DT=self.busi_dt,
+                Eng_Prefix=eng_prefix,
+                Full_Name=full_name_parsed,
+                Thai_Prefix=thai_prefix,
+                First_Name=first_name,
+                Surname=surname,
+                Bank_Name=self.bank_name,
+                Position=position,
+                Source_URL=self.base_url,
+                Recovery_Confidence=confidence,
+            )
+            tag_position(record)
 
-            logger.info(f"  ---- Created record: {eng_prefix} | {thai_prefix} {first_name} {surname} | {position} ---- ")
+            extract_log.info("  ---- Created record: %s | %s %s %s | %s ---- ", eng_prefix, thai_prefix, first_name, surname, position)
             return record
             
         except Exception as e:
-            logger.error(f"  ---- Error creating record from LLM data: {e} ---- ")
-            traceback.print_exc()
+            extract_log.exception("  ---- Error creating record from LLM data: %s ---- ", e)
             return None
     
     def _sort_executive_records(self, records: List[Dict]) -> List[Dict]:
         """
-        เรียงลำดับ executive records ตามลำดับความสำคัญของตำแหน่ง
+        เรียงลำดับ executive records ตามลำดับความสำคัญของตำแหน่ง (Position_Rank จาก position_taxonomy)
         Args:
             records: List ของ executive records
         Returns:
             List ที่ถูกเรียงลำดับแล้ว
         """
-        def sort_key(record):
-            position = record['Position'].lower()
-            
-            # 0. ลำดับสูงสุด: ประธานกรรมการ (Chairman)
-            if ('ประธาน' in position or 'chairman' in position) and 'กรรมการ' in position and 'บริหาร' not in position:
-                return 0
-            
-            # 1. ประธานเจ้าหน้าที่บริหาร / CEO / President
-            if 'ประธาน' in position and ('บริหาร' in position or 'ceo' in position):
-                return 1
-            if 'president' in position and 'vice' not in position:
-                return 1
-            
-            # 2. รองประธาน / Vice President
-            if 'รองประธาน' in position or 'vice president' in position:
-                return 2
-            
-            # 3. Chief Officers (CFO, CTO, COO, etc.)
-            if 'รองผู้จัดการใหญ่' in position or 'chief' in position or 'cfo' in position or 'cto' in position or 'coo' in position:
-                return 3
-            
-            # 4. กรรมการผู้จัดการใหญ่ / Managing Director
-            if 'ผู้จัดการใหญ่' in position or 'managing director' in position or 'md' in position:
-                return 4
-            
-            # 5. ผู้บริหารระดับสูง / Executive
-            if 'ผู้บริหาร' in position or 'executive' in position or 'head of' in position:
-                return 5
-            
-            # 6. กรรมการบริษัท / Director
-            if 'กรรมการ' in position or 'director' in position:
-                return 6
-            
-            # 7. ตำแหน่งอื่นๆ
-            return 7
-        
         try:
-            sorted_records = sorted(records, key=sort_key)
-            logger.info(f"✓ Sorted {len(sorted_records)} records by position hierarchy")
+            sorted_records = ExecutiveBatch(sorted(records, key=position_rank))
+            extract_log.info("✓ Sorted %s records by position hierarchy", len(sorted_records))
             return sorted_records
         except Exception as e:
-            logger.error(f" ---- Error sorting records: {e} ---- ")
+            extract_log.error(" ---- Error sorting records: %s ---- ", e)
             return records  # ถ้า sort ไม่ได้ให้คืนค่าเดิม
         
     def close(self):
-        """Close WebDriver"""
+        """Close WebDriver (หรือคืน tab ให้ BrowserSession ถ้ายืมมา)"""
         try:
-            if self.driver:
+            if self.session is not None:
+                if self.driver:
+                    self.session.release()
+            elif self.driver:
                 self.driver.quit()
-                logging.info(" ----  WebDriver closed ---- ")
+                progress_log.info(" ----  WebDriver closed ---- ")
         except Exception as e:
-            logging.error(f" ---- Error closing WebDriver: {e} ---- ")
+            logger.error(" ---- Error closing WebDriver: %s ---- ", e)
+        self.driver = None
             
-    def check_scraped_data_against_source(self, scraped_records: List[Dict]) -> List[Dict]:
-        logging.info("\n ---- Starting data validation check (Smart & Relaxed)... ---- ")
+    def check_scraped_data_against_source(self, scraped_records: List[Dict],
+                                          html_content: Optional[str] = None) -> List[Dict]:
+        progress_log.info("\n ---- Starting data validation check (Smart & Relaxed)... ---- ")
         
         if not scraped_records:
             return []
         
-        html_content = self.fetch_page_content(self.base_url) 
+        # ใช้ HTML ที่โหลดไว้แล้ว (เช่นจาก checkpoint) ถ้ามี ไม่ต้องโหลดหน้าซ้ำ
+        if html_content is None:
+            html_content = self.fetch_page_content(self.base_url) 
         if not html_content:
             return scraped_records
 
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html_content, 'html.parser')
         page_text = soup.get_text(" ", strip=True) # ใช้ separator เพื่อความชัวร์
         
@@ -805,7 +993,7 @@ class FlexibleBankScraper:
             for name_variant in names_to_check:
                 if name_variant and len(name_variant) > 3 and name_variant in page_text:
                     is_verified = True
-                    logging.debug(f" ---- Verified (Standard): {name_variant} ---- " )
+                    logger.debug(" ---- Verified (Standard): %s ---- ", name_variant)
                     break
             
             # Check 2: ค้นหาแบบไม่สนเว้นวรรค
@@ -816,243 +1004,280 @@ class FlexibleBankScraper:
                 
                 if len(clean_name_nospace) > 4 and clean_name_nospace in page_text_nospace:
                     is_verified = True
-                    logging.debug(f" ---- Verified (No-Space Match): {full_name} ---- ")
+                    logger.debug(" ---- Verified (No-Space Match): %s ---- ", full_name)
 
             if is_verified:
                 verified_records.append(record)
             else:
-                logging.warning(f" ---- Failed to verify: {full_name} (Not found in source text) ---- ")
+                logger.warning(" ---- Failed to verify: %s (Not found in source text) ---- ", full_name)
                 
-        logging.info(f" ---- Verified records: {len(verified_records)} / {len(scraped_records)} ---- ")
+        progress_log.info(" ---- Verified records: %s / %s ---- ", len(verified_records), len(scraped_records))
         return verified_records
 
 def save_to_csv(data: List[Dict], bank_name: str, busi_dt: str) -> bool:
+    return save_records(data, bank_name, busi_dt, backends=['csv'])
+
+
+def save_records(data: List[Dict], bank_name: str, busi_dt: str,
+                 backends: Optional[List[str]] = None) -> bool:
+    """
+    บันทึก records ลงทุก output backend ที่กำหนด (csv / sqlite / parquet)
+    Returns:
+        True ถ้ามีอย่างน้อย 1 backend ที่บันทึกสำเร็จ
+    """
     if not data:
-        logging.error(" ---- No data to save. ---- ")
+        logger.error(" ---- No data to save. ---- ")
         return False
-    try:
-        df = pd.DataFrame(data)
-        
-        # 1. กำหนดลำดับคอลัมน์ตามที่คุณต้องการเป๊ะๆ
-        column_order_save = [
-            'BUSI_DT', 'Eng_Prefix', 'Full_Name', 'Thai_Prefix', 
-            'First_Name', 'Surname', 'Bank_Name', 'Position'
-        ]
-        
-        for col in column_order_save:
-            if col not in df.columns:
-                df[col] = ""
-        
-        bank_short = bank_name.replace('ธนาคาร', '').strip()
-        bank_name_map = {
-            'กสิกรไทย': 'Kbank', 'กรุงเทพ': 'Bangkok', 'ไทยพาณิชย์': 'SCB',
-            'กรุงไทย': 'Krungthai', 'กรุงศรีอยุธยา': 'Krungsri', 'ออมสิน': 'GSB',
-            'ทหารไทยธนชาต': 'TTB', 'เกียรตินาคินภัทร': 'KKP', 'ธนชาต': 'Thanachart',
-            'ทิสโก้': 'TISCO', 'ไอซีบีซี (ไทย)': 'ICBC', 'ซีไอเอ็มบี ไทย': 'CIMB'
-        }
-        
-        file_bank_name = bank_short
-        for thai_name, eng_name in bank_name_map.items():
-            if thai_name in bank_short:
-                file_bank_name = eng_name
-                break
-        
-        date_str_month = datetime.now().strftime("%Y%m") 
-        filename = f"{file_bank_name}_{date_str_month}.csv"
-        os.makedirs('output', exist_ok=True)
-        output_path = os.path.join('output', filename)
-        
-        source_url = data[0].get('Source_URL', 'URL ไม่ระบุ') if data else "URL ไม่ระบุ"
     
-        footer_row = {col: "" for col in column_order_save}
-        footer_row['BUSI_DT'] = 'Source_URL:'
-        footer_row['Eng_Prefix'] = source_url
-        
-        df_footer = pd.DataFrame([footer_row])
-        
-        # 4. รวมข้อมูล (Data + Footer) และเลือกเฉพาะคอลัมน์ที่กำหนด
-        df_final = pd.concat([df[column_order_save], df_footer], ignore_index=True)
+    saved_paths = []
+    for sink in get_sinks(backends or OUTPUT_BACKENDS):
+        try:
+            output_path = sink.write(data, bank_name, busi_dt)
+            if output_path:
+                saved_paths.append(f"{sink.name}: {output_path}")   # sqlite / people ใช้ไฟล์เดียวกัน
+        except Exception as e:
+            logger.exception(" ---- Error saving %s output: %s ----", sink.name, e)
+    
+    if not saved_paths:
+        return False
+    
+    progress_log.info(" ---- RESULTS FOR %s: %s Executives saved to %s ---- ", bank_name, len(data), ", ".join(saved_paths))
+    
+    return True
+
+
+def verify_and_recover(scraper: FlexibleBankScraper, checker, records: List[Dict],
+                       html_content: str) -> Tuple[List[Dict], str, int]:
+    """
+    ตรวจ records กับ source (ภายใน) และ LLM แล้วเพิ่มชื่อที่ LLM พบว่าหายไป (checker=None: ข้าม LLM)
+    Returns:
+        (final_data, llm_status, จำนวน record ที่กู้คืนได้)
+    """
+    # [VERIFICATION STEP 1] Internal Content Check
+    verified_executives = scraper.check_scraped_data_against_source(records, html_content)
+    
+    progress_log.info(" After internal verification: %s executives", len(verified_executives))
+    
+    if checker is None:
+        progress_log.info(" ---- LLM verification skipped ---- ")
+        return verified_executives, "UNVERIFIED", 0
+    
+    # [VERIFICATION STEP 2] LLM Verification
+    llm_result = checker.verify(verified_executives, html_content, scraper.bank_name)
+    
+    # ตัวแปรสำหรับเก็บข้อมูลสุดท้าย
+    final_data = ExecutiveBatch(verified_executives)
+    known_names = {r['Full_Name'] for r in final_data}
+    recovery_attempted = False
+    
+    if llm_result.get('is_complete', False):
+        progress_log.info(" ---- VERIFICATION SUCCESS: Data is COMPLETE and correct! ---- ")
         
-        df_final.to_csv(output_path, index=False, encoding='utf-8-sig', quoting=csv.QUOTE_ALL)
+    elif llm_result.get('error'):
+        logger.warning(" ---- VERIFICATION FAILED (API Error): %s - proceeding without LLM recovery ----",
+                       llm_result['error'])
         
-        print("\n" + "="*120)
-        print(f" ---- RESULTS FOR {bank_name} ---- ")
-        print(f" ---- Saved to: {output_path} ---- ")
-        print(f" ---- Total: {len(df)} Executives ---- ")
-        print("="*120)
+    else:
+        missing = llm_result.get('missing_names', [])
+        extra = llm_result.get('extra_names', [])
         
-        return True
+        # Auto-Recovery Missing Data
+        if missing:
+            progress_log.info("  INCOMPLETE: Found %s missing name(s)", len(missing))
+            
+            recovery_attempted = True
+            recovered_count = 0
+            
+            for missing_entry in missing:
+                if isinstance(missing_entry, dict):
+                    full_name = missing_entry.get('full_name', '')
+                    position = missing_entry.get('position', '')
+                    confidence = missing_entry.get('confidence', 0.0)
+                    
+                    progress_log.info(" RECOVERING: %s | %s | confidence %.0f%%", full_name, position, confidence * 100)
+                    
+                    # สร้าง record ใหม่สำหรับชื่อที่หายไป
+                    recovered_record = scraper._create_record_from_llm_data(
+                        full_name, 
+                        position, 
+                        confidence
+                    )
+                    
+                    if recovered_record:
+                        is_duplicate = recovered_record.Full_Name in known_names
+                        
+                        if not is_duplicate:
+                            final_data.append(recovered_record)
+                            known_names.add(recovered_record.Full_Name)
+                            recovered_count += 1
+                            progress_log.info(" ---- RECOVERED and ADDED to dataset ---- ")
+                        else:
+                            progress_log.info(" ---- SKIPPED: Duplicate entry detected ----")
+                    else:
+                        logger.warning(" ---- FAILED: Could not parse name components of %s ---- ", full_name)
+                else:
+                    # Old format (string only)
+                    progress_log.info(" ---- Missing name: %s ----", missing_entry)
+            
+            progress_log.info(" Recovery Summary: %s/%s entries recovered, final dataset: %s executives",
+                        recovered_count, len(missing), len(final_data))
         
-    except Exception as e:
-        logging.error(f" ---- Error saving CSV: {e} ----")
-        traceback.print_exc()
-        return False
+        if extra:
+            logger.warning(" FALSE POSITIVES: Found %s extra name(s), consider reviewing them manually: %s",
+                           len(extra), ", ".join(map(str, extra)))
+    
+    status_msg = "COMPLETE" if llm_result.get('is_complete') else "RECOVERED" if recovery_attempted else "INCOMPLETE"
+    recovered = len(final_data) - len(verified_executives) if recovery_attempted else 0
+    return final_data, status_msg, recovered
 
 
-def main():
-    """Main execution - รองรับ Multi-URL พร้อม Auto-Recovery ของข้อมูลที่หายไป (v6.0)"""
-    print("="*120)
-    print(" BANK EXECUTIVE SCRAPER with Auto-Recovery Missing Data ")
-    print("="*120)
-    print("="*120 + "\n")
+def process_queue(busi_dt: str, queue_path: str = JOB_QUEUE_PATH, snapshots: Optional[Dict[str, str]] = None,
+                  backends: Optional[List[str]] = None, verify: bool = True, worker_id: Optional[str] = None,
+                  archive_dir: Optional[str] = SNAPSHOT_DIR, replay_dir: Optional[str] = None,
+                  ollama_url: str = OLLAMA_API_URL, urls: Optional[List[str]] = None):
+    """
+    Worker: ทำงาน URL ที่ยังค้างในคิวของวันทำการจนหมด (หลาย process เรียกพร้อมกันบนคิวเดียวกันได้)
+    Args:
+        urls: ทำเฉพาะ URL เหล่านี้ที่ยังค้างในคิว (None = ทุก URL ที่ค้างในคิวของวันทำการ)
+        snapshots: url -> path ของ HTML ที่บันทึกไว้ (ใช้แทนการโหลดหน้าด้วย browser)
+        backends: output backend (None = OUTPUT_BACKENDS)
+        verify: False = ข้ามการตรวจด้วย LLM
+        archive_dir: คลัง snapshot ที่เก็บทุกหน้าที่โหลดด้วย browser รวมหน้าที่ใช้ไม่ได้ พร้อม status (None = ไม่เก็บ)
+        replay_dir: คลัง snapshot ที่ใช้แทน browser (หน้าล่าสุดของ URL ที่โหลดไม่เกินวันทำการ)
+        ollama_url: endpoint /api/generate ที่ Verifier ใช้ (เช่น ollama_stub ตอน benchmark)
+    """
+    snapshots = snapshots or {}
+    checker = Verifier(ollama_url=ollama_url, model=OLLAMA_MODEL) if verify else None
+    queue = JobQueue(queue_path, worker_id=worker_id)
+    archive = SnapshotStore(archive_dir) if archive_dir else None
+    replay = SnapshotStore(replay_dir) if replay_dir else None
+    replay_until = (datetime.strptime(busi_dt, "%Y-%m-%d") + timedelta(days=1)).timestamp() if replay else None
     
-    checker = Verifier() 
-    urls = [
-        "https://www.kasikornbank.com/th/about/Pages/executives.aspx",
-        # "https://www.scbx.com/th/executive-scbx/about-board-of-directors/",
-        # "https://www.krungsri.com/th/about-krungsri/about-us/organization-chart/board-of-directors"
-    ]
+    # retry / backoff ทำที่ระดับ scheduler แยกตาม domain (แต่ละรอบโหลดหน้าแค่ครั้งเดียว)
+    pending = queue.pending_urls(busi_dt)
+    if urls is not None:
+        # คิวใช้ร่วมกันหลายรอบ/หลายคำสั่ง: ไม่หยิบ URL ค้างของคำสั่งอื่นมาทำด้วย
+        pending = set(pending)
+        pending = [url for url in dict.fromkeys(urls) if url in pending]
+    scheduler = FetchScheduler(pending)
+    # Chrome ตัวเดียวใช้ทุก URL (เปิด tab ใหม่ต่อธนาคาร) - เปิดจริงเมื่อต้องโหลดหน้าเท่านั้น
+    session = BrowserSession()
     
-    print(f" ---- URLs to scrape: {urls} ----- ")
-    for i, url in enumerate(urls, 1):
-        print(f"  {i}. {url}")
-    print()
-    
-    all_results = []
-    all_executives_data = []
-    
-    for url in urls:
-        print(f"\n{'='*120}")
-        print(f" Processing: {url}")
-        print(f"{'='*120}\n")
+    for url in scheduler:
+        job = queue.claim(url, busi_dt)
+        if job is None:
+            logger.info(" ---- Skipping %s: already finished, claimed or backing off in another worker ---- ", url)
+            continue
+        
+        progress_log.info(" ==== Processing: %s%s ==== ", url, f" (resuming after '{job.stage}')" if job.stage else "")
         
         scraper = None
         
         try:
-            scraper = FlexibleBankScraper(url)
+            scraper = FlexibleBankScraper(url, session=session, keep_raw_page=archive is not None)
+            scraper.busi_dt = busi_dt
             
-            print(f" Target URL: {url}")
-            print(f" Date: {scraper.busi_dt}")
+            progress_log.info(" Target URL: %s | Date: %s", url, scraper.busi_dt)
             
-            html_content = scraper.fetch_page_content(url)
-            if not html_content:
-                print(f"\n ---- FAILED: Could not fetch HTML content for {url} ---- ")
-                continue
+            # ----- Stage 1: fetched -----
+            archived = replay.latest(url, before=replay_until) if replay and not job.reached('fetched') else None
+            if job.reached('fetched'):
+                html_content = queue.load(job, 'fetched')['html']
+            elif archived is not None:
+                progress_log.info(" ---- Replaying snapshot %s fetched %s ---- ", archived.content_hash[:12], archived.fetched)
+                html_content = replay.read(archived)
+                job = queue.checkpoint(job, 'fetched', {'html': html_content})
+            elif url in snapshots:
+                with open(snapshots[url], encoding='utf-8', errors='replace') as f:
+                    html_content = f.read()
+                page_check = classify_page(html_content)
+                if not page_check.ok:
+                    logger.warning(" ---- FAILED: Snapshot %s is not usable (%s - %s) ---- ",
+                                   snapshots[url], page_check.status.value, page_check.reason)
+                    queue.fail(job, f"{page_check.status.value}: {page_check.reason}")
+                    continue
+                job = queue.checkpoint(job, 'fetched', {'html': html_content})
+            else:
+                html_content = scraper.fetch_page_content(url, retries=1)
+                if not html_content:
+                    reason = f"{scraper.page_check.status.value} - {scraper.page_check.reason}" if scraper.page_check else "fetch error"
+                    logger.warning(" ---- FAILED: Could not fetch HTML content for %s (%s) ---- ", url, reason)
+                    if archive is not None and scraper.raw_page:
+                        # หน้า block / captcha / หน้าว่าง ก็เก็บ (status ใน index บอกว่าใช้ไม่ได้ replay จึงไม่หยิบไปใช้)
+                        archive.put(url, scraper.raw_page, scraper.page_check.status if scraper.page_check else None)
+                    scheduler.record_failure(url, scraper.page_check)
+                    if url in scheduler.failed:
+                        queue.fail(job, scheduler.failed[url])
+                    else:
+                        # worker อื่นต้องรอ backoff / cooldown เดียวกันก่อนหยิบ URL นี้ไปทำ
+                        queue.release(job, delay=scheduler.retry_delay(url))
+                    continue
+                scheduler.record_success(url)
+                if archive is not None:
+                    # page_source ทั้งหน้า (html_content อาจเป็นโครงร่างจาก dom_capture) replay จึงได้หน้าเดียวกับที่ browser เห็น
+                    archive.put(url, scraper.raw_page or html_content,
+                                scraper.page_check.status if scraper.page_check else None)
+                job = queue.checkpoint(job, 'fetched', {'html': html_content})
 
             scraper.bank_name = scraper.detect_bank_name(url, html_content)
-            print(f" ---- Initial bank detection: {scraper.bank_name}\n ---- ")
-            
-            executives = scraper.extract_executives_from_html(html_content)
+            progress_log.info(" ---- Initial bank detection: %s ---- ", scraper.bank_name)
             
-            if executives:
-                print(f"\n Final detected bank: {scraper.bank_name}")
-                
+            # ----- Stage 2: extracted -----
+            if job.reached('extracted'):
+                records = ExecutiveBatch.of(queue.load(job, 'extracted')['records'])
+            else:
+                executives = scraper.extract_executives_from_html(html_content)
+                if not executives:
+                    logger.warning("  FAILED: No executives found for %s", url)
+                    queue.fail(job, "no executives found")
+                    continue
                 records = scraper.create_executive_records(executives)
-                
-                # [VERIFICATION STEP 1] Internal Content Check
-                verified_executives = scraper.check_scraped_data_against_source(records)
-                
-                print(f"\n After internal verification: {len(verified_executives)} executives")
-                
-                # [VERIFICATION STEP 2] LLM Verification
-                llm_result = checker.verify(verified_executives, html_content, scraper.bank_name)
-                
-                print("\n" + "="*80)
-                print("LLM VERIFICATION RESULTS")
-                print("="*80)
-                
-                # ตัวแปรสำหรับเก็บข้อมูลสุดท้าย
-                final_data = verified_executives.copy()
-                recovery_attempted = False
-                
-                if llm_result.get('is_complete', False):
-                    print(f" ---- VERIFICATION SUCCESS: Data is COMPLETE and correct! ---- ")
-                    
-                elif llm_result.get('error'):
-                    print(f" ---- VERIFICATION FAILED (API Error): {llm_result['error']} ----")
-                    print(f" ---- Proceeding with scraped data without LLM recovery ---- ")
-                    
-                else:
-                    missing = llm_result.get('missing_names', [])
-                    extra = llm_result.get('extra_names', [])
-                    
-                    # Auto-Recovery Missing Data
-                    if missing:
-                        print(f"\n  INCOMPLETE: Found {len(missing)} missing name(s)")
-                        print("="*80)
-                        
-                        recovery_attempted = True
-                        recovered_count = 0
-                        
-                        for missing_entry in missing:
-                            if isinstance(missing_entry, dict):
-                                full_name = missing_entry.get('full_name', '')
-                                position = missing_entry.get('position', '')
-                                confidence = missing_entry.get('confidence', 0.0)
-                                
-                                print(f"\n RECOVERING: {full_name}")
-                                print(f"   Position: {position}")
-                                print(f"   Confidence: {confidence:.2%}")
-                                
-                                # สร้าง record ใหม่สำหรับชื่อที่หายไป
-                                recovered_record = scraper._create_record_from_llm_data(
-                                    full_name, 
-                                    position, 
-                                    confidence
-                                )
-                                
-                                if recovered_record:
-                                    is_duplicate = any(
-                                        r['Full_Name'] == recovered_record['Full_Name'] 
-                                        for r in final_data
-                                    )
-                                    
-                                    if not is_duplicate:
-                                        final_data.append(recovered_record)
-                                        recovered_count += 1
-                                        print(f" ---- RECOVERED and ADDED to dataset ---- ")
-                                    else:
-                                        print(f" ---- SKIPPED: Duplicate entry detected ----")
-                                else:
-                                    print(f" ---- FAILED: Could not parse name components ---- ")
-                            else:
-                                # Old format (string only)
-                                print(f" ---- Missing name: {missing_entry} ----")
-                        
-                        print(f"\n{'='*80}")
-                        print(f" Recovery Summary: {recovered_count}/{len(missing)} entries recovered")
-                        print(f" Final dataset: {len(final_data)} executives")
-                        print(f"{'='*80}")
-                    
-                    if extra:
-                        print(f"\n FALSE POSITIVES: Found {len(extra)} extra name(s):")
-                        for name in extra:
-                            print(f"   - {name}")
-                        print(f"\n Consider reviewing these entries manually")
-                
-                print("="*80)
+                job = queue.checkpoint(job, 'extracted', {'records': ExecutiveBatch.of(records).to_table()})
+            
+            progress_log.info(" Final detected bank: %s", scraper.bank_name)
+            
+            # ----- Stage 3: verified -----
+            if job.reached('verified'):
+                verified = queue.load(job, 'verified')
+                final_data, status_msg, recovered = ExecutiveBatch.of(verified['records']), verified['llm_status'], verified['recovered']
+            else:
+                final_data, status_msg, recovered = verify_and_recover(scraper, checker, records, html_content)
+                job = queue.checkpoint(job, 'verified', {
+                    'records': ExecutiveBatch.of(final_data).to_table(), 'llm_status': status_msg, 'recovered': recovered,
+                })
 
-                if final_data:
-                    all_executives_data.extend(final_data)
-                    
-                    # เรียงลำดับใหม่หลังจากเพิ่มข้อมูล
-                    final_data_sorted = scraper._sort_executive_records(final_data)
-                    
-                    if save_to_csv(final_data_sorted, scraper.bank_name, scraper.busi_dt):
-                        status_msg = "COMPLETE" if llm_result.get('is_complete') else "RECOVERED" if recovery_attempted else "INCOMPLETE"
-                        print(f"\n SUCCESS: Saved {len(final_data_sorted)} executives from {scraper.bank_name} (Status: {status_msg})")
-                        
-                        all_results.append({
-                            'bank': scraper.bank_name,
-                            'count': len(final_data_sorted),
-                            'url': url,
-                            'llm_status': status_msg,
-                            'recovered': len(final_data_sorted) - len(verified_executives) if recovery_attempted else 0
-                        })
-                    else:
-                        print(f"\n  WARNING: Data extracted but failed to save CSV")
-                else:
-                    print(f"\n FAILED: No executives passed verification for {url}")
+            if not final_data:
+                logger.warning(" FAILED: No executives passed verification for %s", url)
+                queue.fail(job, "no executives passed verification")
+                continue
+            
+            # ----- Stage 4: saved -----
+            # เรียงลำดับใหม่หลังจากเพิ่มข้อมูล (ทุก backend เขียนทับ/แทนที่ของเดิม รันซ้ำได้)
+            final_data_sorted = scraper._sort_executive_records(final_data)
+            
+            if save_records(final_data_sorted, scraper.bank_name, scraper.busi_dt, backends):
+                logger.info(" SUCCESS: Saved %s executives from %s (Status: %s)",
+                            len(final_data_sorted), scraper.bank_name, status_msg)
+                job = queue.checkpoint(job, 'saved', {
+                    'bank': scraper.bank_name,
+                    'count': len(final_data_sorted),
+                    'url': url,
+                    'llm_status': status_msg,
+                    'recovered': recovered,
+                })
+                queue.complete(job)
             else:
-                print(f"\n  FAILED: No executives found for {url}")
+                logger.warning("  WARNING: Data extracted but failed to save output")
+                queue.fail(job, "failed to save output")
             
         except KeyboardInterrupt:
-            print("\n $ Interrupted by user $ ")
+            logger.warning(" ---- Interrupted by user, %s keeps its last checkpoint ---- ", url)
+            # เก็บ checkpoint ไว้ รันใหม่จะทำต่อจาก stage ล่าสุด
+            queue.release(job)
             break
         except Exception as e:
-            logging.error(f" ---- Error processing {url}: {e} ---- ")
-            import traceback
-            traceback.print_exc()
+            logger.exception(" ---- Error processing %s: %s ---- ", url, e)
+            queue.fail(job, f"error: {e}")
         finally:
             if scraper:
                 try:
@@ -1060,6 +1285,28 @@ def main():
                 except:
                     pass
     
+    # URL ที่ scheduler เลิกลองเองโดยไม่ได้ส่งออกมา (domain หมด error budget) ยังค้างเป็น pending ในคิว
+    # บันทึกเป็น failed ให้ขึ้นใน print_summary (job ที่ fail / เสร็จไปแล้ว หรือ worker อื่นถืออยู่ claim ไม่ได้)
+    for url, reason in scheduler.failed.items():
+        job = queue.claim(url, busi_dt)
+        if job is not None:
+            logger.warning(" ---- FAILED: Gave up on %s (%s) ---- ", url, reason)
+            queue.fail(job, reason)
+    
+    session.close()
+    queue.close()
+    for store in (archive, replay):
+        if store is not None:
+            store.close()
+    if checker is not None and hasattr(checker, 'cascade_summary'):
+        logger.info(" ---- LLM verification tiers ----\n%s", checker.cascade_summary())
+
+
+def print_summary(busi_dt: str, queue_path: str = JOB_QUEUE_PATH):
+    with JobQueue(queue_path) as queue:
+        all_results = queue.results(busi_dt)
+        failures = queue.failures(busi_dt)
+    
     print("\n" + "="*120)
     print(" SCRAPING SUMMARY")
     print("="*120)
@@ -1074,11 +1321,46 @@ def main():
     else:
         print("\n No banks were successfully scraped")
     
+    if failures:
+        print(f"\n Gave up on {len(failures)} URL(s) (re-run to retry):\n")
+        for url, reason in failures.items():
+            print(f"  - {url} ({reason})")
+    
     print("="*120)
     print("\n TIP: Check the 'output' folder for generated CSV files")
     print(" TIP: v6.0 automatically recovers missing executives with high confidence (>= 0.85)")
     print("="*120 + "\n")
 
 
+def main():
+    """Main execution - รองรับ Multi-URL พร้อม Auto-Recovery ของข้อมูลที่หายไป (v6.0)"""
+    print("="*120)
+    print(" BANK EXECUTIVE SCRAPER with Auto-Recovery Missing Data ")
+    print("="*120)
+    print("="*120 + "\n")
+    
+    # ใช้ cli.py เพื่อส่ง URL จากไฟล์ / snapshot / หลาย worker
+    urls = [
+        "https://www.kasikornbank.com/th/about/Pages/executives.aspx",
+        # "https://www.scbx.com/th/executive-scbx/about-board-of-directors/",
+        # "https://www.krungsri.com/th/about-krungsri/about-us/organization-chart/board-of-directors"
+    ]
+    
+    print(f" ---- URLs to scrape: {urls} ----- ")
+    for i, url in enumerate(urls, 1):
+        print(f"  {i}. {url}")
+    print()
+    
+    # คิวงานถาวร: รันซ้ำวันเดิมจะทำต่อจาก stage ล่าสุด (fetched / extracted / verified / saved) ของแต่ละ URL
+    busi_dt = datetime.now().strftime("%Y-%m-%d")
+    with JobQueue() as queue:
+        pending = queue.enqueue(urls, busi_dt)
+    if pending < len(urls):
+        print(f" ---- {len(urls) - pending} URL(s) already processed for {busi_dt}, {pending} remaining ---- \n")
+    
+    process_queue(busi_dt, urls=urls)
+    print_summary(busi_dt)
+
+
 if __name__ == "__main__":
     main()
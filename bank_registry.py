@@ -0,0 +1,155 @@
+import re
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class BankInfo(NamedTuple):
+    name: str                   # ชื่อเต็มภาษาไทย (ใช้ใน Bank_Name)
+    file_name: str              # ชื่อภาษาอังกฤษที่ใช้ตั้งชื่อไฟล์ output
+    domains: Tuple[str, ...]    # domain ของธนาคาร (match แบบ suffix)
+
+
+# --- REGISTRY ---
+# แหล่งข้อมูลเดียวของธนาคารที่รองรับ ใช้ทั้งการตรวจจับธนาคารและการตั้งชื่อไฟล์
+BANKS = (
+    BankInfo('ธนาคารกรุงเทพ', 'Bangkok', ('bangkokbank.com',)),
+    BankInfo('ธนาคารกสิกรไทย', 'Kbank', ('kasikornbank.com', 'kbank.co.th')),
+    BankInfo('ธนาคารไทยพาณิชย์', 'SCB', ('scb.co.th', 'scbx.com')),
+    BankInfo('ธนาคารกรุงไทย', 'Krungthai', ('krungthai.com', 'ktb.co.th')),
+    BankInfo('ธนาคารกรุงศรีอยุธยา', 'Krungsri', ('krungsri.com',)),
+    BankInfo('ธนาคารออมสิน', 'GSB', ('gsb.or.th',)),
+    BankInfo('ธนาคารทหารไทยธนชาต', 'TTB', ('ttbbank.com',)),
+    BankInfo('ธนาคารเกียรตินาคินภัทร', 'KKP', ('kkpfg.com', 'kiatnakinphatra.com')),
+    BankInfo('ธนาคารธนชาต', 'Thanachart', ('thanachartbank.co.th',)),
+    BankInfo('ธนาคารทิสโก้', 'TISCO', ('tisco.co.th',)),
+    BankInfo('ธนาคารไอซีบีซี (ไทย)', 'ICBC', ('icbcthai.com',)),
+    BankInfo('ธนาคารซีไอเอ็มบี ไทย', 'CIMB', ('cimbthai.com',)),
+)
+
+# keyword ใน URL / title / meta (ตัวพิมพ์เล็ก) เรียงตามลำดับความสำคัญ
+URL_KEYWORDS = (
+    ('bangkokbank', 'ธนาคารกรุงเทพ'),
+    ('bbl', 'ธนาคารกรุงเทพ'),
+    ('kasikorn', 'ธนาคารกสิกรไทย'),
+    ('kbank', 'ธนาคารกสิกรไทย'),
+    ('kasikornbank', 'ธนาคารกสิกรไทย'),
+    ('scb', 'ธนาคารไทยพาณิชย์'),
+    ('siamcommercial', 'ธนาคารไทยพาณิชย์'),
+    ('ktb', 'ธนาคารกรุงไทย'),
+    ('krungthai', 'ธนาคารกรุงไทย'),
+    ('krungsri', 'ธนาคารกรุงศรีอยุธยา'),
+    ('ttb', 'ธนาคารทหารไทยธนชาต'),
+    ('tmbthanachart', 'ธนาคารทหารไทยธนชาต'),
+    ('kiatnakin', 'ธนาคารเกียรตินาคินภัทร'),
+    ('kkp', 'ธนาคารเกียรตินาคินภัทร'),
+    ('thanachart', 'ธนาคารธนชาต'),
+    ('tisco', 'ธนาคารทิสโก้'),
+    ('icbc', 'ธนาคารไอซีบีซี (ไทย)'),
+    ('cimb', 'ธนาคารซีไอเอ็มบี ไทย'),
+)
+
+# ชื่อธนาคารที่ปรากฏในเนื้อหาหน้าเว็บ เรียงตามลำดับความสำคัญ
+TEXT_ALIASES = (
+    ('ธนาคารกรุงเทพ', 'ธนาคารกรุงเทพ'),
+    ('กรุงเทพ', 'ธนาคารกรุงเทพ'),
+    ('Bangkok Bank', 'ธนาคารกรุงเทพ'),
+    ('ธนาคารกสิกรไทย', 'ธนาคารกสิกรไทย'),
+    ('กสิกรไทย', 'ธนาคารกสิกรไทย'),
+    ('Kasikornbank', 'ธนาคารกสิกรไทย'),
+    ('ธนาคารไทยพาณิชย์', 'ธนาคารไทยพาณิชย์'),
+    ('ไทยพาณิชย์', 'ธนาคารไทยพาณิชย์'),
+    ('ธนาคารกรุงไทย', 'ธนาคารกรุงไทย'),
+    ('กรุงไทย', 'ธนาคารกรุงไทย'),
+    ('ธนาคารออมสิน', 'ธนาคารออมสิน'),
+    ('ออมสิน', 'ธนาคารออมสิน'),
+    ('gsb', 'ธนาคารออมสิน'),
+    ('ธนาคารกรุงศรีอยุธยา', 'ธนาคารกรุงศรีอยุธยา'),
+    ('กรุงศรีอยุธยา', 'ธนาคารกรุงศรีอยุธยา'),
+)
+
+
+# --- PRECOMPUTED INDEXES ---
+BANKS_BY_NAME: Dict[str, BankInfo] = {bank.name: bank for bank in BANKS}
+DOMAIN_INDEX: Dict[str, BankInfo] = {domain: bank for bank in BANKS for domain in bank.domains}
+
+
+class _MultiMatcher:
+    """
+    รวม keyword ทั้งหมดเป็น regex เดียว แล้วหา keyword ที่มีลำดับความสำคัญสูงสุดในการอ่านข้อความรอบเดียว
+    (ให้ผลเหมือนการวนเช็ค keyword ทีละตัวตามลำดับ)
+    """
+    def __init__(self, entries: Tuple[Tuple[str, str], ...]):
+        self.priority = {keyword: i for i, (keyword, _) in enumerate(entries)}
+        self.banks = dict(entries)
+        # keyword ที่ยาวกว่าต้องมาก่อน เพื่อไม่ให้ keyword สั้นที่เป็นส่วนหนึ่งของมันกินข้อความไปก่อน
+        alternation = '|'.join(re.escape(k) for k in sorted(self.priority, key=len, reverse=True))
+        self.pattern = re.compile(alternation)
+
+    def search(self, text: str) -> Optional[Tuple[str, str]]:
+        """คืนค่า (keyword, bank_name) ที่มีลำดับความสำคัญสูงสุดที่พบใน text"""
+        best = None
+        for match in self.pattern.finditer(text):
+            keyword = match.group(0)
+            if best is None or self.priority[keyword] < self.priority[best]:
+                best = keyword
+                if self.priority[best] == 0:
+                    break
+        return (best, self.banks[best]) if best else None
+
+
+KEYWORD_MATCHER = _MultiMatcher(URL_KEYWORDS)
+TEXT_ALIAS_MATCHER = _MultiMatcher(TEXT_ALIASES)
+
+
+def registered_domain(host: str) -> Optional[str]:
+    """หา domain ใน registry ที่ตรงกับ hostname (เช่น www.kasikornbank.com -> kasikornbank.com)"""
+    labels = host.lower().rstrip('.').split('.')
+    for i in range(len(labels) - 1):
+        domain = '.'.join(labels[i:])
+        if domain in DOMAIN_INDEX:
+            return domain
+    return None
+
+
+def bank_from_url(url: str) -> Optional[BankInfo]:
+    """หาธนาคารจาก hostname ของ URL ด้วย domain-suffix lookup"""
+    domain = registered_domain(urlparse(url).hostname or '')
+    return DOMAIN_INDEX[domain] if domain else None
+
+
+def file_bank_name(bank_name: str) -> str:
+    """คืนค่าชื่อธนาคารภาษาอังกฤษสำหรับตั้งชื่อไฟล์ (ถ้าไม่รู้จัก ใช้ชื่อไทยที่ตัดคำว่า ธนาคาร ออก)"""
+    bank = BANKS_BY_NAME.get(bank_name.strip())
+    if bank:
+        return bank.file_name
+
+    bank_short = bank_name.replace('ธนาคาร', '').strip()
+    for known in BANKS:
+        if known.name.replace('ธนาคาร', '') in bank_short:
+            return known.file_name
+    return bank_short
+
+
+def find_bank(query: str) -> Optional[BankInfo]:
+    """
+    หาธนาคารจากข้อความสั้นๆ ที่ผู้ใช้พิมพ์: URL, domain, ชื่อไทย, ชื่อไฟล์ หรือ keyword
+    เช่น 'https://www.scb.co.th/', 'ktb.co.th', 'ธนาคารกรุงเทพ', 'Kbank', 'kasikorn', 'ออมสิน'
+    """
+    text = query.strip()
+    if '://' in text:
+        return bank_from_url(text)
+    domain = registered_domain(text.split('/', 1)[0])
+    if domain:
+        return DOMAIN_INDEX[domain]
+    if text in BANKS_BY_NAME:
+        return BANKS_BY_NAME[text]
+    for bank in BANKS:
+        if bank.file_name.lower() == text.lower():
+            return bank
+    match = KEYWORD_MATCHER.search(text.lower()) or TEXT_ALIAS_MATCHER.search(text)
+    return BANKS_BY_NAME[match[1]] if match else None
+
+
+def homepage_url(bank: BankInfo) -> str:
+    """หน้าแรกของธนาคาร (domain แรกใน registry) - จุดเริ่มของ executive_crawler"""
+    return f"https://www.{bank.domains[0]}/"
@@ -0,0 +1,68 @@
+"""
+วัด executive_crawler กับเว็บจำลอง (benchmarks/fixture_site.py): เริ่มจากหน้าแรกของแต่ละธนาคารแล้วดูว่า
+หน้า executives อยู่อันดับแรกหรือไม่ ใช้ request ไปเท่าไรจาก budget และไม่แตะหน้าที่ robots.txt ห้าม
+
+    python benchmarks/crawler_mirror.py
+    python benchmarks/crawler_mirror.py --banks 4 --budget 20 --delay 0.05 --no-sitemap
+
+site pages = จำนวนหน้าทั้งหมดในเว็บย่อยของธนาคาร (สิ่งที่ต้องโหลดถ้าไล่ทุกลิงก์โดยไม่ให้คะแนน)
+"""
+import os
+import sys
+import time
+import argparse
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from executive_crawler import FocusedCrawler  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Focused crawler against the local fixture mirror")
+    parser.add_argument('--banks', type=int, default=2, help="banks per fixture variant")
+    parser.add_argument('--budget', type=int, default=40, help="requests per bank")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--per-host', type=int, default=8, help="the mirror serves every bank from one host")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds between requests to the host")
+    parser.add_argument('--slow-seconds', type=float, default=2.0)
+    parser.add_argument('--no-sitemap', action='store_true')
+    args = parser.parse_args(argv)
+
+    with FixtureSite(args.banks, slow_seconds=args.slow_seconds, sitemap=not args.no_sitemap) as site:
+        crawler = FocusedCrawler(budget=args.budget, concurrency=args.concurrency, per_host=args.per_host,
+                                 delay=args.delay, use_sitemaps=not args.no_sitemap)
+        start = time.perf_counter()
+        reports = crawler.crawl([target.home for target in site.targets])
+        elapsed = time.perf_counter() - start
+
+        print(f"{len(site.targets)} banks, budget {args.budget} requests each, "
+              f"sitemap {'off' if args.no_sitemap else 'on'}\n")
+        print(f"{'variant':<9}{'bank':<12}{'result':<12}{'requests':>9}{'pages':>7}{'site pages':>12}{'robots':>8}")
+        hits = 0
+        expected = 0
+        for target, report in zip(site.targets, reports):
+            prefix = target.home[len(site.base_url):]
+            site_pages = sum(1 for path in list(site.site) + list(site.pages) if path.startswith(prefix))
+            top = report.candidates[0].url if report.candidates else None
+            if target.roster is None:
+                result = "none (ok)" if top is None else "FALSE HIT"
+            else:
+                expected += 1
+                hits += top == target.url
+                result = "rank 1" if top == target.url else ("missed" if top is None else "wrong page")
+            print(f"{target.variant:<9}{target.bank:<12}{result:<12}{report.requests:>9}{report.pages:>7}"
+                  f"{site_pages:>12}{report.disallowed:>8}")
+
+        private = sorted(path for path in site.hits if '/private/' in path)
+        print(f"\nexecutive page ranked first: {hits}/{expected}")
+        print(f"requests served: {site.requests} ({site.requests / len(site.targets):.1f} per bank), "
+              f"{elapsed:.2f}s wall")
+        print(f"robots.txt-disallowed pages fetched: {len(private)}" + (f" {private}" if private else ""))
+    return 0 if hits == expected and not private else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""
+Benchmark ทั้ง pipeline (fetch -> extract -> verify -> save) กับเว็บจำลองในเครื่อง (fixture_site) และ ollama_stub
+
+    python benchmarks/e2e_pipeline.py                          # Chrome จริง, 2 ธนาคารต่อ variant
+    python benchmarks/e2e_pipeline.py --banks 4 --workers 2
+    python benchmarks/e2e_pipeline.py --fetch http             # ไม่มี Chrome: โหลด HTML ดิบแล้วส่งเป็น snapshot
+    python benchmarks/e2e_pipeline.py --with-rules             # ให้ tier 'rules' ของ Verifier ตัดสินก่อน LLM
+
+รัน process_queue ตัวจริง (คิว / checkpoint / Verifier cascade / CSV) ใน directory ชั่วคราว แล้วรายงาน
+URLs/นาที, เวลาของแต่ละ stage (p50 / p95), peak RSS (python + worker + Chrome ถ้ามี psutil)
+และ recall / precision ของรายชื่อเทียบกับ roster ที่รู้คำตอบ แยกตามชนิดหน้า
+roster ของ fixture ถูก extract ครบ tier 'rules' ของ Verifier จึงตัดสินเองทุกหน้า ค่าเริ่มต้นจึงตัด tier 'rules'
+ออก (ทุก roster ผ่าน LLM tier กับ stub) ใช้ --with-rules เพื่อรัน cascade เต็มแบบ production
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import functools
+import threading
+import contextlib
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from executive_record import ExecutiveBatch  # noqa: E402
+from fixture_site import VARIANTS, FixtureSite, FixtureTarget  # noqa: E402
+from job_queue import Job, JobQueue  # noqa: E402
+from ollama_stub import OllamaStub  # noqa: E402
+from people_index import person_key  # noqa: E402
+
+STAGES = ('fetch', 'extract', 'verify', 'save')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank percentile"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class RssSampler:
+    """peak RSS รวมของ process นี้และ process ลูกทั้งหมด (worker, chromedriver, Chrome) - ต้องมี psutil"""
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+        try:
+            import psutil
+            self._process = psutil.Process()
+        except ImportError:
+            self._process = None
+
+    def _sample(self):
+        processes = [self._process] + self._process.children(recursive=True)
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except Exception:
+                pass    # process จบไประหว่างอ่าน
+        self.peak = max(self.peak, total)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> 'RssSampler':
+        if self._process is not None:
+            self._sample()
+            self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def describe(self) -> str:
+        if self._process is not None:
+            return f"{self.peak / 2 ** 20:.0f} MB (all processes incl. Chrome, psutil)"
+        try:
+            import resource
+        except ImportError:
+            return "n/a (pip install psutil)"
+        # ไม่มี psutil: ru_maxrss ของ process นี้ + process ลูกที่ใหญ่ที่สุดที่จบแล้ว (KB บน Linux)
+        scale = 1 if sys.platform == 'darwin' else 1024
+        own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+        return f"{(own + child) / 2 ** 20:.0f} MB (self + largest finished child only; pip install psutil)"
+
+
+def install_stage_timers(timings: Dict[str, List[float]]):
+    """ครอบ stage ของ Ai_scraper ด้วยตัวจับเวลา (process_queue เรียกผ่านชื่อใน module จึงเห็นตัวที่ครอบแล้ว)"""
+    import Ai_scraper
+
+    def timed(stage, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    scraper_cls = Ai_scraper.FlexibleBankScraper
+    scraper_cls.fetch_page_content = timed('fetch', scraper_cls.fetch_page_content)
+    scraper_cls.extract_executives_from_html = timed('extract', scraper_cls.extract_executives_from_html)
+    Ai_scraper.verify_and_recover = timed('verify', Ai_scraper.verify_and_recover)
+    Ai_scraper.save_records = timed('save', Ai_scraper.save_records)
+
+
+def drop_rules_tier():
+    """Verifier ไม่มี tier 'rules' (ทุก roster ถูกส่งไป LLM tier) - ครอบ default_tiers ที่ Verifier เรียกตอนสร้าง"""
+    import verifier
+
+    default_tiers = verifier.default_tiers
+
+    @functools.wraps(default_tiers)
+    def llm_tiers(*args, **kwargs):
+        return [tier for tier in default_tiers(*args, **kwargs) if tier.model is not None]
+
+    verifier.default_tiers = llm_tiers
+
+
+def run_worker(config: Dict):
+    """worker 1 ตัว: process_queue ตัวจริง + ตัวจับเวลา แล้วเขียนเวลาของแต่ละ stage ลงไฟล์ใน workdir"""
+    os.chdir(config['workdir'])
+    log_path = os.path.join(config['workdir'], f"worker-{os.getpid()}.log")
+    logging.basicConfig(filename=log_path, level=logging.INFO, force=True,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    timings = defaultdict(list)
+    install_stage_timers(timings)
+    if config['skip_rules']:
+        drop_rules_tier()
+
+    from Ai_scraper import process_queue
+
+    with open(log_path, 'a', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        process_queue(config['busi_dt'], queue_path=config['queue'], snapshots=config['snapshots'],
+                      backends=['csv'], verify=config['verify'], archive_dir=None, ollama_url=config['ollama_url'])
+    with open(os.path.join(config['workdir'], f"timings-{os.getpid()}.json"), 'w', encoding='utf-8') as f:
+        json.dump(timings, f)
+
+
+def download_snapshots(targets: List[FixtureTarget], workdir: str, timings: Dict[str, List[float]]) -> Dict[str, str]:
+    """--fetch http: โหลด HTML ดิบ (ไม่รัน JavaScript) เก็บเป็นไฟล์ให้ process_queue ใช้แทน browser"""
+    snapshots = {}
+    for i, target in enumerate(targets):
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(target.url, timeout=60) as response:
+                html = response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            html = e.read().decode('utf-8', errors='replace')
+        timings['fetch'].append(time.perf_counter() - start)
+        path = os.path.join(workdir, f"page-{i}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        snapshots[target.url] = path
+    return snapshots
+
+
+def score(queue_path: str, busi_dt: str, targets: List[FixtureTarget]) -> List[Dict]:
+    """เทียบ records ที่ผ่าน verify (checkpoint 'verified') กับ roster ของแต่ละหน้า"""
+    rows = []
+    with JobQueue(queue_path) as queue:
+        done = {result['url'] for result in queue.results(busi_dt)}
+        failures = queue.failures(busi_dt)
+        for target in targets:
+            verified = queue.load(Job(target.url, busi_dt, None, 0), 'verified') if target.url in done else None
+            found = {person_key(r.get('First_Name'), r.get('Surname'))
+                     for r in ExecutiveBatch.of((verified or {}).get('records', []))}
+            truth = {person_key(e.first_name, e.surname) for e in target.roster or []}
+            rows.append({
+                'target': target,
+                'done': target.url in done,
+                'error': failures.get(target.url),
+                'found': len(found),
+                'truth': len(truth),
+                'hits': len(found & truth),
+            })
+    return rows
+
+
+def report(rows: List[Dict], timings: Dict[str, List[float]], wall: float, sampler: RssSampler):
+    processed = sum(1 for row in rows if row['done'] or row['error'])
+    print(f"\nwall {wall:.1f}s, {processed}/{len(rows)} URL(s) finished -> {processed / wall * 60:.2f} URLs/min")
+
+    print(f"\n{'stage':<10}{'n':>5}{'p50 s':>9}{'p95 s':>9}{'total s':>10}{'share':>8}")
+    staged = 0.0
+    for stage in STAGES:
+        values = timings.get(stage, [])
+        staged += sum(values)
+        print(f"{stage:<10}{len(values):>5}{percentile(values, 50):>9.2f}{percentile(values, 95):>9.2f}"
+              f"{sum(values):>10.1f}{sum(values) / wall:>8.0%}")
+    # เวลาที่เหลือ: รอ backoff ของ scheduler, คิว / checkpoint, เปิด Chrome, แปลงชื่อเป็น record ฯลฯ
+    print(f"{'other':<10}{'':>5}{'':>9}{'':>9}{max(0.0, wall - staged):>10.1f}{max(0.0, wall - staged) / wall:>8.0%}"
+          f"   (single worker only; stage totals overlap with --workers > 1)")
+    print(f"\npeak RSS: {sampler.describe()}")
+
+    print(f"\n{'variant':<9}{'urls':>5}{'done':>6}{'failed':>8}{'recall':>8}{'precision':>11}  errors")
+    by_variant = defaultdict(list)
+    for row in rows:
+        by_variant[row['target'].variant].append(row)
+    for variant, variant_rows in by_variant.items():
+        truth = sum(row['truth'] for row in variant_rows)
+        found = sum(row['found'] for row in variant_rows)
+        hits = sum(row['hits'] for row in variant_rows)
+        recall = f"{hits / truth:.0%}" if truth else '-'
+        precision = f"{hits / found:.0%}" if found else '-'
+        errors = sorted({row['error'].split(':')[0] for row in variant_rows if row['error']})
+        print(f"{variant:<9}{len(variant_rows):>5}{sum(row['done'] for row in variant_rows):>6}"
+              f"{sum(bool(row['error']) for row in variant_rows):>8}{recall:>8}{precision:>11}  {', '.join(errors)}")
+    total_truth = sum(row['truth'] for row in rows)
+    total_hits = sum(row['hits'] for row in rows)
+    if total_truth:
+        print(f"{'all':<9}{len(rows):>5}{'':>6}{'':>8}{total_hits / total_truth:>8.0%}")
+    print("blocked pages have no roster: they should fail as 'blocked', not produce records")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark against a local fixture site")
+    parser.add_argument('--banks', type=int, default=2, help="banks per page variant")
+    parser.add_argument('--variants', default=','.join(VARIANTS), help="comma-separated: " + ', '.join(VARIANTS))
+    parser.add_argument('--roster-size', type=int, default=20)
+    parser.add_argument('--slow-seconds', type=float, default=8.0, help="response delay of the 'slow' pages")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes (one Chrome each)")
+    parser.add_argument('--fetch', choices=('browser', 'http'), default='browser',
+                        help="browser = real Chrome via fetch_page_content; http = raw HTML as snapshots (no JS)")
+    parser.add_argument('--no-verify', action='store_true', help="skip the LLM stage")
+    parser.add_argument('--skip-rules', dest='skip_rules', action='store_true', default=True,
+                        help="drop the verifier's rules tier so every roster is checked by the LLM stub "
+                             "(default: the rules tier accepts every fully extracted fixture roster)")
+    parser.add_argument('--with-rules', dest='skip_rules', action='store_false',
+                        help="keep the rules tier (production cascade; the LLM stub then serves no requests)")
+    parser.add_argument('--llm-latency', type=float, default=0.5, help="stub seconds before the first token")
+    parser.add_argument('--keep', action='store_true', help="keep the work directory (logs, queue, CSV)")
+    args = parser.parse_args(argv)
+
+    variants = tuple(v.strip() for v in args.variants.split(',') if v.strip())
+    unknown = [v for v in variants if v not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown variant(s): {', '.join(unknown)}")
+
+    workdir = tempfile.mkdtemp(prefix='e2e-bench-')
+    busi_dt = datetime.now().strftime("%Y-%m-%d")
+    queue_path = os.path.join(workdir, 'jobs.sqlite')
+    timings = defaultdict(list)
+
+    site = FixtureSite(args.banks, args.roster_size, args.slow_seconds, variants=variants).start()
+    stub = OllamaStub(latency=args.llm_latency, parallel=max(1, args.workers)).start()
+    try:
+        targets = site.targets
+        verify = 'off' if args.no_verify else ('LLM stub only' if args.skip_rules else 'rules -> LLM stub')
+        print(f"{len(targets)} page(s) ({args.banks} per variant: {', '.join(variants)}), "
+              f"fetch={args.fetch}, workers={args.workers}, verify={verify}")
+        with JobQueue(queue_path) as queue:
+            queue.enqueue([target.url for target in targets], busi_dt)
+
+        sampler = RssSampler().start()
+        start = time.perf_counter()
+        snapshots = download_snapshots(targets, workdir, timings) if args.fetch == 'http' else {}
+        config = {'workdir': workdir, 'busi_dt': busi_dt, 'queue': queue_path, 'snapshots': snapshots,
+                  'verify': not args.no_verify, 'skip_rules': args.skip_rules, 'ollama_url': stub.url}
+        if args.workers == 1:
+            cwd = os.getcwd()
+            try:
+                run_worker(config)
+            finally:
+                os.chdir(cwd)
+        else:
+            import multiprocessing
+
+            workers = [multiprocessing.Process(target=run_worker, args=(config,), name=f"bench-worker-{i}")
+                       for i in range(args.workers)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        wall = time.perf_counter() - start
+        sampler.stop()
+
+        for name in os.listdir(workdir):
+            if name.startswith('timings-'):
+                with open(os.path.join(workdir, name), encoding='utf-8') as f:
+                    for stage, values in json.load(f).items():
+                        timings[stage].extend(values)
+
+        report(score(queue_path, busi_dt, targets), timings, wall, sampler)
+        print(f"\nfixture requests: {site.requests}, LLM stub: {stub.stats}")
+        if not args.no_verify and not stub.stats['requests']:
+            print("the LLM stub served no requests: the rules tier accepted every roster, so the verify stage "
+                  "timed above excludes the LLM (drop --with-rules)")
+        if args.fetch == 'browser' and site.requests == 0:
+            print("no page reached the fixture site: is Chrome / chromedriver installed? (or use --fetch http)")
+    finally:
+        stub.stop()
+        site.stop()
+        if args.keep:
+            print(f"work directory kept: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""
+เว็บจำลองของธนาคารสำหรับทดสอบ pipeline ทั้งเส้นโดยไม่ต้องเข้าเว็บจริง (HTTP server ใน thread แยก)
+
+    python benchmarks/fixture_site.py --port 8765        # เปิดดูหน้าใน browser ได้
+
+หน้า /{variant}/{bank}/executives.html มี roster ที่รู้คำตอบล่วงหน้า (FixtureTarget.roster):
+- static:  รายชื่ออยู่ใน HTML ตั้งแต่แรก
+- js:      HTML เป็นแค่โครง รายชื่อถูกสร้างด้วย JavaScript หลังโหลด (ต้องใช้ browser)
+- lazy:    แสดงทีละ LAZY_BATCH คน ที่เหลือโหลดเพิ่มเมื่อ scroll ถึงท้ายหน้า
+- slow:    เหมือน static แต่ server ตอบช้า slow_seconds วินาที
+- blocked: 403 แบบ WAF (Akamai) - ไม่มี roster ต้องถูกจัดเป็น blocked
+
+แต่ละธนาคารมีเว็บย่อยที่ /{variant}/{bank}/ (FixtureTarget.home) สำหรับทดสอบ executive_crawler:
+หน้าแรก -> เกี่ยวกับธนาคาร -> หน้า executives พร้อมลิงก์หลอก (ข่าว / สมัครงาน / สินเชื่อ / หน้าภาษาอังกฤษ),
+ลิงก์คณะกรรมการเก่าที่เป็น 404, หน้าร่างใน /private/ ที่ robots.txt ห้าม และ sitemap index ของแต่ละเว็บย่อย
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, NamedTuple, Optional, Tuple
+
+VARIANTS = ('static', 'js', 'lazy', 'slow', 'blocked')
+# keyword ใน URL ที่ bank_registry รู้จัก -> ชื่อธนาคารถูกตรวจจับจาก URL เหมือนเว็บจริง
+BANK_KEYWORDS = ('bangkokbank', 'kasikorn', 'scb', 'krungthai', 'krungsri', 'ttb', 'kiatnakin', 'thanachart',
+                 'tisco', 'icbc', 'cimb')
+LAZY_BATCH = 4
+JS_RENDER_DELAY_MS = 1500
+
+MALE_NAMES = ('วิชัย', 'ปิยะ', 'สุนทร', 'ธนา', 'ประเสริฐ', 'วรวุฒิ', 'สุรชัย', 'อนันต์', 'ชัยวัฒน์', 'ธีระ',
+              'กิตติพงษ์', 'ณรงค์', 'พิชิต', 'เอกชัย', 'ศุภชัย')
+FEMALE_NAMES = ('อรุณี', 'กมลา', 'พรทิพย์', 'ศิริพร', 'จิราพร', 'นภาพร', 'มาลินี', 'รัตนา', 'กาญจนา', 'สุภาวดี',
+                'วิไลวรรณ', 'ปราณี', 'ดวงใจ', 'อัญชลี', 'เพ็ญศรี')
+SURNAMES = ('ศรีสุข', 'วงศ์ใหญ่', 'ทองคำ', 'บุญมี', 'แสงทอง', 'มั่นคง', 'รุ่งเรือง', 'สุขสวัสดิ์', 'เจริญผล',
+            'พงษ์ไพบูลย์', 'ศักดิ์สิทธิ์', 'อินทรประเสริฐ', 'วัฒนกุล', 'จันทร์เพ็ญ', 'ธนากร', 'สมบูรณ์ชัย')
+POSITIONS = ('ประธานกรรมการ', 'รองประธานกรรมการ', 'ประธานเจ้าหน้าที่บริหาร', 'กรรมการผู้จัดการใหญ่',
+             'รองผู้จัดการใหญ่', 'ผู้ช่วยผู้จัดการใหญ่', 'กรรมการอิสระ', 'กรรมการบริหาร',
+             'ประธานเจ้าหน้าที่การเงิน', 'ผู้อำนวยการฝ่ายบริหารความเสี่ยง')
+
+
+class Executive(NamedTuple):
+    prefix: str
+    first_name: str
+    surname: str
+    position: str
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.prefix}{self.first_name} {self.surname}"
+
+
+class FixtureTarget(NamedTuple):
+    url: str
+    variant: str
+    bank: str                            # keyword ใน URL
+    roster: Optional[List[Executive]]    # None = หน้าที่ไม่ควรได้ข้อมูล (blocked)
+    home: str = ""                       # หน้าแรกของเว็บย่อยของธนาคาร (จุดเริ่มของ crawler)
+
+
+def make_roster(size: int, rng: random.Random) -> List[Executive]:
+    """รายชื่อไม่ซ้ำ (ชื่อ + นามสกุล) พร้อมตำแหน่ง เรียงจากตำแหน่งสูงก่อนแบบหน้าเว็บธนาคาร"""
+    pairs = set()
+    roster = []
+    while len(roster) < size:
+        female = rng.random() < 0.4
+        first = rng.choice(FEMALE_NAMES if female else MALE_NAMES)
+        surname = rng.choice(SURNAMES)
+        if (first, surname) in pairs:
+            continue
+        pairs.add((first, surname))
+        prefix = 'ดร.' if rng.random() < 0.15 else ('นาง' if rng.random() < 0.5 else 'นางสาว') if female else 'นาย'
+        position = POSITIONS[min(len(roster), 3)] if len(roster) < 4 else rng.choice(POSITIONS[4:])
+        roster.append(Executive(prefix, first, surname, position))
+    return roster
+
+
+def _card(executive: Executive) -> str:
+    return (f'<div class="exec-card"><h3 class="exec-name">{escape(executive.full_name)}</h3>'
+            f'<p class="exec-position">{escape(executive.position)}</p></div>')
+
+
+def _page(bank: str, body: str, head: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html lang="th"><head><meta charset="utf-8"><title>คณะผู้บริหาร | {bank}</title>{head}
+<style>.exec-card{{padding:24px;margin:12px;border:1px solid #ddd;height:140px}}</style></head>
+<body><nav><a href="/">หน้าแรก</a> <a href="/about">เกี่ยวกับธนาคาร</a></nav>
+<main><h1>คณะกรรมการและผู้บริหาร</h1>{body}</main>
+<footer>สงวนลิขสิทธิ์ {bank} | ติดต่อธนาคาร | นโยบายความเป็นส่วนตัว</footer></body></html>"""
+
+
+_INTRO = ("<p>ธนาคารมุ่งมั่นดำเนินธุรกิจด้วยความโปร่งใส ภายใต้การกำกับดูแลของคณะกรรมการที่มีความรู้ความสามารถ "
+          "และประสบการณ์หลากหลาย เพื่อสร้างคุณค่าที่ยั่งยืนให้แก่ลูกค้า ผู้ถือหุ้น และสังคม "
+          "รายชื่อด้านล่างเป็นคณะกรรมการและผู้บริหารระดับสูงของธนาคาร ณ ปัจจุบัน</p>")
+
+_RENDER_JS = """
+function renderCards(box, rows) {
+  for (const [name, position] of rows) {
+    const card = document.createElement('div');
+    card.className = 'exec-card';
+    const h = document.createElement('h3'); h.className = 'exec-name'; h.textContent = name;
+    const p = document.createElement('p'); p.className = 'exec-position'; p.textContent = position;
+    card.appendChild(h); card.appendChild(p); box.appendChild(card);
+  }
+}
+"""
+
+
+def render(variant: str, bank: str, roster: List[Executive]) -> Tuple[int, str]:
+    """
+    Returns:
+        (HTTP status, HTML) ของหน้า executives ตาม variant
+    """
+    data = json.dumps([[e.full_name, e.position] for e in roster], ensure_ascii=False)
+    if variant in ('static', 'slow'):
+        return 200, _page(bank, _INTRO + "".join(_card(e) for e in roster))
+    if variant == 'js':
+        script = (f"<script>{_RENDER_JS}const ROSTER = {data};"
+                  f"document.addEventListener('DOMContentLoaded', () => setTimeout(() => {{"
+                  f"document.getElementById('loading').remove();"
+                  f"renderCards(document.getElementById('roster'), ROSTER);}}, {JS_RENDER_DELAY_MS}));</script>")
+        return 200, _page(bank, '<div id="loading">กำลังโหลด...</div><div id="roster"></div>' + script)
+    if variant == 'lazy':
+        script = (f"<script>{_RENDER_JS}const ROSTER = {data}; let shown = 0;"
+                  f"function more() {{ renderCards(document.getElementById('roster'), "
+                  f"ROSTER.slice(shown, shown + {LAZY_BATCH})); shown += {LAZY_BATCH}; }}"
+                  f"more();"
+                  f"window.addEventListener('scroll', () => {{"
+                  f"if (shown < ROSTER.length && window.innerHeight + window.scrollY >= "
+                  f"document.body.scrollHeight - 200) setTimeout(more, 300); }});</script>")
+        return 200, _page(bank, _INTRO + '<div id="roster"></div><div style="height:600px"></div>' + script)
+    if variant == 'blocked':
+        return 403, ("<html><head><title>Access Denied</title></head><body><h1>Access Denied</h1>"
+                     "You don't have permission to access \"http://&#46;/executives.html\" on this server.<p>"
+                     "Reference&#32;&#35;18&#46;4f2e3b17&#46;1700000000&#46;1a2b3c4d</p>"
+                     "<p>https&#58;&#47;&#47;errors&#46;edgesuite&#46;net&#47;18&#46;4f2e3b17</p></body></html>")
+    raise ValueError(f"unknown variant {variant!r}")
+
+
+NEWS_PER_BANK = 25
+
+
+def _links(items: List[Tuple[str, str]]) -> str:
+    return "<ul>" + "".join(f'<li><a href="{href}">{escape(text)}</a></li>' for href, text in items) + "</ul>"
+
+
+def _site_page(bank: str, title: str, body: str) -> str:
+    return (f'<!DOCTYPE html><html lang="th"><head><meta charset="utf-8"><title>{escape(title)} | {bank}</title></head>'
+            f'<body><header><a href="./">{bank}</a></header><main><h1>{escape(title)}</h1>{body}</main>'
+            f'<footer>สงวนลิขสิทธิ์ {bank} | ติดต่อธนาคาร 1333</footer></body></html>')
+
+
+def site_pages(prefix: str, bank: str) -> dict:
+    """
+    เว็บย่อยของธนาคารใต้ prefix (เช่น /static/scb/) -> {path: (status, html)}
+    (หน้า executives.html ไม่อยู่ในนี้ เพราะ render ตาม variant)
+    """
+    rng = random.Random(prefix)     # แยกจาก rng ของ roster จริง (roster เดิมของแต่ละ seed ไม่เปลี่ยน)
+    pages = {}
+    pages[prefix] = (200, _site_page(bank, "หน้าแรก", _links([
+        ('loans/', "สินเชื่อบ้าน สินเชื่อส่วนบุคคล"),
+        ('cards/', "บัตรเครดิต"),
+        ('news/', "ข่าวสารและกิจกรรม"),
+        ('careers/', "ร่วมงานกับเรา"),
+        ('ir/', "นักลงทุนสัมพันธ์"),
+        ('about/', "เกี่ยวกับธนาคาร"),
+        ('en/', "English"),
+    ]) + "<p>ธนาคารพร้อมให้บริการทางการเงินครบวงจร</p>"))
+    pages[prefix + 'about/'] = (200, _site_page(bank, "เกี่ยวกับธนาคาร", _links([
+        ('history.html', "ประวัติธนาคาร"),
+        ('board-of-directors.html', "คณะกรรมการธนาคาร"),           # ลิงก์เก่า -> 404
+        ('../executives.html', "คณะกรรมการและผู้บริหาร"),
+        ('governance.html', "การกำกับดูแลกิจการ"),
+        ('../private/board-draft.html', "คณะกรรมการ (ฉบับร่าง)"),  # robots.txt ห้าม
+    ])))
+    pages[prefix + 'about/history.html'] = (200, _site_page(bank, "ประวัติธนาคาร", "<p>ก่อตั้งเมื่อ พ.ศ. 2488</p>"))
+    pages[prefix + 'about/governance.html'] = (200, _site_page(
+        bank, "การกำกับดูแลกิจการ", "<p>คณะกรรมการธนาคารยึดมั่นในหลักธรรมาภิบาล</p>"
+        + _links([('../ir/', "นักลงทุนสัมพันธ์"), ('../executives.html', "รายชื่อคณะกรรมการ")])))
+    pages[prefix + 'private/board-draft.html'] = (200, _page(bank, "".join(
+        _card(e) for e in make_roster(12, rng))))
+    pages[prefix + 'ir/'] = (200, _site_page(bank, "นักลงทุนสัมพันธ์", _links([
+        ('annual-report.pdf', "รายงานประจำปี (PDF)"), ('../about/governance.html', "การกำกับดูแลกิจการ")])))
+    news = [(f'{i}.html', f"ข่าวประชาสัมพันธ์ฉบับที่ {i}") for i in range(1, NEWS_PER_BANK + 1)]
+    news[3] = ('4.html', "ธนาคารแต่งตั้งกรรมการผู้จัดการใหญ่คนใหม่")
+    pages[prefix + 'news/'] = (200, _site_page(bank, "ข่าวสารและกิจกรรม", _links(news)))
+    for href, title in news:
+        pages[prefix + 'news/' + href] = (200, _site_page(bank, title, f"<p>{escape(title)} นายวิชัย ศรีสุข</p>"))
+    for path, title in (('loans/', "สินเชื่อ"), ('cards/', "บัตรเครดิต"), ('careers/', "ร่วมงานกับเรา")):
+        pages[prefix + path] = (200, _site_page(bank, title, "<p>รายละเอียดผลิตภัณฑ์และตำแหน่งงานว่าง</p>"))
+    pages[prefix + 'en/'] = (200, _site_page(bank, "Home", _links([('board.html', "Board of Directors")])))
+    pages[prefix + 'en/board.html'] = (200, _site_page(bank, "Board of Directors", "".join(
+        f"<p>Mr. Somchai {i} - Director</p>" for i in range(10))))
+    return pages
+
+
+class FixtureSite:
+    """
+    HTTP server ของเว็บจำลอง
+
+    วิธีใช้:
+        with FixtureSite(banks_per_variant=2) as site:
+            for target in site.targets:
+                ... target.url, target.roster
+    """
+    def __init__(self, banks_per_variant: int = 2, roster_size: int = 20, slow_seconds: float = 8.0,
+                 variants: Tuple[str, ...] = VARIANTS, host: str = '127.0.0.1', port: int = 0, seed: int = 7,
+                 sitemap: bool = True):
+        rng = random.Random(seed)
+        self.slow_seconds = slow_seconds
+        self.sitemap = sitemap
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+        self.requests = 0
+        self.hits = Counter()   # path -> จำนวน request
+        self._lock = threading.Lock()
+
+        host, port = self.server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        self.pages = {}     # path -> (variant, bank, roster)
+        self.site = {}      # path -> (status, html) ของหน้าอื่นๆ ในเว็บย่อยของแต่ละธนาคาร
+        self.targets: List[FixtureTarget] = []
+        banks = iter(BANK_KEYWORDS * (1 + banks_per_variant * len(variants) // len(BANK_KEYWORDS)))
+        for variant in variants:
+            for _ in range(banks_per_variant):
+                bank = next(banks)
+                roster = make_roster(roster_size, rng)
+                prefix = f"/{variant}/{bank}/"
+                path = prefix + "executives.html"
+                self.pages[path] = (variant, bank, roster)
+                self.site.update(site_pages(prefix, bank))
+                self.targets.append(FixtureTarget(self.base_url + path, variant, bank,
+                                                  None if variant == 'blocked' else roster, self.base_url + prefix))
+
+    def robots_txt(self) -> str:
+        lines = ["User-agent: *"]
+        lines += [f"Disallow: /{t.variant}/{t.bank}/private/" for t in self.targets]
+        lines.append("Allow: /")
+        if self.sitemap:
+            lines += [f"Sitemap: {t.home}sitemap.xml" for t in self.targets]
+        return "\n".join(lines) + "\n"
+
+    def sitemap_xml(self, path: str) -> Optional[str]:
+        """
+        {prefix}sitemap.xml = sitemap index ของเว็บย่อย -> sitemap-pages.xml (ทุกหน้ายกเว้นข่าว) / sitemap-news.xml
+        """
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        prefix, _, name = path.rpartition('/')
+        prefix += '/'
+        if not any(prefix == f"/{t.variant}/{t.bank}/" for t in self.targets):
+            return None
+        if name == 'sitemap.xml':
+            entries = "".join(f"<sitemap><loc>{self.base_url}{prefix}sitemap-{kind}.xml</loc></sitemap>"
+                              for kind in ('news', 'pages'))
+            return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex {ns}>{entries}</sitemapindex>'
+        if name not in ('sitemap-pages.xml', 'sitemap-news.xml'):
+            return None
+        news = name == 'sitemap-news.xml'
+        paths = [p for p in list(self.site) + [prefix + "executives.html"]
+                 if p.startswith(prefix) and '/private/' not in p and p.startswith(prefix + 'news/') == news]
+        entries = "".join(f"<url><loc>{self.base_url}{p}</loc></url>" for p in sorted(paths))
+        return f'<?xml version="1.0" encoding="UTF-8"?><urlset {ns}>{entries}</urlset>'
+
+    def start(self) -> 'FixtureSite':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='fixture-site', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'FixtureSite':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8'):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                with site._lock:
+                    site.requests += 1
+                    site.hits[path] += 1
+                if path == '/robots.txt':
+                    self._send(200, site.robots_txt(), 'text/plain; charset=utf-8')
+                    return
+                sitemap = site.sitemap_xml(path) if site.sitemap and '/sitemap' in path else None
+                if sitemap is not None:
+                    self._send(200, sitemap, 'application/xml; charset=utf-8')
+                    return
+                if path in site.site:
+                    self._send(*site.site[path])
+                    return
+                page = site.pages.get(path)
+                if page is None:
+                    self._send(404, "<html><head><title>404 Not Found</title></head><body>ไม่พบหน้า</body></html>")
+                    return
+                variant, bank, roster = page
+                if variant == 'slow':
+                    time.sleep(site.slow_seconds)
+                try:
+                    self._send(*render(variant, bank, roster))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve synthetic bank executive pages")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--banks', type=int, default=2, help="banks per variant")
+    parser.add_argument('--roster-size', type=int, default=20)
+    parser.add_argument('--slow-seconds', type=float, default=8.0)
+    args = parser.parse_args(argv)
+
+    site = FixtureSite(args.banks, args.roster_size, args.slow_seconds, port=args.port)
+    for target in site.targets:
+        print(f"{target.variant:<8}{target.url}  (home {target.home})")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
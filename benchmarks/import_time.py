@@ -0,0 +1,75 @@
+"""
+วัดเวลา cold import ของแต่ละ module ใน interpreter ใหม่ (ไม่มี cache ใน sys.modules)
+
+    python benchmarks/import_time.py            # 15 รอบต่อ module
+    python benchmarks/import_time.py -n 30 cli
+
+แสดง median / min หลังหักเวลาเริ่ม interpreter เปล่า และ dependency หนักที่ถูกโหลดมาด้วย
+(selenium / bs4 / requests / pandas ควรเป็น '-' สำหรับ cli, Ai_scraper, verifier)
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ['cli', 'Ai_scraper', 'verifier', 'job_queue', 'output_sinks']
+# dependency ที่แต่ละ module เคย import ตอนโหลด (ใช้เป็นตัวเทียบว่าประหยัดไปเท่าไร)
+REFERENCE_MODULES = ['selenium.webdriver.support.ui', 'bs4', 'soupsieve', 'requests']
+HEAVY_PACKAGES = ('selenium', 'bs4', 'soupsieve', 'requests', 'pandas', 'pyarrow')
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+if {module!r}:
+    __import__({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted(p for p in {heavy!r} if p in sys.modules)]))
+"""
+
+
+def measure(module: str, runs: int):
+    """
+    Returns:
+        (list ของเวลา import เป็นวินาที, dependency หนักที่ถูกโหลด)
+    """
+    timings = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_PACKAGES)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+        timings.append(elapsed)
+    return timings, loaded
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import-time benchmark")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('-n', '--runs', type=int, default=15)
+    parser.add_argument('--no-reference', action='store_true', help="skip timing the heavy dependencies alone")
+    args = parser.parse_args(argv)
+
+    modules = list(args.modules)
+    if not args.no_reference:
+        modules += [m for m in REFERENCE_MODULES if m not in modules]
+
+    print(f"{'module':<32}{'median ms':>10}{'min ms':>10}  heavy deps loaded")
+    for module in modules:
+        try:
+            timings, loaded = measure(module, args.runs)
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<32}{'error':>10}  {e.stderr.strip().splitlines()[-1] if e.stderr else ''}")
+            continue
+        print(f"{module:<32}{statistics.median(timings) * 1000:>10.1f}{min(timings) * 1000:>10.1f}  "
+              f"{', '.join(loaded) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
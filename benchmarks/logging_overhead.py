@@ -0,0 +1,135 @@
+"""
+วัด overhead ของ logging ใน hot path ของการดึงรายชื่อ (extract_executives_from_html + create_executive_records)
+
+    python benchmarks/logging_overhead.py
+    python benchmarks/logging_overhead.py --sink-latency 0.5 --repeat 5
+
+เทียบการตั้งค่า logging บนหน้าเดียวกัน:
+- sync:  StreamHandler เขียนตรงจาก thread ที่ extract (แบบ logging.basicConfig เดิม)
+- queue: log_setup.setup_logging (QueueHandler -> QueueListener thread)
+ในแต่ละ profile (default / quiet / verbose) - --sink-latency จำลอง stdout ที่ช้า (terminal / pipe ที่ปลายทางอ่านไม่ทัน)
+และเทียบต้นทุนต่อการเรียก logger.debug ที่ปิดอยู่: f-string (จัดรูปทุกครั้ง) กับ argument แบบ lazy
+"""
+import io
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import statistics
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import log_setup  # noqa: E402
+from Ai_scraper import FlexibleBankScraper  # noqa: E402
+from extraction_profiles import ProfileRegistry  # noqa: E402
+
+DEFAULT_PAGE = os.path.join(REPO_ROOT, 'debug_full_page.html')
+DEFAULT_URL = "https://www.kasikornbank.com/th/about/Pages/executives.aspx"
+
+
+class SlowSink(io.TextIOBase):
+    """stream ที่นับบรรทัด และหน่วงทุกครั้งที่เขียน (จำลอง terminal / pipe ที่ช้า)"""
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        self.lines += text.count("\n")
+        if self.latency:
+            time.sleep(self.latency)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def configure(mode: str, profile: str, sink: SlowSink):
+    root = logging.getLogger()
+    if mode == 'sync':
+        log_setup.stop_logging()
+        logging.basicConfig(stream=sink, format=log_setup.LOG_FORMAT, force=True)
+        log_setup.apply_levels(log_setup.LOG_PROFILES[profile])
+    else:
+        log_setup.setup_logging(profile, levels={}, stream=sink, force=True)
+    return root
+
+
+def extract_once(scraper: FlexibleBankScraper, html: str) -> int:
+    executives = scraper.extract_executives_from_html(html)
+    return len(scraper.create_executive_records(executives))
+
+
+def disabled_call_cost(calls: int) -> tuple:
+    """ต้นทุนต่อการเรียก debug ที่ปิดอยู่ (ns): f-string vs lazy"""
+    logger = logging.getLogger('scraper.extract')
+    logger.setLevel(logging.INFO)
+    name, position, source = "นายสมชาย ใจดี", "กรรมการผู้จัดการใหญ่", "Adjacent"
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug(f" ---- {source}: {name} | {position} ----")
+    eager = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug(" ---- %s: %s | %s ----", source, name, position)
+    lazy = time.perf_counter() - start
+    return eager / calls * 1e9, lazy / calls * 1e9
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Logging overhead on the extraction hot path")
+    parser.add_argument('--page', default=DEFAULT_PAGE)
+    parser.add_argument('--url', default=DEFAULT_URL, help="base URL of the page (bank detection / profile key)")
+    parser.add_argument('--repeat', type=int, default=5, help="extractions per configuration")
+    parser.add_argument('--sink-latency', type=float, default=0.2, help="milliseconds per write to the log stream")
+    parser.add_argument('--profiles', default='verbose,default,quiet')
+    args = parser.parse_args(argv)
+
+    with open(args.page, encoding='utf-8', errors='replace') as f:
+        html = f.read()
+
+    workdir = tempfile.mkdtemp(prefix='logging-bench-')
+    try:
+        scraper = FlexibleBankScraper(args.url)
+        scraper.profiles = ProfileRegistry(os.path.join(workdir, 'profiles.json'))
+        scraper._learn_profile = lambda *a, **k: None   # วัดเฉพาะ generic passes ทุกรอบ
+        scraper.bank_name = scraper.detect_bank_name(args.url)
+        configure('sync', 'quiet', SlowSink(0))
+        extract_once(scraper, html)                      # warm-up (cache ของ position_taxonomy / regex)
+
+        results = []
+        for profile in args.profiles.split(','):
+            for mode in ('sync', 'queue'):
+                sink = SlowSink(args.sink_latency / 1000)
+                configure(mode, profile, sink)
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    count = extract_once(scraper, html)
+                    timings.append(time.perf_counter() - start)
+                hot_path = statistics.median(timings)
+                start = time.perf_counter()
+                log_setup.flush_logging()
+                drain = time.perf_counter() - start
+                results.append((profile, mode, hot_path, drain, sink.lines // args.repeat, count))
+        log_setup.setup_logging('default', levels={}, force=True)
+
+        print(f"page: {args.page} ({len(html):,} chars), {args.repeat} run(s) per row, "
+              f"log stream latency {args.sink_latency} ms/write\n")
+        print(f"{'profile':<9}{'handler':<8}{'extract ms':>12}{'drain ms':>10}{'lines/run':>11}{'records':>9}")
+        for profile, mode, hot_path, drain, lines, count in results:
+            print(f"{profile:<9}{mode:<8}{hot_path * 1000:>12.1f}{drain * 1000:>10.1f}{lines:>11}{count:>9}")
+        print("\nextract ms = time on the scraping thread (median); drain ms = time for the queue listener to catch up")
+
+        eager, lazy = disabled_call_cost(200_000)
+        print(f"disabled logger.debug per call: f-string {eager:.0f} ns, lazy args {lazy:.0f} ns")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+ตรวจว่า pattern_scanner ได้ผลเท่ากับ regex pattern1 เดิมของ PASS 4 บนข้อความสุ่ม
+
+    python benchmarks/pass4_fuzz.py
+    python benchmarks/pass4_fuzz.py --count 100000 --seed 7
+
+ข้อความสุ่มต่อจากชิ้นที่ทำให้ regex แตกกรณี: คำนำหน้าชื่อ (รวม นาง/นางสาว), keyword (รวม 'cto' ใน 'director'),
+ช่องว่าง / tab / newline เป็นชุด, ตัวอักษรไทย/อังกฤษ ทุกข้อความตรวจทั้ง 3 ทาง:
+- scan_name_position_pairs ตามค่าปกติ (regex เดิมเป็นก้อน หรือ sweep เมื่อบรรทัดยาว)
+- scan_name_position_pairs ที่ FAST_PATH_CHUNK เล็กมาก (ตรวจรอยต่อระหว่างก้อน)
+- sweep ล้วน (_sweep_pairs)
+"""
+import os
+import re
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pattern_scanner  # noqa: E402
+from pattern_scanner import _sweep_pairs, scan_name_position_pairs  # noqa: E402
+
+# สำเนาตรงตัวของ pattern เดิม (ไม่ใช้ของ pattern_scanner เพื่อให้เป็นค่าอ้างอิงอิสระ)
+LEGACY_PATTERN = re.compile(
+    r'((?:นาย|นาง|นางสาว|ดร\.|คุณ)[^\n]{10,80})\s+([^\n]{10,100}(?:ผู้จัดการ|กรรมการ|ประธาน|ผู้บริหาร|Director|Manager|CEO|CFO|CTO|COO|President)[^\n]{0,50})',
+    re.IGNORECASE,
+)
+
+PIECES = (
+    ['นาย', 'นาง', 'นางสาว', 'ดร.', 'คุณ', 'ดร', 'นา']
+    + ['ผู้จัดการ', 'กรรมการ', 'ประธาน', 'ผู้บริหาร', 'director', 'DIRECTOR', 'Manager', 'ceo', 'cto',
+       'COO', 'cfo', 'President', 'direc']
+    + [' ', '  ', ' ' * 12, '\t', '\n', '\n\n', ' \n ', ' ']
+    + ['สมชาย', 'ใจดี', 'ก', 'x', 'xxxxxxxxxx', '|', '.', 'เจ้าหน้าที่', 'บริหาร']
+)
+
+
+def fuzz_text(rng: random.Random) -> str:
+    size = rng.choice((5, 20, 60, 150))
+    return ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, size)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PASS 4 scanner vs legacy regex on fuzzed strings")
+    parser.add_argument('--count', type=int, default=30_000)
+    parser.add_argument('--seed', type=int, default=41)
+    parser.add_argument('--show', type=int, default=3, help="mismatches to print")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    default_chunk = pattern_scanner.FAST_PATH_CHUNK
+    mismatches = 0
+    pairs = 0
+    for _ in range(args.count):
+        text = fuzz_text(rng)
+        expected = LEGACY_PATTERN.findall(text)
+        pairs += len(expected)
+        pattern_scanner.FAST_PATH_CHUNK = default_chunk
+        results = {'scan': scan_name_position_pairs(text, time_budget=60.0)}
+        pattern_scanner.FAST_PATH_CHUNK = rng.randint(1, 40)
+        results['scan-chunked'] = scan_name_position_pairs(text, time_budget=60.0)
+        results['sweep'] = _sweep_pairs(text, time_budget=60.0)
+        for name, found in results.items():
+            if found != expected:
+                mismatches += 1
+                if mismatches <= args.show:
+                    print(f"MISMATCH {name} (chunk {pattern_scanner.FAST_PATH_CHUNK}): {text!r}\n"
+                          f"  regex: {expected}\n  {name}: {found}")
+    pattern_scanner.FAST_PATH_CHUNK = default_chunk
+
+    print(f"{args.count} strings, {pairs} legacy pairs, {mismatches} mismatch(es)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+เทียบ regex pattern1 เดิมของ PASS 4 กับ pattern_scanner บนบรรทัดสังเคราะห์ยาวๆ (แบบ get_text() ของหน้า minified)
+และบน roster ปกติที่แยกบรรทัด (ทาง fast path ที่ใช้ regex เดิม)
+
+    python benchmarks/pass4_scan.py
+    python benchmarks/pass4_scan.py --repeat 20,200,2000 --regex-max-chars 20000
+
+regex เดิมถูกรันเฉพาะขนาดไม่เกิน --regex-max-chars (บาง case ใช้เวลาเป็นนาที) และตรวจว่าผลตรงกันทุกครั้ง
+"""
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pattern_scanner import scan_name_position_pairs  # noqa: E402
+
+LEGACY_PATTERN = re.compile(
+    r'((?:นาย|นาง|นางสาว|ดร\.|คุณ)[^\n]{10,80})\s+([^\n]{10,100}(?:ผู้จัดการ|กรรมการ|ประธาน|ผู้บริหาร|Director|Manager|CEO|CFO|CTO|COO|President)[^\n]{0,50})',
+    re.IGNORECASE,
+)
+
+# หน่วยที่ถูกต่อซ้ำเป็นบรรทัดเดียว
+CASES = {
+    'names-no-keyword': 'นายสมชาย ใจดี ',                       # คำนำหน้าถี่ ไม่มีตำแหน่งเลย
+    'short-tokens': 'นาย ก ข ค ',                               # ช่องว่างถี่ ทุกจุดเป็นจุดตัดชื่อได้
+    'whitespace-runs': 'นาย' + 'x' * 10 + ' ' * 100,            # \s+ กับ [^\n] แย่งช่องว่างกัน
+    'keyword-out-of-reach': 'นาย' + ' ' * 60 + 'x' * 120 + 'CEO',  # keyword ไกลเกิน 100 ตัวอักษร
+    'roster': 'นายสมชาย ใจดี ประธานเจ้าหน้าที่บริหาร CEO | ',      # ข้อมูลจริงต่อกันไม่มี newline
+    # บรรทัดสั้น
+    'roster-lines': 'นายสมชาย ใจดี\nประธานเจ้าหน้าที่บริหาร CEO\nกรรมการผู้จัดการ\n\n',   # get_text() ของหน้าปกติ
+    'dense-short-lines': 'นาย ก ข ค ' * 29 + '\n',             # บรรทัดสั้นแต่คำนำหน้าถี่ (guard เปลี่ยนไป sweep)
+}
+
+
+def timed(func, text):
+    start = time.perf_counter()
+    result = func(text)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PASS 4 pattern scan benchmark")
+    parser.add_argument('--repeat', default='20,200,2000', help="comma-separated repeat counts per case")
+    parser.add_argument('--regex-max-chars', type=int, default=20_000,
+                        help="skip the legacy regex above this line length")
+    parser.add_argument('--cases', nargs='*', default=list(CASES), choices=list(CASES))
+    args = parser.parse_args(argv)
+    repeats = [int(n) for n in args.repeat.split(',')]
+
+    mismatches = 0
+    print(f"{'case':<22}{'chars':>9}{'regex s':>10}{'scan s':>10}{'speedup':>9}{'pairs':>7}")
+    for name in args.cases:
+        for repeat in repeats:
+            text = CASES[name] * repeat
+            scan_time, pairs = timed(scan_name_position_pairs, text)
+            regex_col, speedup_col = '-', '-'
+            if len(text) <= args.regex_max_chars:
+                regex_time, expected = timed(lambda t: LEGACY_PATTERN.findall(t), text)
+                regex_col = f"{regex_time:.3f}"
+                speedup_col = f"{regex_time / max(scan_time, 1e-9):.1f}x"
+                if expected != pairs:
+                    mismatches += 1
+                    speedup_col += ' !='
+            print(f"{name:<22}{len(text):>9}{regex_col:>10}{scan_time:>10.3f}{speedup_col:>9}{len(pairs):>7}")
+
+    if mismatches:
+        print(f"\n{mismatches} case(s) differ from the legacy regex")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+วัดหน่วยความจำต่อ record และเวลา export ของ ExecutiveRecord / ExecutiveBatch เทียบกับ dict แบบเดิม
+
+    python benchmarks/record_memory.py
+    python benchmarks/record_memory.py --records 500000 --banks 40
+
+จำลองงาน reprocess ย้อนหลังจำนวนมาก: records ถูกโหลดกลับจาก checkpoint JSON (string ทุกค่าเป็น object ใหม่)
+- dict:    แบบเดิม (checkpoint เป็น list ของ dict -> json.loads ได้ dict 11-12 key ต่อคน) export ผ่าน pandas DataFrame
+- record:  checkpoint แบบตาราง (ExecutiveBatch.to_table) -> ExecutiveBatch.of (slots + dict cache ต่อ batch) export ตรงจาก slot
+- record*: checkpoint แบบเดิม (list ของ dict) -> ExecutiveBatch.of (checkpoint ที่เขียนก่อนเปลี่ยนรูปแบบ)
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from executive_record import ExecutiveBatch  # noqa: E402
+from output_sinks import CSV_COLUMNS, HISTORY_COLUMNS  # noqa: E402
+from position_taxonomy import classify_position  # noqa: E402
+
+POSITIONS = ['ประธานกรรมการ', 'กรรมการผู้จัดการใหญ่', 'รองผู้จัดการใหญ่', 'ผู้ช่วยผู้จัดการใหญ่',
+             'กรรมการอิสระ', 'กรรมการ', 'ประธานเจ้าหน้าที่การเงิน', 'ผู้อำนวยการ']
+
+
+def build_payloads(records: int, banks: int, days: int, seed: int) -> list:
+    """JSON ของ checkpoint 'verified' (1 ก้อนต่อธนาคารต่อวัน) เหมือนที่ job_queue เก็บไว้"""
+    rng = random.Random(seed)
+    per_run = max(1, records // (banks * days))
+    payloads = []
+    for day in range(days):
+        for bank in range(banks):
+            rows = []
+            for i in range(per_run):
+                position = rng.choice(POSITIONS)
+                role = classify_position(position)
+                first, surname = f"ชื่อ{bank}x{i}", f"นามสกุล{rng.randrange(10 ** 6)}"
+                rows.append({
+                    'BUSI_DT': f"2026-{1 + day // 28:02d}-{1 + day % 28:02d}", 'Eng_Prefix': 'Mr.',
+                    'Full_Name': f"นาย{first} {surname}", 'Thai_Prefix': 'นาย', 'First_Name': first,
+                    'Surname': surname, 'Bank_Name': f"Bank{bank}",
+                    'Position': position, 'Source_URL': f"https://bank{bank}.example/th/about/executives",
+                    'Position_Role': role.role, 'Position_Rank': role.rank,
+                })
+            payloads.append(json.dumps({'records': rows}, ensure_ascii=False))
+    return payloads
+
+
+def as_tables(payloads: list) -> list:
+    """checkpoint เดียวกันในรูปแบบตารางที่ process_queue เขียนตอนนี้"""
+    return [json.dumps({'records': ExecutiveBatch.of(json.loads(payload)['records']).to_table()}, ensure_ascii=False)
+            for payload in payloads]
+
+
+def load(payloads: list, as_records: bool) -> list:
+    """โหลด checkpoint ทั้งหมดแบบที่ process_queue ทำ"""
+    loaded = []
+    for payload in payloads:
+        rows = json.loads(payload)['records']
+        loaded.extend(ExecutiveBatch.of(rows) if as_records else rows)
+    return loaded
+
+
+def measure(payloads: list, as_records: bool, repeat: int = 3):
+    """
+    คืน (records, bytes ที่ใช้, วินาที) - เวลาที่เร็วที่สุดจาก repeat รอบ วัดแยกจาก tracemalloc
+    (tracemalloc ทำให้ช้าลงหลายเท่า)
+    """
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(payloads, as_records)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    loaded = load(payloads, as_records)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return loaded, used, seconds
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ExecutiveRecord vs dict: memory per record and export time")
+    parser.add_argument('--records', type=int, default=200_000)
+    parser.add_argument('--banks', type=int, default=20)
+    parser.add_argument('--days', type=int, default=250, help="business days of history being reprocessed")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    payloads = build_payloads(args.records, args.banks, args.days, args.seed)
+    dicts, dict_bytes, dict_load = measure(payloads, as_records=False)
+    records, record_bytes, record_load = measure(as_tables(payloads), as_records=True)
+    _, _, legacy_load = measure(payloads, as_records=True)
+    batch = ExecutiveBatch(records)
+    total = len(batch)
+
+    print(f"{total} records ({args.banks} banks x {args.days} days)\n")
+    print(f"{'':<8}{'bytes/record':>14}{'total MB':>10}{'load s':>9}")
+    print(f"{'dict':<8}{dict_bytes / total:>14.0f}{dict_bytes / 1e6:>10.1f}{dict_load:>9.2f}")
+    print(f"{'record':<8}{record_bytes / total:>14.0f}{record_bytes / 1e6:>10.1f}{record_load:>9.2f}"
+          f"   ({dict_bytes / max(record_bytes, 1):.1f}x smaller)")
+    print(f"{'record*':<8}{'':>14}{'':>10}{legacy_load:>9.2f}   (checkpoint written as a list of dicts)")
+
+    workdir = tempfile.mkdtemp(prefix='record-bench-')
+    try:
+        out = lambda name: os.path.join(workdir, name)  # noqa: E731
+        results = []
+        try:
+            import pandas as pd
+            results.append(('csv', timed(lambda: pd.DataFrame(dicts, columns=CSV_COLUMNS).to_csv(
+                out('dict.csv'), index=False, encoding='utf-8-sig')), timed(lambda: batch.to_csv(out('batch.csv')))))
+            results.append(('json', timed(lambda: pd.DataFrame(dicts).to_json(
+                out('dict.json'), orient='records', force_ascii=False)), timed(lambda: batch.to_json(out('batch.json')))))
+            try:
+                import pyarrow  # noqa: F401
+                results.append(('parquet', timed(lambda: pd.DataFrame(dicts, columns=HISTORY_COLUMNS).to_parquet(
+                    out('dict.parquet'))), timed(lambda: batch.to_parquet(out('batch.parquet')))))
+            except ImportError:
+                print("(pyarrow not installed: parquet skipped)")
+        except ImportError:
+            print("(pandas not installed: export comparison skipped)")
+
+        if results:
+            print(f"\n{'export':<10}{'DataFrame s':>13}{'batch s':>10}")
+            for name, frame_seconds, batch_seconds in results:
+                print(f"{name:<10}{frame_seconds:>13.2f}{batch_seconds:>10.2f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
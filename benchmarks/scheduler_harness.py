@@ -0,0 +1,245 @@
+"""
+ทดสอบ FetchScheduler กับ HTTP server จำลองที่ตอบตามสคริปต์ต่อ domain (200 / 403 แบบ WAF / 503)
+
+    python benchmarks/scheduler_harness.py
+    python benchmarks/scheduler_harness.py -v        # แสดงลำดับ request และเวลาที่รอของแต่ละ scenario
+
+- server เดียวบน 127.0.0.1 แยก "domain" ด้วย Host header (http://bank-a.test:PORT/... ทุกตัววิ่งไปที่ server นี้)
+- loop เดียวกับ process_queue: fetch -> page_status.classify_page -> record_success / record_failure
+- เวลาเป็นนาฬิกาจำลอง (sleep ของ scheduler แค่เลื่อนนาฬิกา) cooldown 300 วินาทีจึงไม่ต้องรอจริง
+- แต่ละ scenario ตรวจลำดับ URL, ระยะ backoff, การเลื่อน URL ไปท้ายคิว, การตัดวงจร และ half-open probe
+"""
+import os
+import sys
+import logging
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fetch_scheduler import FetchScheduler, RetryPolicy  # noqa: E402
+from page_status import PageStatus, classify_page  # noqa: E402
+
+# คำตอบของ server ตามสคริปต์
+OK_PAGE = ("<html><head><title>คณะผู้บริหาร</title></head><body>"
+           + "".join(f"<p>นายสมชาย ใจดี{i} กรรมการผู้จัดการ</p>" for i in range(20)) + "</body></html>")
+BLOCKED_PAGE = ("<html><head><title>Access Denied</title></head><body>You don't have permission to access "
+                "this server. https&#58;&#47;&#47;errors&#46;edgesuite&#46;net</body></html>")
+UNAVAILABLE_PAGE = "<html><head><title>Service Unavailable</title></head><body>503</body></html>"
+RESPONSES = {'ok': (200, OK_PAGE), 'blocked': (403, BLOCKED_PAGE), '503': (503, UNAVAILABLE_PAGE)}
+
+# jitter = 0 ให้ backoff ตรวจได้แน่นอน / ไม่เว้นระยะหลัง request ที่สำเร็จ (ทดสอบแยกใน scenario_min_interval)
+POLICY = RetryPolicy(base_delay=5.0, max_delay=120.0, jitter=0.0, max_attempts=3,
+                     domain_error_budget=6, breaker_threshold=3, breaker_cooldown=300.0,
+                     min_interval=0.0, max_interval=0.0)
+
+
+class ScriptedServer:
+    """
+    server ที่ตอบตามสคริปต์ต่อ Host: {'bank-a.test': ['blocked', 'ok']} = request แรกได้ 403 ที่เหลือได้ 200
+    (ตัวสุดท้ายของสคริปต์ใช้ซ้ำไปเรื่อยๆ)
+    """
+    def __init__(self, script: Dict[str, List[str]]):
+        self.script = script
+        self.hits: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'ScriptedServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def url(self, host: str, path: str) -> str:
+        return f"http://{host}:{self.port}{path}"
+
+    def respond(self, host: str) -> Tuple[int, str]:
+        with self._lock:
+            steps = self.script.get(host, ['ok'])
+            step = steps[min(self.hits[host], len(steps) - 1)]
+            self.hits[host] += 1
+        return RESPONSES[step]
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                status, body = site.respond(self.headers.get('Host', '').split(':')[0])
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def fetch(server: ScriptedServer, url: str) -> str:
+    """โหลด URL ของ domain จำลองจาก server (ต่อ 127.0.0.1 แล้วส่ง Host เดิม)"""
+    scheme_host, _, path = url.partition('://')[2].partition('/')
+    request = urllib.request.Request(f"http://127.0.0.1:{server.port}/{path}",
+                                     headers={'Host': scheme_host})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.read().decode('utf-8')
+    except urllib.error.HTTPError as e:
+        return e.read().decode('utf-8')
+
+
+class Run:
+    """ผลของการรัน scheduler หนึ่งรอบ: ลำดับ (เวลา, url, สถานะ), เวลาที่รอ และ URL ที่เลิกลอง"""
+    def __init__(self):
+        self.now = 0.0
+        self.fetches: List[Tuple[float, str, str]] = []
+        self.sleeps: List[float] = []
+        self.failed: Dict[str, str] = {}
+        self.hits: Dict[str, int] = {}     # host -> request ที่ server ได้รับ
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+    def urls(self) -> List[str]:
+        return [url.rsplit('/', 1)[1] for _, url, _ in self.fetches]
+
+
+def run(script: Dict[str, List[str]], paths: List[Tuple[str, str]], policy: RetryPolicy = POLICY) -> Run:
+    """รัน loop เดียวกับ process_queue กับ server ตามสคริปต์ (นาฬิกาจำลอง)"""
+    result = Run()
+    with ScriptedServer(script) as server:
+        urls = [server.url(host, path) for host, path in paths]
+        scheduler = FetchScheduler(urls, policy=policy, clock=lambda: result.now, sleep=result.sleep)
+        for url in scheduler:
+            check = classify_page(fetch(server, url))
+            result.fetches.append((result.now, url, check.status.value))
+            if check.status is PageStatus.OK:
+                scheduler.record_success(url)
+            else:
+                scheduler.record_failure(url, check)
+        result.failed = {url.rsplit('/', 1)[1]: reason for url, reason in scheduler.failed.items()}
+        result.hits = dict(server.hits)
+    return result
+
+
+# ----- scenarios -----
+def scenario_deferral() -> Run:
+    """URL ที่โดน block ถูกเลื่อนไปท้ายคิว ธนาคารอื่นทำก่อนโดยไม่ต้องรอ backoff"""
+    r = run({'bank-a.test': ['blocked', 'ok']},
+            [('bank-a.test', '/a1'), ('bank-b.test', '/b1'), ('bank-b.test', '/b2')])
+    assert r.urls() == ['a1', 'b1', 'b2', 'a1'], r.urls()
+    assert [status for *_, status in r.fetches] == ['blocked', 'ok', 'ok', 'ok']
+    assert r.sleeps == [5.0], r.sleeps          # รอ backoff ของ bank-a เฉพาะตอนเหลือแต่ a1
+    assert not r.failed
+    return r
+
+
+def scenario_backoff() -> Run:
+    """503 ติดกัน: backoff แบบ exponential (5 -> 10 วินาที) แล้วสำเร็จในครั้งที่ 3"""
+    r = run({'bank-c.test': ['503', '503', 'ok']}, [('bank-c.test', '/c1')])
+    assert r.urls() == ['c1', 'c1', 'c1'], r.urls()
+    assert r.sleeps == [5.0, 10.0], r.sleeps
+    assert [status for *_, status in r.fetches] == ['empty_shell', 'empty_shell', 'ok']
+    assert not r.failed
+    return r
+
+
+def scenario_max_attempts() -> Run:
+    """URL ที่ล้มเหลวครบ max_attempts ถูกเลิกลอง URL อื่นของ domain เดียวกันยังทำต่อ"""
+    r = run({'bank-e.test': ['503'] * 5 + ['ok']}, [('bank-e.test', '/e1'), ('bank-e.test', '/e2')])
+    assert r.urls() == ['e1', 'e2', 'e1', 'e2', 'e1', 'e2'], r.urls()
+    assert list(r.failed) == ['e1'] and r.failed['e1'].startswith('empty_shell'), r.failed
+    assert [status for *_, status in r.fetches][-1] == 'ok'
+    assert r.hits == {'bank-e.test': 6}, r.hits
+    return r
+
+
+def scenario_breaker_probe() -> Run:
+    """
+    block 3 ครั้งติด -> ตัดวงจร -> รอ cooldown -> probe 1 URL สำเร็จ -> ปิดวงจร URL ที่เหลือทำต่อทันที
+    """
+    r = run({'bank-d.test': ['blocked'] * 3 + ['ok']},
+            [('bank-d.test', f'/d{i}') for i in range(1, 5)])
+    assert r.urls() == ['d1', 'd2', 'd3', 'd4', 'd1', 'd2', 'd3'], r.urls()
+    # backoff 5, 10 ก่อนตัดวงจร แล้วรอจนครบ cooldown ของวงจร (300 วินาทีนับจาก block ครั้งที่ 3)
+    assert r.sleeps == [5.0, 10.0, 300.0], r.sleeps
+    probe_at = r.fetches[3][0]
+    assert probe_at == r.fetches[2][0] + POLICY.breaker_cooldown, (probe_at, r.fetches[2][0])
+    assert all(at == probe_at for at, *_ in r.fetches[4:]), "closed circuit should not wait again"
+    assert not r.failed
+    return r
+
+
+def scenario_breaker_gives_up() -> Run:
+    """
+    domain ที่โดน block ตลอด: probe หลัง cooldown ล้มเหลว -> พักต่อ จน error budget หมด -> เลิกลองทุก URL
+    (ธนาคารอื่นในคิวทำเสร็จก่อนโดยไม่ต้องรอ)
+    """
+    r = run({'bank-x.test': ['blocked']},
+            [('bank-x.test', f'/x{i}') for i in range(1, 5)] + [('bank-y.test', '/y1')])
+    assert r.urls()[:2] == ['x1', 'y1'], r.urls()
+    assert r.hits['bank-x.test'] == POLICY.domain_error_budget, r.hits
+    assert r.sleeps.count(300.0) >= 2, r.sleeps           # probe แต่ละครั้งรอ cooldown เต็ม
+    assert set(r.failed) == {'x1', 'x2', 'x3', 'x4'}, r.failed
+    return r
+
+
+def scenario_min_interval() -> Run:
+    """request ที่สำเร็จติดกันของ domain เดียวกันเว้นระยะ min_interval (domain อื่นสลับเข้ามาได้โดยไม่ต้องรอ)"""
+    policy = POLICY._replace(min_interval=3.0, max_interval=3.0)
+    r = run({}, [('bank-f.test', '/f1'), ('bank-f.test', '/f2'), ('bank-g.test', '/g1'), ('bank-f.test', '/f3')],
+            policy=policy)
+    assert r.urls() == ['f1', 'g1', 'f2', 'f3'], r.urls()
+    assert [at for at, *_ in r.fetches] == [0.0, 0.0, 3.0, 6.0], r.fetches
+    assert r.sleeps == [3.0, 3.0], r.sleeps
+    assert not r.failed
+    return r
+
+
+SCENARIOS = [scenario_deferral, scenario_backoff, scenario_max_attempts, scenario_breaker_probe,
+             scenario_breaker_gives_up, scenario_min_interval]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FetchScheduler against a scripted fake server")
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        logging.getLogger('fetch_scheduler').setLevel(logging.ERROR)
+
+    failures = 0
+    for scenario in SCENARIOS:
+        name = scenario.__name__.replace('scenario_', '')
+        try:
+            result = scenario()
+        except AssertionError as e:
+            failures += 1
+            print(f"FAIL  {name}: {e}")
+            continue
+        print(f"ok    {name}")
+        if args.verbose:
+            print("      " + ", ".join(f"{at:.0f}s {url.rsplit('/', 1)[1]}={status}"
+                                       for at, url, status in result.fetches))
+            print(f"      waits: {result.sleeps}  failed: {result.failed or '-'}")
+    print(f"\n{len(SCENARIOS) - failures}/{len(SCENARIOS)} scenarios passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
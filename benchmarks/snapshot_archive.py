@@ -0,0 +1,123 @@
+"""
+วัดขนาด / ความเร็วของ snapshot_store เทียบกับการเก็บ HTML เป็นไฟล์แยก (แบบ debug_full_page.html)
+
+    python benchmarks/snapshot_archive.py
+    python benchmarks/snapshot_archive.py --urls 200 --runs 30 --change-rate 0.2
+
+จำลองการ scrape ทุกวัน: แต่ละรอบโหลดทุก URL และมีเพียง --change-rate ของหน้าที่เนื้อหาเปลี่ยน
+รายงาน: ขนาดบนดิสก์, เวลาเขียน, เวลาเปิดคลัง + หา snapshot ล่าสุดของทุก URL, และเวลาอ่านหน้าแบบสุ่ม
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from snapshot_store import SnapshotStore  # noqa: E402
+
+DEFAULT_PAGE = os.path.join(REPO_ROOT, 'debug_full_page.html')
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def build_pages(page: str, urls: int, page_chars: int):
+    """หน้าตั้งต้นของแต่ละ URL: ตัดจากหน้าจริงคนละช่วง (ไม่มีไฟล์ -> สร้างตารางสังเคราะห์)"""
+    if page and os.path.exists(page):
+        with open(page, encoding='utf-8') as f:
+            base = f.read()
+    else:
+        base = "".join(f"<tr><td>นายทดสอบ{i} นามสกุล{i}</td><td>รองผู้จัดการใหญ่</td></tr>" for i in range(5000))
+    step = max(1, (len(base) - page_chars) // max(urls, 1))
+    return [f"<!-- bank {i} -->" + base[i * step:i * step + page_chars] for i in range(urls)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Snapshot archive vs loose HTML files")
+    parser.add_argument('--urls', type=int, default=100)
+    parser.add_argument('--runs', type=int, default=20, help="simulated daily scrapes")
+    parser.add_argument('--change-rate', type=float, default=0.1, help="fraction of pages that change per run")
+    parser.add_argument('--page', default=DEFAULT_PAGE)
+    parser.add_argument('--page-chars', type=int, default=200_000)
+    parser.add_argument('--reads', type=int, default=500, help="random snapshot reads")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    pages = build_pages(args.page, args.urls, args.page_chars)
+    urls = [f"https://bank{i}.example/executives" for i in range(args.urls)]
+    workdir = tempfile.mkdtemp(prefix='snapshot-bench-')
+    loose_dir = os.path.join(workdir, 'loose')
+    archive_dir = os.path.join(workdir, 'archive')
+    os.makedirs(loose_dir)
+
+    try:
+        loose_seconds = archive_seconds = 0.0
+        fetches = []       # (run, url index) ของทุกการโหลด
+        started = time.time() - args.runs * 86400
+        with SnapshotStore(archive_dir) as store:
+            for run in range(args.runs):
+                for i, url in enumerate(urls):
+                    if run and rng.random() < args.change_rate:
+                        pages[i] += f"<!-- changed run {run} -->"
+                    start = time.perf_counter()
+                    with open(os.path.join(loose_dir, f"{i}_{run}.html"), 'w', encoding='utf-8') as f:
+                        f.write(pages[i])
+                    loose_seconds += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    store.put(url, pages[i], fetched_at=started + run * 86400 + i)
+                    archive_seconds += time.perf_counter() - start
+                    fetches.append((run, i))
+
+        total = len(fetches)
+        loose_bytes, archive_bytes = directory_size(loose_dir), directory_size(archive_dir)
+        print(f"{total} fetches ({args.urls} URLs x {args.runs} runs, {args.change_rate:.0%} change per run)\n")
+        print(f"{'':<10}{'disk MB':>10}{'write s':>10}")
+        print(f"{'loose':<10}{loose_bytes / 1e6:>10.1f}{loose_seconds:>10.2f}")
+        print(f"{'archive':<10}{archive_bytes / 1e6:>10.1f}{archive_seconds:>10.2f}"
+              f"   ({loose_bytes / max(archive_bytes, 1):.0f}x smaller)")
+
+        # เปิดคลังใหม่ (เหมือน process replay) แล้วหาหน้าล่าสุดก่อนวันกลางของทุก URL
+        start = time.perf_counter()
+        with SnapshotStore(archive_dir) as store:
+            opened = time.perf_counter() - start
+            cutoff = started + (args.runs // 2) * 86400
+            start = time.perf_counter()
+            latest = [store.latest(url, before=cutoff) for url in urls]
+            lookup = time.perf_counter() - start
+            start = time.perf_counter()
+            scanned = sum(1 for _ in store.records(since=cutoff))
+            scan = time.perf_counter() - start
+
+            sample = [rng.randrange(total) for _ in range(args.reads)]
+            records = list(store.records())
+            start = time.perf_counter()
+            for row in sample:
+                store.read(records[row])
+            archive_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in sample:
+            run, i = fetches[row]
+            with open(os.path.join(loose_dir, f"{i}_{run}.html"), encoding='utf-8') as f:
+                f.read()
+        loose_read = time.perf_counter() - start
+
+        print(f"\nopen archive: {opened * 1000:.2f} ms | latest() for {len(latest)} URLs: {lookup * 1000:.1f} ms | "
+              f"scan {scanned} records since cutoff: {scan * 1000:.1f} ms")
+        print(f"random reads ({args.reads}): archive {archive_read / args.reads * 1000:.2f} ms/page, "
+              f"loose files {loose_read / args.reads * 1000:.2f} ms/page")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
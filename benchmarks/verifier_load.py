@@ -0,0 +1,237 @@
+"""
+Load test ของ stage LLM: ยิง Verifier.verify พร้อมกันหลาย thread ใส่ ollama_stub (หรือ Ollama จริงด้วย --url)
+
+    python benchmarks/verifier_load.py                                   # stub, concurrency 1,4,8
+    python benchmarks/verifier_load.py -c 16 -n 200 --parallel 4 --latency 0.5 --malformed-rate 0.05
+    python benchmarks/verifier_load.py --url http://localhost:11434/api/generate -c 2 -n 10
+
+รายงานต่อระดับ concurrency: throughput, latency p50/p95/p99, เวลาแปลงหน้า / สร้าง prompt, timeout / error,
+อัตราที่ _validate_and_clean_result ตัดรายการ missing_names ทิ้ง และสรุปการทำงานของแต่ละ tier ใน cascade
+(รวม TTFT / token ที่ถูก eval ต่อ request - ใช้ --prompt-tokens-per-sec / --load-seconds ให้ stub คิดเวลา prompt cache)
+"""
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from ollama_stub import OllamaStub, load_recordings  # noqa: E402
+from verifier import (OLLAMA_MODEL, OLLAMA_NUM_CTX, VERIFY_PAGE_CHARS, ModelTier, Verifier,  # noqa: E402
+                      _NAME_CANDIDATE_RE)
+
+DEFAULT_PAGE = os.path.join(REPO_ROOT, 'debug_full_page.html')
+
+# คำตอบที่ใช้ replay ถ้าไม่ระบุ --replay: มีทั้งรายการที่ต้องผ่านและที่ต้องถูกตัดทิ้ง
+SAMPLE_RESPONSES = [
+    {"is_complete": True, "missing_names": [], "extra_names": []},
+    {"is_complete": False, "missing_names": [
+        {"full_name": "นางสาวพัชรา ศรีสวัสดิ์", "position": "รองผู้จัดการใหญ่", "confidence": 0.93},
+    ], "extra_names": []},
+    {"is_complete": False, "missing_names": [
+        {"full_name": "นายสมชาย ใจดี", "position": "กรรมการ", "confidence": 0.99},            # ชื่อตัวอย่าง
+        {"full_name": "นายวิทยา มั่นคง", "position": "ผู้ช่วยผู้จัดการใหญ่", "confidence": 0.5},  # confidence ต่ำ
+        {"full_name": "นางอรุณี แสงทอง", "position": "", "confidence": 0.9},                  # ไม่มีตำแหน่ง
+        {"full_name": "นางอรุณี แสงทอง", "position": "ผู้ช่วยผู้จัดการใหญ่", "confidence": 0.9},
+    ], "extra_names": ["นายทดสอบ ระบบ"]},
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank percentile"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class MeasuredVerifier(Verifier):
+    """Verifier ที่นับเวลาแปลงหน้า / สร้าง prompt และจำนวนรายการก่อน/หลัง _validate_and_clean_result"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.parse_seconds = []
+        self.prompt_seconds = []
+        self.items_returned = 0
+        self.items_kept = 0
+        self.invalid_results = 0
+
+    def _page_text(self, live_html_content: str) -> str:
+        if self._text_cache[0] is live_html_content:
+            return super()._page_text(live_html_content)
+        start = time.perf_counter()
+        text = super()._page_text(live_html_content)
+        with self._lock:
+            self.parse_seconds.append(time.perf_counter() - start)
+        return text
+
+    def _create_prompt(self, scraped_records_string: str, live_html_content: str, bank_name: str,
+                       page_chars: int = VERIFY_PAGE_CHARS) -> str:
+        start = time.perf_counter()
+        prompt = super()._create_prompt(scraped_records_string, live_html_content, bank_name, page_chars)
+        with self._lock:
+            self.prompt_seconds.append(time.perf_counter() - start)
+        return prompt
+
+    def _validate_and_clean_result(self, result: Dict) -> Dict:
+        cleaned = super()._validate_and_clean_result(result)
+        raw = result.get('missing_names') if isinstance(result, dict) else None
+        with self._lock:
+            if not isinstance(raw, list):
+                self.invalid_results += 1
+            else:
+                self.items_returned += len(raw)
+                self.items_kept += len(cleaned['missing_names'])
+        return cleaned
+
+
+def classify(result: Dict) -> str:
+    """ผลของ verify() หนึ่งครั้ง: ok / timeout / malformed / busy / http_error / error"""
+    error = result.get('error')
+    if error is None:
+        return 'ok'
+    if 'timed out' in error or 'Timeout' in error:
+        return 'timeout'
+    if '503' in error:
+        return 'busy'
+    if 'Server Error' in error or 'Client Error' in error:
+        return 'http_error'
+    if 'Expecting' in error or 'Unterminated' in error or 'JSON' in error or 'delimiter' in error:
+        return 'malformed'
+    return 'error'
+
+
+def run_level(verifier: MeasuredVerifier, records: List[Dict], html: str, concurrency: int, requests: int,
+              complete_rate: float, seed: int) -> Dict:
+    latencies = []
+    outcomes = Counter()
+    lock = threading.Lock()
+    rng = random.Random(seed)
+    # แต่ละ request: roster ครบ (rules ตัดสินได้) หรือขาด 3 คน (ต้องส่งต่อ LLM)
+    workloads = [records if rng.random() < complete_rate else records[3:] for _ in range(requests)]
+
+    def one(i):
+        # หน้าเว็บคนละ object ต่อ request (เหมือนงานจริง ไม่ให้ cache ของ _page_text ช่วย)
+        page = f"{html}<!-- request {i} -->"
+        start = time.perf_counter()
+        result = verifier.verify(workloads[i], page, "Load Test Bank")
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            outcomes[classify(result)] += 1
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    wall = time.perf_counter() - wall_start
+    return {'latencies': latencies, 'outcomes': outcomes, 'wall': wall}
+
+
+def build_workload(page: str, records: int):
+    """
+    Returns:
+        (roster ที่ครบตามชื่อในหน้า, html) - ไม่มีไฟล์หน้าเว็บจะสร้างตารางสังเคราะห์ records แถว
+    """
+    if page and os.path.exists(page):
+        with open(page, encoding='utf-8') as f:
+            html = f.read()
+    else:
+        rows = "".join(f"<tr><td>นายทดสอบ{i} นามสกุล{i}</td><td>รองผู้จัดการใหญ่</td></tr>" for i in range(records))
+        html = f"<html><body><table>{rows}</table></body></html>"
+    names = dict.fromkeys(_NAME_CANDIDATE_RE.findall(Verifier()._page_text(html)))
+    scraped = [{'Full_Name': f"{first} {surname}", 'Position': 'รองผู้จัดการใหญ่'} for first, surname in names]
+    return scraped, html
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Verifier.verify load test against the Ollama stub")
+    parser.add_argument('-c', '--concurrency', default='1,4,8', help="comma-separated concurrency levels")
+    parser.add_argument('-n', '--requests', type=int, default=40, help="requests per concurrency level")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Verifier request timeout in seconds")
+    parser.add_argument('--page', default=DEFAULT_PAGE, help="HTML page sent as live content")
+    parser.add_argument('--records', type=int, default=100, help="rows of the synthetic page when --page is missing")
+    parser.add_argument('--complete-rate', type=float, default=0.7,
+                        help="fraction of requests whose scraped roster already has every name on the page")
+    parser.add_argument('--url', help="real Ollama endpoint instead of the stub")
+    parser.add_argument('--model', default=OLLAMA_MODEL, help="main model name (default: %(default)s)")
+    parser.add_argument('--single-tier', action='store_true',
+                        help="send every request straight to the main model (no rules / fast-model cascade)")
+
+    stub_options = parser.add_argument_group('stub')
+    stub_options.add_argument('--replay', metavar='JSONL', help="recorded responses (default: built-in samples)")
+    stub_options.add_argument('--latency', type=float, default=0.2)
+    stub_options.add_argument('--tokens-per-sec', type=float, default=200.0)
+    stub_options.add_argument('--prompt-tokens-per-sec', type=float, default=0.0,
+                              help="prompt eval speed outside the cached prefix (0 = part of --latency)")
+    stub_options.add_argument('--load-seconds', type=float, default=0.0,
+                              help="model load time when not resident or num_ctx changes")
+    stub_options.add_argument('--parallel', type=int, default=2, help="stub OLLAMA_NUM_PARALLEL")
+    stub_options.add_argument('--max-queue', type=int, default=512)
+    stub_options.add_argument('--malformed-rate', type=float, default=0.05)
+    stub_options.add_argument('--error-rate', type=float, default=0.02)
+    stub_options.add_argument('--stall-rate', type=float, default=0.0)
+    stub_options.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    # ไม่ให้ log ต่อ request ของ Verifier กลบผล
+    logging.basicConfig(level=logging.CRITICAL)
+    levels = [int(level) for level in args.concurrency.split(',')]
+    records, html = build_workload(args.page, args.records)
+
+    stub = None
+    url = args.url
+    if not url:
+        recordings = load_recordings(args.replay) if args.replay else [
+            {'response': json.dumps(response, ensure_ascii=False)} for response in SAMPLE_RESPONSES
+        ]
+        stub = OllamaStub(recordings, latency=args.latency, tokens_per_sec=args.tokens_per_sec,
+                          parallel=args.parallel, max_queue=args.max_queue, malformed_rate=args.malformed_rate,
+                          error_rate=args.error_rate, stall_rate=args.stall_rate, seed=args.seed,
+                          prompt_tokens_per_sec=args.prompt_tokens_per_sec, load_seconds=args.load_seconds).start()
+        url = stub.url
+        print(f"stub: latency {args.latency}s, {args.tokens_per_sec:g} tok/s, parallel {args.parallel}, "
+              f"malformed {args.malformed_rate:.0%}, 500s {args.error_rate:.0%}, stalls {args.stall_rate:.0%}")
+    print(f"workload: {len(records)} records, page {len(html):,} chars, {args.complete_rate:.0%} complete rosters, "
+          f"timeout {args.timeout}s\n")
+
+    header = (f"{'conc':>5}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'parse ms':>10}{'prompt ms':>11}"
+              f"{'timeout':>9}{'malformed':>11}{'busy':>6}{'http':>6}{'other':>7}{'rejected':>10}")
+    print(header)
+    summaries = []
+    try:
+        for level in levels:
+            tiers = [ModelTier('full', args.model, args.timeout, OLLAMA_NUM_CTX, VERIFY_PAGE_CHARS)] \
+                if args.single_tier else None
+            verifier = MeasuredVerifier(ollama_url=url, model=args.model, timeout=args.timeout, tiers=tiers)
+            result = run_level(verifier, records, html, level, args.requests, args.complete_rate, args.seed)
+            latencies = [seconds * 1000 for seconds in result['latencies']]
+            outcomes = result['outcomes']
+            rejected = 1 - verifier.items_kept / verifier.items_returned if verifier.items_returned else 0.0
+            parse_ms = percentile(verifier.parse_seconds, 50) * 1000
+            prompt_ms = percentile(verifier.prompt_seconds, 50) * 1000
+            print(f"{level:>5}{args.requests / result['wall']:>8.2f}{percentile(latencies, 50):>9.0f}"
+                  f"{percentile(latencies, 95):>9.0f}{percentile(latencies, 99):>9.0f}{parse_ms:>10.1f}{prompt_ms:>11.1f}"
+                  f"{outcomes['timeout']:>9}{outcomes['malformed']:>11}{outcomes['busy']:>6}"
+                  f"{outcomes['http_error']:>6}{outcomes['error']:>7}{rejected:>10.0%}")
+            summaries.append((level, verifier.cascade_summary()))
+    finally:
+        if stub:
+            stub.stop()
+            print(f"\nstub stats: {stub.stats}")
+    for level, summary in summaries:
+        print(f"\ncascade at concurrency {level}:\n{summary}")
+    print("rejected = missing_names entries dropped by _validate_and_clean_result")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
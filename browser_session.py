@@ -0,0 +1,149 @@
+import random
+import logging
+from typing import Optional, Set
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+BROWSER_MAX_PAGES = 25          # เปิดใหม่ทุกๆ N หน้า กัน memory leak ของ Chrome
+BROWSER_MAX_MEMORY_MB = 1500    # เปิดใหม่เมื่อ RSS ของ Chrome ทั้งหมดเกินค่านี้ (ต้องมี psutil)
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+]
+
+
+def create_chrome_driver():
+    """สร้าง headless Chrome ตาม option มาตรฐานของ scraper (import Selenium ตอนเปิด browser ครั้งแรก)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
+    # performance log ใช้นับ request / bytes ของแต่ละหน้า (resource_blocking.collect_network_stats)
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(60)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def chrome_memory_mb(driver) -> Optional[float]:
+    """RSS รวมของ chromedriver และ Chrome ทุก process (MB) หรือ None ถ้าไม่มี psutil"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes if p.is_running()) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class BrowserSession:
+    """
+    Headless Chrome ที่เปิดค้างไว้ 1 ตัวต่อ worker ใช้ร่วมกันหลาย URL
+    - acquire(): คืน driver ที่อยู่ใน tab ใหม่ที่สะอาด (ไม่มี cookie / storage ของธนาคารก่อนหน้า)
+    - release(): ล้าง cookie / storage ของ origin ที่เข้าไป แล้วคืน tab
+    - เปิด Chrome ใหม่เมื่อใช้ครบ max_pages หน้า หรือ memory เกิน max_memory_mb
+    """
+    def __init__(self, max_pages: int = BROWSER_MAX_PAGES, max_memory_mb: float = BROWSER_MAX_MEMORY_MB):
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver = None
+        self.pages_served = 0
+        self._visited_origins: Set[str] = set()
+
+    def acquire(self):
+        if self.driver is not None and self._needs_recycle():
+            self._quit()
+
+        if self.driver is None:
+            self.driver = create_chrome_driver()
+            self.pages_served = 0
+            logger.info(" ---- WebDriver setup completed!!! ----- ")
+        else:
+            self._open_fresh_tab()
+
+        self.pages_served += 1
+        return self.driver
+
+    def release(self):
+        if self.driver is None:
+            return
+        try:
+            origin = self._origin(self.driver.current_url)
+            if origin:
+                self._visited_origins.add(origin)
+            self._clear_state()
+        except Exception as e:
+            logger.warning(" ---- Could not clear browser state, recycling browser: %s ---- ", e)
+            self._quit()
+
+    def close(self):
+        self._quit()
+
+    def __enter__(self) -> 'BrowserSession':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _origin(url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https'):
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _needs_recycle(self) -> bool:
+        if self.pages_served >= self.max_pages:
+            logger.info(" ---- Recycling browser after %s pages ---- ", self.pages_served)
+            return True
+        memory = chrome_memory_mb(self.driver)
+        if memory is not None and memory >= self.max_memory_mb:
+            logger.info(" ---- Recycling browser (memory %.0f MB >= %s MB) ---- ", memory, self.max_memory_mb)
+            return True
+        return False
+
+    def _open_fresh_tab(self):
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+
+    def _clear_state(self):
+        self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        for origin in self._visited_origins:
+            self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': origin,
+                'storageTypes': 'local_storage,session_storage,indexeddb,websql,service_workers,cache_storage',
+            })
+        self._visited_origins.clear()
+        self.driver.get('about:blank')
+
+    def _quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+            logger.info(" ----  WebDriver closed ---- ")
+        except Exception as e:
+            logger.error(" ---- Error closing WebDriver: %s ---- ", e)
+        self.driver = None
+        self._visited_origins.clear()
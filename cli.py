@@ -0,0 +1,282 @@
+"""
+Command line ของ bank executive scraper
+
+    python cli.py -i urls.txt -i banks.jsonl --workers 2 --output csv,sqlite
+    python cli.py --snapshots 'snapshots/*.html' --no-verify
+    python cli.py --replay output/snapshots --busi-dt 2024-06-30 --fresh     # extract ซ้ำจากคลัง snapshot
+    python cli.py https://www.kasikornbank.com/th/about/Pages/executives.aspx --dry-run
+    python cli.py --discover kasikorn --discover scb --dry-run                 # หาหน้าผู้บริหารจากหน้าแรกของธนาคาร
+    python cli.py --resume --busi-dt 2024-06-30                               # ทำ URL ที่ค้างในคิวจากรอบที่ถูกขัดจังหวะ
+
+import เฉพาะ stdlib ที่ top-level: Selenium / BeautifulSoup / requests ถูก import ตอนเริ่มทำงานจริงเท่านั้น
+(--help และ --dry-run จึงเริ่มได้ทันที)
+"""
+import os
+import re
+import sys
+import glob
+import json
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from job_queue import JOB_QUEUE_PATH, JobQueue
+from log_setup import LOG_PROFILES, flush_logging, level_arguments, setup_logging
+from snapshot_store import SNAPSHOT_DIR, SnapshotStore
+
+# ชื่อ backend ที่รองรับ (ตรงกับ output_sinks.OUTPUT_SINKS ไม่ import ตรงๆ เพื่อให้เริ่มเร็ว)
+OUTPUT_BACKEND_CHOICES = ('csv', 'sqlite', 'parquet', 'people')
+DEFAULT_OUTPUT = 'csv,sqlite,people'
+
+_CANONICAL_RE = re.compile(
+    r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)'
+    r'|<meta[^>]+property=["\']og:url["\'][^>]+content=["\']([^"\']+)'
+    r'|saved from url=\(\d+\)(\S+)',
+    re.IGNORECASE,
+)
+_SNAPSHOT_HEAD_BYTES = 200_000
+
+
+def read_url_file(path: str) -> List[str]:
+    """
+    อ่าน URL จากไฟล์
+    - .jsonl: 1 JSON object ต่อบรรทัด ใช้ key 'url' (หรือ 'source_url')
+    - อื่นๆ: 1 URL ต่อบรรทัด ข้ามบรรทัดว่างและบรรทัดที่ขึ้นต้นด้วย #
+    """
+    urls = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if path.endswith('.jsonl'):
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    raise SystemExit(f"{path}:{line_no}: invalid JSON ({e})")
+                url = entry.get('url') or entry.get('source_url') if isinstance(entry, dict) else None
+                if not url:
+                    raise SystemExit(f"{path}:{line_no}: missing 'url'")
+                urls.append(url)
+            else:
+                urls.append(line)
+    return urls
+
+
+def snapshot_source_url(path: str) -> str:
+    """หา URL ต้นทางของ HTML ที่บันทึกไว้ (canonical / og:url / 'saved from url') หรือใช้ file:// ถ้าไม่พบ"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        head = f.read(_SNAPSHOT_HEAD_BYTES)
+    match = _CANONICAL_RE.search(head)
+    if match:
+        return next(group for group in match.groups() if group)
+    return 'file://' + os.path.abspath(path)
+
+
+def collect_targets(args) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Returns:
+        (urls ตามลำดับไม่ซ้ำ, snapshots: url -> path)
+    """
+    urls = list(args.urls)
+    for path in args.input:
+        urls.extend(read_url_file(path))
+
+    if args.discover:
+        # import ตรงนี้: crawler ใช้ requests / BeautifulSoup
+        from executive_crawler import discover
+        try:
+            reports = discover(args.discover, top=args.discover_top)
+        except ValueError as e:
+            raise SystemExit(f"cli.py: {e}")
+        for report in reports:
+            if not report.candidates:
+                print(f" ---- No executive page found from {report.seed} "
+                      f"({report.requests} requests) ---- ", file=sys.stderr)
+            urls.extend(candidate.url for candidate in report.candidates)
+
+    snapshots = {}
+    for pattern in args.snapshots:
+        paths = sorted(glob.glob(pattern, recursive=True))
+        if not paths:
+            print(f" ---- No snapshot matches '{pattern}' ---- ", file=sys.stderr)
+        for path in paths:
+            url = snapshot_source_url(path)
+            snapshots[url] = path
+            urls.append(url)
+
+    # ไม่ระบุ URL อื่น: ใช้ทุก URL ในคลังที่มีหน้าใช้ได้ภายในวันทำการ
+    if args.replay and not urls:
+        until = (datetime.strptime(args.busi_dt, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+        with SnapshotStore(args.replay) as store:
+            urls.extend(dict.fromkeys(record.url for record in store.records(until=until, status='ok')))
+
+    return list(dict.fromkeys(urls)), snapshots
+
+
+def parse_backends(value: str) -> List[str]:
+    backends = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in backends if name not in OUTPUT_BACKEND_CHOICES]
+    if unknown or not backends:
+        raise argparse.ArgumentTypeError(
+            f"unknown backend(s) {', '.join(unknown) or '-'} (choose from {', '.join(OUTPUT_BACKEND_CHOICES)})"
+        )
+    return backends
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Scrape bank executive rosters into CSV / SQLite / Parquet and the people index.",
+    )
+    parser.add_argument('urls', nargs='*', help="executive page URLs")
+
+    source = parser.add_argument_group('input')
+    source.add_argument('-i', '--input', action='append', default=[], metavar='FILE',
+                        help="URL list: .txt (one URL per line) or .jsonl (objects with 'url'); repeatable")
+    source.add_argument('-s', '--snapshots', action='append', default=[], metavar='GLOB',
+                        help="saved HTML pages to extract without a browser, e.g. 'snapshots/**/*.html'; repeatable")
+    source.add_argument('--discover', action='append', default=[], metavar='BANK',
+                        help="crawl from the bank's home page (keyword, Thai name, domain or URL) to find its "
+                             "executive page; repeatable")
+    source.add_argument('--discover-top', type=int, default=1, metavar='N',
+                        help="pages to take per --discover bank (default: 1)")
+    source.add_argument('--replay', metavar='DIR',
+                        help="use the latest archived page (up to --busi-dt) instead of the browser; "
+                             "with no URLs given, replays every URL in the archive")
+
+    run = parser.add_argument_group('run')
+    run.add_argument('-w', '--workers', type=int, default=1,
+                     help="worker processes sharing the job queue, one Chrome each (default: 1)")
+    run.add_argument('--busi-dt', default=datetime.now().strftime("%Y-%m-%d"),
+                     help="business date of the run, YYYY-MM-DD (default: today)")
+    run.add_argument('--no-verify', action='store_true', help="skip LLM verification")
+    run.add_argument('--dry-run', action='store_true', help="list what would be processed and exit")
+
+    cache = parser.add_argument_group('cache')
+    cache.add_argument('--queue', default=JOB_QUEUE_PATH, metavar='PATH',
+                       help=f"job queue / checkpoint database (default: {JOB_QUEUE_PATH})")
+    cache.add_argument('--resume', action='store_true',
+                       help="also process every URL still pending in the queue for the business date "
+                            "(e.g. left by an interrupted run); URLs are optional with --resume")
+    cache.add_argument('--fresh', action='store_true',
+                       help="drop existing checkpoints of these URLs for the business date and start over")
+    cache.add_argument('--archive', default=SNAPSHOT_DIR, metavar='DIR',
+                       help=f"compressed archive of every page fetched by the browser, blocked and failed pages "
+                            f"included (default: {SNAPSHOT_DIR})")
+    cache.add_argument('--no-archive', action='store_true', help="do not archive fetched pages")
+
+    log = parser.add_argument_group('logging')
+    log.add_argument('--log-profile', choices=sorted(LOG_PROFILES),
+                     help="default: INFO | quiet: warnings and per-URL results only | verbose: every candidate "
+                          "(default: $SCRAPER_LOG_PROFILE or default)")
+    log.add_argument('--log-level', action='append', default=[], metavar='NAME=LEVEL',
+                     help="per-subsystem level, e.g. scraper.extract=DEBUG,verifier=WARNING; repeatable "
+                          "(default: $SCRAPER_LOG_LEVELS)")
+
+    output = parser.add_argument_group('output')
+    output.add_argument('-o', '--output', type=parse_backends, default=parse_backends(DEFAULT_OUTPUT),
+                        metavar='BACKENDS', help=f"comma-separated: {', '.join(OUTPUT_BACKEND_CHOICES)} "
+                                                 f"(default: {DEFAULT_OUTPUT})")
+    return parser
+
+
+def configure_logging(args):
+    try:
+        setup_logging(args.log_profile, level_arguments(args.log_level) or None)
+    except ValueError as e:
+        raise SystemExit(f"cli.py: {e}")
+
+
+def _run_worker(args, urls: List[str], snapshots: Dict[str, str]):
+    # import ตรงนี้เพื่อให้ Selenium / BeautifulSoup ถูกโหลดเฉพาะ process ที่ทำงานจริง
+    from Ai_scraper import process_queue
+
+    configure_logging(args)
+    try:
+        process_queue(args.busi_dt, queue_path=args.queue, snapshots=snapshots,
+                      backends=args.output, verify=not args.no_verify,
+                      archive_dir=None if args.no_archive else args.archive, replay_dir=args.replay,
+                      urls=urls)
+    finally:
+        # worker process จบด้วย os._exit (ไม่ผ่าน atexit) - เขียน log ที่ค้างในคิวให้หมดก่อน
+        flush_logging()
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    configure_logging(args)
+
+    urls, snapshots = collect_targets(args)
+    # คิวใช้ร่วมกันหลายคำสั่ง: ปกติทำเฉพาะ URL ของคำสั่งนี้ --resume จึงรวม URL ที่ค้างในคิวด้วย
+    if args.resume and os.path.exists(args.queue):
+        with JobQueue(args.queue) as queue:
+            urls = list(dict.fromkeys(urls + queue.pending_urls(args.busi_dt)))
+    if not urls:
+        if args.resume:
+            parser.error(f"nothing pending in {args.queue} for {args.busi_dt}")
+        parser.error("no URLs given (pass URLs, --input FILE, --snapshots GLOB, --discover BANK, --replay DIR "
+                     "or --resume)")
+
+    if args.dry_run:
+        finished = set()
+        if os.path.exists(args.queue) and not args.fresh:
+            with JobQueue(args.queue) as queue:
+                finished = {result['url'] for result in queue.results(args.busi_dt)}
+        print(f"Business date: {args.busi_dt} | queue: {args.queue} | workers: {args.workers} | "
+              f"output: {','.join(args.output)} | LLM verify: {'off' if args.no_verify else 'on'}")
+        replay = SnapshotStore(args.replay) if args.replay else None
+        until = (datetime.strptime(args.busi_dt, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+        for url in urls:
+            archived = replay.latest(url, before=until) if replay else None
+            if archived is not None:
+                source = f"archive {archived.content_hash[:12]} from {archived.fetched:%Y-%m-%d %H:%M}"
+            else:
+                source = f"snapshot {snapshots[url]}" if url in snapshots else "browser"
+            print(f"  [{'done' if url in finished else 'todo'}] {url} ({source})")
+        if replay is not None:
+            replay.close()
+        return 0
+
+    with JobQueue(args.queue) as queue:
+        if args.fresh:
+            queue.reset(urls, args.busi_dt)
+        queue.enqueue(urls, args.busi_dt)
+        pending = set(queue.pending_urls(args.busi_dt))
+
+    todo = [url for url in urls if url in pending]
+    print(f" ---- {len(urls)} URL(s), {len(todo)} to process for {args.busi_dt} "
+          f"({len(urls) - len(todo)} already finished) ---- ")
+
+    if todo:
+        if args.workers == 1:
+            _run_worker(args, todo, snapshots)
+        else:
+            import multiprocessing
+
+            workers = [
+                multiprocessing.Process(target=_run_worker, args=(args, todo, snapshots), name=f"scraper-worker-{i}")
+                for i in range(min(args.workers, len(todo)))
+            ]
+            for worker in workers:
+                worker.start()
+            try:
+                for worker in workers:
+                    worker.join()
+            except KeyboardInterrupt:
+                # worker แต่ละตัวได้ SIGINT เองและคืน job เข้าคิว - รอให้ปิด Chrome ให้เรียบร้อย
+                for worker in workers:
+                    worker.join()
+
+    from Ai_scraper import print_summary
+    print_summary(args.busi_dt, queue_path=args.queue)
+
+    with JobQueue(args.queue) as queue:
+        return 1 if queue.failures(args.busi_dt) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+# ข้าม element ที่ถูกซ่อน (display:none, visibility:hidden, hidden, aria-hidden)
+# ถ้าเว็บซ่อนรายชื่อไว้ใน tab / accordion ที่ยังไม่เปิด ให้ตั้งเป็น False
+DOM_SKIP_HIDDEN = True
+
+# เดิน DOM ที่ render แล้วรอบเดียวใน browser แล้วคืน HTML โครงร่างที่มีเฉพาะ element ที่มีข้อความ
+# - ตัด script / style / nav / header / footer / media / form control และ element ที่ถูกซ่อน
+# - เก็บแค่ชื่อ tag + class (ใช้เป็น DOM path ของ site profile) และข้อความ (ยุบช่องว่างแล้ว)
+# - element ที่ไม่มีข้อความเลยจะถูกตัดทิ้งทั้งก้อน
+# - head เหลือแค่ title และ meta ที่ใช้ detect ชื่อธนาคาร / จัดประเภทหน้า
+DOM_CAPTURE_JS = r"""
+const skipHidden = arguments[0];
+const SKIP = new Set(['script', 'style', 'noscript', 'template', 'svg', 'math', 'iframe', 'frame', 'object',
+                      'embed', 'canvas', 'img', 'picture', 'video', 'audio', 'source', 'track', 'map',
+                      'nav', 'header', 'footer', 'head', 'meta', 'link', 'base',
+                      'input', 'select', 'option', 'button', 'textarea']);
+const META = new Set(['description', 'title', 'keywords', 'og:title', 'og:site_name']);
+
+const esc = s => s.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+const escAttr = s => esc(s).replace(/"/g, '&quot;');
+
+function isHidden(el) {
+    if (el.hidden || el.getAttribute('aria-hidden') === 'true') return true;
+    const style = getComputedStyle(el);
+    return style.display === 'none' || style.visibility === 'hidden';
+}
+
+function walk(el, out) {
+    const start = out.length;
+    let hasText = false;
+    for (const child of el.childNodes) {
+        if (child.nodeType === Node.TEXT_NODE) {
+            const text = child.nodeValue.replace(/\s+/g, ' ');
+            if (text.trim()) {
+                out.push(esc(text));
+                hasText = true;
+            }
+        } else if (child.nodeType === Node.ELEMENT_NODE) {
+            const tag = child.localName;
+            if (SKIP.has(tag)) continue;
+            if (tag === 'br') { out.push('<br>'); continue; }
+            if (skipHidden && isHidden(child)) continue;
+
+            const cls = child.getAttribute('class');
+            const open = out.length;
+            out.push(cls ? `<${tag} class="${escAttr(cls)}">` : `<${tag}>`);
+            if (walk(child, out)) {
+                out.push(`</${tag}>`);
+                hasText = true;
+            } else {
+                out.length = open;
+            }
+        }
+    }
+    if (!hasText) out.length = start;
+    return hasText;
+}
+
+const head = [`<title>${esc(document.title || '')}</title>`];
+for (const meta of document.querySelectorAll('meta[name], meta[property]')) {
+    const name = meta.getAttribute('name');
+    const key = (name || meta.getAttribute('property') || '').toLowerCase();
+    if (!META.has(key)) continue;
+    const attr = name ? 'name' : 'property';
+    head.push(`<meta ${attr}="${escAttr(key)}" content="${escAttr(meta.getAttribute('content') || '')}">`);
+}
+
+const body = [];
+if (document.body) walk(document.body, body);
+return `<html><head>${head.join('')}</head><body>${body.join('')}</body></html>`;
+"""
+
+
+def capture_visible_dom(driver, skip_hidden: bool = DOM_SKIP_HIDDEN) -> Optional[str]:
+    """
+    ดึง HTML โครงร่างของข้อความที่มองเห็นจาก DOM ที่ render แล้ว ด้วย script เดียว
+    (เล็กกว่า driver.page_source หลายสิบเท่า และ parse ได้ด้วย extract_executives_from_html เหมือนเดิม)
+    Returns:
+        HTML โครงร่าง หรือ None ถ้ารัน script ไม่สำเร็จ (ให้ใช้ page_source แทน)
+    """
+    try:
+        html = driver.execute_script(DOM_CAPTURE_JS, skip_hidden)
+    except Exception as e:
+        logger.warning(" ---- In-browser DOM capture failed: %s ---- ", e)
+        return None
+    return html if isinstance(html, str) else None
@@ -0,0 +1,683 @@
+"""
+Focused crawler: หาหน้า "คณะกรรมการ / ผู้บริหาร" ของธนาคารจากหน้าแรก แทนการดูแล URL ใน main() ด้วยมือ
+
+    python executive_crawler.py kasikorn scb                  # ธนาคารใน bank_registry (keyword / ชื่อ / domain)
+    python executive_crawler.py https://www.krungsri.com/ --top 3 --budget 60 -o urls.txt
+    python cli.py --discover kasikorn --discover scb           # ส่งหน้าที่เจอเข้า pipeline ต่อ
+
+- best-first: ให้คะแนนลิงก์ (ข้อความของลิงก์ + URL) และ URL ใน sitemap ด้วยคำเกี่ยวกับคณะกรรมการ/ผู้บริหาร
+  ทั้งไทยและอังกฤษ (LINK_KEYWORDS) แล้วโหลดเฉพาะลิงก์ที่ได้ถึง CRAWL_MIN_LINK_SCORE เรียงจากคะแนนสูงสุด
+- หน้าที่โหลดแล้วถูกตรวจด้วย page_status (404 / block / captcha ตกไป) และนับชื่อคนไทย + คำตำแหน่งในหน้า
+  หน้าที่มีชื่อถึง CRAWL_MIN_NAMES เป็น candidate (หยุดเมื่อได้ครบ top หน้า)
+- เคารพ robots.txt (Disallow / Crawl-delay), จำกัดจำนวน request ต่อธนาคาร (budget รวม robots / sitemap)
+  จำนวน request พร้อมกันต่อ host และระยะห่างระหว่าง request ของ host เดียวกัน
+- fetch ส่งเข้ามาได้ (ค่าเริ่มต้นใช้ requests) ทดสอบกับเว็บจำลองได้: benchmarks/crawler_mirror.py
+"""
+import io
+import re
+import sys
+import gzip
+import heapq
+import time
+import logging
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+from xml.etree import ElementTree
+
+import bank_registry
+from page_status import PageStatus, classify_page
+from log_setup import setup_logging
+from pattern_scanner import POSITION_KEYWORDS, TITLE_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+CRAWL_USER_AGENT = "Mozilla/5.0 (compatible; BankExecutiveCrawler/1.0)"
+CRAWL_BUDGET = 40              # request สูงสุดต่อธนาคาร (รวม robots.txt และ sitemap)
+CRAWL_MAX_DEPTH = 3            # จำนวนคลิกสูงสุดจากหน้าแรก
+CRAWL_CONCURRENCY = 4          # request พร้อมกันทั้งหมด
+CRAWL_PER_HOST = 2             # request พร้อมกันต่อ host
+CRAWL_DELAY = 1.0              # วินาทีขั้นต่ำระหว่าง request ของ host เดียวกัน (robots Crawl-delay ที่มากกว่าจะใช้แทน)
+CRAWL_TIMEOUT = 20             # วินาทีต่อ request
+CRAWL_MAX_BYTES = 5_000_000    # ขนาด response สูงสุดที่อ่าน
+CRAWL_TOP = 3                  # จำนวนหน้าที่คืนต่อธนาคาร (และหยุด crawl เมื่อเจอหน้าที่มีชื่อครบจำนวนนี้)
+CRAWL_MIN_LINK_SCORE = 1.5     # คะแนนลิงก์ขั้นต่ำที่จะโหลด
+CRAWL_URL_WEIGHT = 0.5         # น้ำหนักของคำใน URL เทียบกับข้อความของลิงก์
+CRAWL_DEPTH_PENALTY = 0.5      # หักคะแนนต่อความลึก (ลิงก์ที่ใกล้หน้าแรกมาก่อน)
+CRAWL_MIN_NAMES = 5            # จำนวนชื่อคนไทยขั้นต่ำของหน้าที่นับเป็นหน้า roster
+CRAWL_SHELL_SCORE = 6.0        # หน้า SPA ที่ยังไม่มีเนื้อหา (ต้อง render ด้วย browser) นับเป็น candidate ถ้าลิงก์ได้ถึงนี้
+NAME_WEIGHT = 0.5              # คะแนนต่อชื่อที่พบในหน้า
+NAME_CAP = 40
+SITEMAP_MAX_FILES = 4          # ไฟล์ sitemap สูงสุดต่อธนาคาร (รวม sitemap index)
+SITEMAP_MAX_URLS = 10_000      # URL สูงสุดที่อ่านจาก sitemap แต่ละไฟล์
+
+# (regex, น้ำหนัก) จับกับข้อความตัวพิมพ์เล็กที่แทน - _ / . ด้วยช่องว่างแล้ว - ตัวที่เจาะจงกว่าต้องมาก่อน
+LINK_KEYWORDS = (
+    # หน้า roster
+    (r'คณะผู้บริหาร', 5),
+    (r'คณะกรรมการ', 4),
+    (r'ผู้บริหาร', 4),
+    (r'กรรมการ', 2),
+    (r'โครงสร้าง(?:องค์กร|การจัดการ)', 2),
+    (r'\bboard ?of ?directors', 5),
+    (r'\b(?:top ?|senior ?)?management ?team', 4),
+    (r'\bexecutive', 4),
+    (r'\bboard', 3),
+    (r'\bdirector', 3),
+    (r'\bleadership', 3),
+    (r'\bmanagement', 2),
+    (r'\borgani[sz]ation ?(?:chart|structure)', 2),
+    # หน้ากลางที่มักลิงก์ไปหน้า roster
+    (r'เกี่ยวกับ', 1.5),
+    (r'\babout', 1.5),
+    (r'\bwho ?we ?are', 1.5),
+    (r'ข้อมูลองค์กร|\bcompany ?profile|\bcorporate ?(?:info|profile)', 1),
+    (r'บรรษัทภิบาล|การกำกับดูแลกิจการ|\bcorporate ?governance|\bgovernance', 1),
+    (r'นักลงทุนสัมพันธ์|\binvestor', 1),
+    # ส่วนของเว็บที่ไม่มี roster
+    (r'ข่าว|\bnews|\bpress', -3),
+    (r'สมัครงาน|ร่วมงาน|\bcareer|\bjobs?\b', -3),
+    (r'สินเชื่อ|\bloan', -3),
+    (r'บัตร|\bcards?\b', -3),
+    (r'โปรโมชั่น|\bpromotion', -3),
+    (r'ประกัน|\binsurance|กองทุน|\bfunds?\b', -3),
+    (r'สาขา|\bbranch|\batm\b', -3),
+    (r'เข้าสู่ระบบ|\blog ?in\b|\bsign ?in\b|\bregister', -3),
+    (r'ดาวน์โหลด|\bdownload|\bcalculator', -3),
+)
+# หน้าภาษาอังกฤษมีแต่ชื่อภาษาอังกฤษ (pipeline ต้องใช้ชื่อไทย)
+LANGUAGE_BONUS = ((re.compile(r'/en(?:/|$)|[?&]lang(?:uage)?=en'), -2.0), (re.compile(r'/th(?:/|$)'), 0.5))
+SKIP_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.zip', '.doc', '.docx',
+                   '.xls', '.xlsx', '.ppt', '.pptx', '.mp4', '.mp3', '.css', '.js', '.xml', '.json', '.ico')
+
+_KEYWORD_RE = re.compile('|'.join(f"({pattern})" for pattern, _ in LINK_KEYWORDS), re.IGNORECASE)
+_KEYWORD_WEIGHTS = [0.0] + [float(weight) for _, weight in LINK_KEYWORDS]   # index ตาม match.lastindex
+_SEPARATOR_RE = re.compile(r'[-_/.+=?&%]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+# ชื่อคนไทย: คำนำหน้า + ชื่อ + นามสกุล (ไม่ใช้ 'คุณ' เพราะชนกับคำทั่วไปอย่าง 'คุณภาพ')
+_THAI_NAME_RE = re.compile(
+    r'(?:' + '|'.join(re.escape(t) for t in sorted(set(TITLE_PREFIXES) - {'คุณ'}, key=len, reverse=True)) + r')'
+    r'\s*([\u0E00-\u0E7F]{2,30}\s+[\u0E00-\u0E7F]{2,30})'
+)
+_POSITION_RE = re.compile('|'.join(re.escape(k) for k in POSITION_KEYWORDS), re.IGNORECASE)
+_SITEMAP_NS_RE = re.compile(r'^\{[^}]*\}')
+_SCANNED = (PageStatus.OK, PageStatus.EMPTY_SHELL)
+
+
+class FetchResult(NamedTuple):
+    url: str              # URL สุดท้ายหลัง redirect
+    status: int           # HTTP status (0 = เชื่อมต่อไม่ได้)
+    content_type: str
+    body: bytes
+
+    @property
+    def text(self) -> str:
+        match = re.search(r'charset=([\w-]+)', self.content_type or '', re.IGNORECASE)
+        try:
+            return self.body.decode(match.group(1) if match else 'utf-8', errors='replace')
+        except LookupError:
+            return self.body.decode('utf-8', errors='replace')
+
+
+class CrawlCandidate(NamedTuple):
+    url: str
+    score: float
+    names: int            # จำนวนชื่อคนไทยในหน้า (0 = หน้า SPA ที่ต้อง render ด้วย browser)
+    positions: int        # จำนวนคำตำแหน่งในหน้า
+    link_score: float
+    depth: int
+    source: str           # 'seed' / 'link' / 'sitemap'
+    anchor: str
+
+
+class CrawlReport(NamedTuple):
+    seed: str
+    scope: str
+    candidates: List[CrawlCandidate]    # เรียงจากคะแนนสูงสุด ไม่เกิน top หน้า
+    requests: int                       # request ที่ใช้ไป (รวม robots / sitemap)
+    pages: int                          # หน้า HTML ที่โหลด
+    disallowed: int                     # ลิงก์ที่ robots.txt ห้าม (ไม่ได้โหลด)
+    failed: Dict[str, str]              # url -> เหตุผล (404 / blocked / HTTP error)
+    seconds: float
+
+
+class _Link(NamedTuple):
+    url: str
+    score: float
+    depth: int
+    source: str
+    anchor: str
+
+
+class _Task(NamedTuple):
+    kind: str             # 'robots' / 'sitemap' / 'page'
+    url: str
+    state: '_CrawlState'
+    link: Optional[_Link] = None
+
+
+class _Host:
+    def __init__(self, delay: float):
+        self.in_flight = 0
+        self.next_at = 0.0
+        self.delay = delay
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_pending = False
+
+
+class _CrawlState:
+    """สถานะการ crawl ของ seed หนึ่ง (ธนาคารหนึ่ง)"""
+    def __init__(self, seed: str, scope: str, budget: int, top: int, started: float):
+        self.seed = seed
+        self.scope = scope
+        self.budget = budget
+        self.top = top
+        self.started = started
+        self.frontier: List[Tuple[float, int, _Link]] = []
+        self.sitemaps: List[Tuple[float, str]] = []
+        self.sitemaps_checked = False
+        self.sitemap_files = 0
+        self.seen = {seed}
+        self.requests = 0
+        self.in_flight = 0
+        self.pages = 0
+        self.disallowed = 0
+        self.failed: Dict[str, str] = {}
+        self.candidates: List[CrawlCandidate] = []
+        self.link_scores: Dict[str, float] = {}     # url -> คะแนนลิงก์สูงสุดที่เคยเห็น (ทุกลิงก์ที่ชี้มา)
+        self.shells: Dict[str, _Link] = {}          # หน้า SPA ที่ยังไม่มีรายชื่อใน HTML
+
+    @property
+    def confirmed(self) -> int:
+        return sum(1 for candidate in self.candidates if candidate.names)
+
+    @property
+    def stopped(self) -> bool:
+        return self.confirmed >= self.top or self.requests >= self.budget
+
+    def has_work(self) -> bool:
+        return not self.stopped and bool(self.frontier or self.sitemaps)
+
+    def report(self, now: float) -> CrawlReport:
+        candidates = list(self.candidates)
+        for url, link in self.shells.items():
+            # ลิงก์ชี้ชัดว่าเป็นหน้า roster แต่เนื้อหาต้อง render ด้วย browser - ให้ pipeline ตัดสิน
+            score = max(link.score, self.link_scores.get(url, link.score))
+            if score >= CRAWL_SHELL_SCORE:
+                candidates.append(CrawlCandidate(url, round(score, 2), 0, 0, score, link.depth, link.source,
+                                                 link.anchor))
+        ranked = sorted(candidates, key=lambda c: (-(c.names > 0), -c.score))
+        return CrawlReport(self.seed, self.scope, ranked[:self.top], self.requests, self.pages,
+                           self.disallowed, self.failed, now - self.started)
+
+
+def keyword_score(text: str) -> float:
+    """ผลรวมน้ำหนักของ LINK_KEYWORDS ที่พบใน text (แต่ละคำนับครั้งเดียว)"""
+    if not text:
+        return 0.0
+    matched = {match.lastindex for match in _KEYWORD_RE.finditer(text)}
+    return sum(_KEYWORD_WEIGHTS[index] for index in matched)
+
+
+def link_score(url: str, anchor: Optional[str] = None) -> Optional[float]:
+    """
+    คะแนนความน่าจะเป็นหน้า roster ของลิงก์ จากข้อความของลิงก์ + path / query ของ URL
+    anchor=None (URL จาก sitemap) ให้น้ำหนัก URL เต็ม
+    Returns:
+        None ถ้าเป็นไฟล์ที่ไม่ใช่ HTML (pdf / รูป / ...)
+    """
+    parsed = urlparse(url)
+    path = unquote(parsed.path)
+    if path.lower().endswith(SKIP_EXTENSIONS):
+        return None
+    url_text = _SEPARATOR_RE.sub(' ', f"{path} {unquote(parsed.query)}")
+    score = keyword_score(url_text) * (1.0 if anchor is None else CRAWL_URL_WEIGHT)
+    if anchor:
+        score += keyword_score(_WHITESPACE_RE.sub(' ', anchor))
+    location = f"{parsed.path}?{parsed.query}".lower()
+    for pattern, bonus in LANGUAGE_BONUS:
+        if pattern.search(location):
+            score += bonus
+    return score
+
+
+def crawl_scope(url: str) -> str:
+    """
+    ขอบเขตของการ crawl จาก seed
+    - ธนาคารใน registry: domain ของธนาคาร (รวม subdomain เช่น www. / ir.)
+    - อื่นๆ: prefix ของ URL ถึง / ตัวสุดท้าย (เช่น mirror ใต้ /static/kbank/)
+    """
+    parsed = urlparse(url)
+    domain = bank_registry.registered_domain(parsed.hostname or '')
+    if domain:
+        return domain
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rsplit('/', 1)[0]}/"
+
+
+def in_scope(url: str, scope: str) -> bool:
+    if '://' in scope:
+        return url.startswith(scope)
+    host = (urlparse(url).hostname or '').lower()
+    return host == scope or host.endswith('.' + scope)
+
+
+def normalize_url(href: str, base: str) -> Optional[str]:
+    """URL เต็มไม่มี #fragment (None ถ้าไม่ใช่ http/https เช่น mailto: / javascript:)"""
+    url, _ = urldefrag(urljoin(base, href.strip()))
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), path=parsed.path or '/').geturl()
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def parse_robots(result: FetchResult) -> RobotFileParser:
+    """กติกาเดียวกับ RobotFileParser.read: 401/403 = ห้ามทั้งหมด, 4xx อื่น = อนุญาตทั้งหมด"""
+    robots = RobotFileParser(result.url)
+    if result.status in (401, 403):
+        robots.disallow_all = True
+    elif result.status == 200:
+        robots.parse(result.text.splitlines())
+    else:
+        robots.allow_all = True
+    return robots
+
+
+def parse_sitemap(body: bytes) -> Tuple[str, List[str]]:
+    """
+    Returns:
+        ('index' | 'urlset', URL ใน <loc>) - อ่านได้ทั้ง .xml และ .xml.gz (ไฟล์ที่ parse ไม่ได้คืน ('', []))
+    """
+    if body[:2] == b'\x1f\x8b':
+        try:
+            body = gzip.decompress(body)
+        except OSError:
+            return '', []
+    locs, kind = [], ''
+    try:
+        for _, element in ElementTree.iterparse(io.BytesIO(body), events=('end',)):
+            tag = _SITEMAP_NS_RE.sub('', element.tag)
+            if tag == 'loc' and element.text and len(locs) < SITEMAP_MAX_URLS:
+                locs.append(element.text.strip())
+            elif tag in ('sitemapindex', 'urlset'):
+                kind = 'index' if tag == 'sitemapindex' else 'urlset'
+            element.clear()
+    except ElementTree.ParseError:
+        return '', locs
+    return kind, locs
+
+
+class PageScan(NamedTuple):
+    title: str
+    names: int
+    positions: int
+    links: List[Tuple[str, str]]     # (url, ข้อความของลิงก์)
+
+
+def scan_page(html: str, base_url: str) -> PageScan:
+    """title, จำนวนชื่อคนไทย / คำตำแหน่งในหน้า และลิงก์ทั้งหมดของหน้า"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    base = soup.find('base', href=True)
+    base_url = urljoin(base_url, base['href']) if base else base_url
+
+    links = []
+    for a in soup.find_all(['a', 'area'], href=True):
+        url = normalize_url(a['href'], base_url)
+        if url:
+            anchor = " ".join(filter(None, (a.get_text(" ", strip=True), a.get('title'), a.get('aria-label'))))
+            links.append((url, anchor))
+
+    heading = soup.find(['h1', 'title'])
+    title = heading.get_text(" ", strip=True) if heading else ""
+    for tag in soup(['script', 'style', 'noscript', 'template']):
+        tag.decompose()
+    text = soup.get_text(" ")
+    # รวมชื่อใน source (ข้อมูล JSON ใน <script> ของหน้า SPA ที่ browser จะ render เป็นรายชื่อ)
+    names = {_WHITESPACE_RE.sub(' ', match.group(1)) for source in (text, html)
+             for match in _THAI_NAME_RE.finditer(source)}
+    return PageScan(title, len(names), len(_POSITION_RE.findall(text)), links)
+
+
+def http_fetcher(user_agent: str = CRAWL_USER_AGENT, timeout: float = CRAWL_TIMEOUT,
+                 pool_size: int = CRAWL_CONCURRENCY) -> Callable[[str], FetchResult]:
+    """fetch(url) -> FetchResult ด้วย requests.Session เดียว (ใช้จากหลาย thread ได้)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent, 'Accept-Language': 'th,en;q=0.8'})
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    def fetch(url: str) -> FetchResult:
+        try:
+            with session.get(url, timeout=timeout, stream=True) as response:
+                body = response.raw.read(CRAWL_MAX_BYTES, decode_content=True)
+                return FetchResult(response.url, response.status_code,
+                                   response.headers.get('Content-Type', ''), body)
+        except requests.RequestException as e:
+            logger.warning(" ---- Crawl fetch failed %s: %s ---- ", url, e)
+            return FetchResult(url, 0, '', b'')
+
+    return fetch
+
+
+class FocusedCrawler:
+    """
+    crawl แบบ best-first หลาย seed พร้อมกัน (thread pool) คืน CrawlReport ต่อ seed
+
+    วิธีใช้:
+        crawler = FocusedCrawler()
+        for report in crawler.crawl(['https://www.kasikornbank.com/']):
+            urls = [candidate.url for candidate in report.candidates]
+    """
+    def __init__(self, fetch: Optional[Callable[[str], FetchResult]] = None, budget: int = CRAWL_BUDGET,
+                 max_depth: int = CRAWL_MAX_DEPTH, top: int = CRAWL_TOP, concurrency: int = CRAWL_CONCURRENCY,
+                 per_host: int = CRAWL_PER_HOST, delay: float = CRAWL_DELAY,
+                 min_link_score: float = CRAWL_MIN_LINK_SCORE, min_names: int = CRAWL_MIN_NAMES,
+                 use_sitemaps: bool = True, user_agent: str = CRAWL_USER_AGENT,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.fetch = fetch or http_fetcher(user_agent, pool_size=concurrency)
+        self.budget = budget
+        self.max_depth = max_depth
+        self.top = top
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.delay = delay
+        self.min_link_score = min_link_score
+        self.min_names = min_names
+        self.use_sitemaps = use_sitemaps
+        self.user_agent = user_agent
+        self.clock = clock
+        self.sleep = sleep
+        self.hosts: Dict[str, _Host] = {}     # origin -> สถานะ (ใช้ร่วมกันทุก seed ของ host เดียวกัน)
+        self._seq = 0
+
+    # ----- frontier -----
+    def _host(self, url: str) -> _Host:
+        origin = _origin(url)
+        if origin not in self.hosts:
+            self.hosts[origin] = _Host(self.delay)
+        return self.hosts[origin]
+
+    def _push(self, state: _CrawlState, link: _Link):
+        self._seq += 1
+        heapq.heappush(state.frontier, (-(link.score - CRAWL_DEPTH_PENALTY * link.depth), self._seq, link))
+
+    def _add_link(self, state: _CrawlState, url: str, anchor: Optional[str], depth: int, source: str):
+        if not in_scope(url, state.scope):
+            return
+        score = link_score(url, anchor)
+        if score is None or score < self.min_link_score:
+            return
+        if score > state.link_scores.get(url, score - 1):
+            state.link_scores[url] = score
+        if url in state.seen:
+            return
+        state.seen.add(url)
+        self._push(state, _Link(url, score, depth, source, anchor or ""))
+
+    def _add_sitemap(self, state: _CrawlState, url: str):
+        # sitemap อยู่นอก prefix ของ seed ได้เฉพาะที่ root ของ host เดียวกัน (เช่น /sitemap.xml)
+        parsed = urlparse(url)
+        at_root = parsed.hostname == urlparse(state.seed).hostname and parsed.path.count('/') <= 1
+        if url in state.seen or not (at_root or in_scope(url, state.scope)):
+            return
+        score = link_score(url.rsplit('.xml', 1)[0])
+        if score is not None and score >= 0:
+            state.seen.add(url)
+            heapq.heappush(state.sitemaps, (-score, url))
+
+    def _check_sitemaps(self, state: _CrawlState):
+        # ใช้ Sitemap: ใน robots.txt ของ host ของ seed ถ้าไม่มีลอง sitemap.xml ที่ root ของขอบเขต
+        robots = self._host(state.seed).robots
+        if robots is None:
+            return
+        state.sitemaps_checked = True
+        root = state.scope if '://' in state.scope else _origin(state.seed) + '/'
+        for url in robots.site_maps() or [root + 'sitemap.xml']:
+            self._add_sitemap(state, url)
+
+    def _next_task(self, state: _CrawlState, now: float) -> Optional[_Task]:
+        if state.stopped:
+            return None
+        if self.use_sitemaps and not state.sitemaps_checked:
+            self._check_sitemaps(state)
+        robots = self._host(state.seed).robots
+        if state.sitemaps and robots is not None and not robots.can_fetch(self.user_agent, state.sitemaps[0][1]):
+            heapq.heappop(state.sitemaps)
+        if state.sitemaps and state.sitemap_files < SITEMAP_MAX_FILES:
+            url = state.sitemaps[0][1]
+            task = self._ready(state, url, now)
+            if task is not None:
+                heapq.heappop(state.sitemaps)
+                state.sitemap_files += 1
+                return task._replace(kind='sitemap') if task.kind == 'page' else task
+        elif state.sitemaps:
+            state.sitemaps.clear()
+        while state.frontier:
+            link = state.frontier[0][2]
+            host = self._host(link.url)
+            if host.robots is not None and not host.robots.can_fetch(self.user_agent, link.url):
+                heapq.heappop(state.frontier)
+                state.disallowed += 1
+                logger.debug(" ---- robots.txt disallows %s ---- ", link.url)
+                continue
+            task = self._ready(state, link.url, now)
+            if task is not None and task.kind == 'page':
+                heapq.heappop(state.frontier)
+                return task._replace(link=link)
+            return task
+        return None
+
+    def _ready(self, state: _CrawlState, url: str, now: float) -> Optional[_Task]:
+        """task สำหรับ url ถ้า host ว่าง (ถ้ายังไม่มี robots.txt ของ host นี้ คืน task โหลด robots ก่อน)"""
+        host = self._host(url)
+        if host.in_flight >= self.per_host or now < host.next_at:
+            return None
+        if host.robots is None:
+            if host.robots_pending:
+                return None
+            host.robots_pending = True
+            return _Task('robots', _origin(url) + '/robots.txt', state)
+        return _Task('page', url, state)
+
+    def _next_wakeup(self, states: List[_CrawlState], now: float) -> Optional[float]:
+        """วินาทีจนกว่า host ที่ยังมีงานรออยู่จะว่าง (None = ไม่มีงานที่รอ delay)"""
+        waits = []
+        for state in states:
+            if not state.has_work():
+                continue
+            for url in ([state.sitemaps[0][1]] if state.sitemaps else []) + \
+                    ([state.frontier[0][2].url] if state.frontier else []):
+                wait_for = self._host(url).next_at - now
+                if wait_for > 0:
+                    waits.append(wait_for)
+        return min(waits) if waits else None
+
+    # ----- worker thread -----
+    def _run(self, task: _Task):
+        result = self.fetch(task.url)
+        if task.kind == 'robots':
+            return result, parse_robots(result)
+        if task.kind == 'sitemap':
+            return result, parse_sitemap(result.body) if result.status == 200 else ('', [])
+        if result.status != 200 or 'html' not in (result.content_type or 'html').lower():
+            return result, (None, None)
+        html = result.text
+        check = classify_page(html)
+        return result, (check, scan_page(html, result.url) if check.status in _SCANNED else None)
+
+    # ----- main thread -----
+    def _handle(self, task: _Task, outcome):
+        state = task.state
+        result, parsed = outcome
+        if task.kind == 'robots':
+            host = self._host(task.url)
+            host.robots, host.robots_pending = parsed, False
+            crawl_delay = parsed.crawl_delay(self.user_agent)
+            if crawl_delay:
+                host.delay = max(host.delay, float(crawl_delay))
+            return
+
+        if task.kind == 'sitemap':
+            kind, locs = parsed
+            for loc in locs:
+                url = normalize_url(loc, result.url)
+                if not url:
+                    continue
+                if kind == 'index':
+                    self._add_sitemap(state, url)
+                else:
+                    self._add_link(state, url, None, 1, 'sitemap')
+            logger.debug(" ---- Sitemap %s: %d %s entries ---- ", task.url, len(locs), kind or 'unreadable')
+            return
+
+        link = task.link
+        state.pages += 1
+        state.seen.add(result.url)
+        check, scan = parsed
+        if check is None:
+            if result.status == 200:
+                state.failed[link.url] = f"not HTML ({result.content_type})"
+            else:
+                state.failed[link.url] = f"HTTP {result.status}" if result.status else "connection failed"
+            return
+        if check.status not in _SCANNED:
+            state.failed[link.url] = f"{check.status.value}: {check.reason}"
+            return
+
+        if scan.names >= self.min_names:
+            score = link.score + keyword_score(scan.title) + NAME_WEIGHT * min(scan.names, NAME_CAP)
+            state.candidates.append(CrawlCandidate(result.url, round(score, 2), scan.names, scan.positions,
+                                                   link.score, link.depth, link.source, link.anchor))
+            logger.info(" ---- Roster candidate %s (%d names, score %.1f) ---- ", result.url, scan.names, score)
+        elif check.status is PageStatus.EMPTY_SHELL:
+            state.shells[result.url] = link
+        if link.depth < self.max_depth:
+            for url, anchor in scan.links:
+                self._add_link(state, url, anchor, link.depth + 1, 'link')
+
+    def crawl(self, seeds: List[str]) -> List[CrawlReport]:
+        now = self.clock()
+        states = []
+        for seed in dict.fromkeys(seeds):
+            url = normalize_url(seed, seed) or seed
+            state = _CrawlState(url, crawl_scope(url), self.budget, self.top, now)
+            self._push(state, _Link(url, link_score(url) or 0.0, 0, 'seed', ""))
+            states.append(state)
+        finished: Dict[int, CrawlReport] = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='crawler') as pool:
+            running = {}
+            while True:
+                now = self.clock()
+                started = True
+                while started and len(running) < self.concurrency:
+                    started = False
+                    for state in states:                       # round-robin ระหว่างธนาคาร
+                        if len(running) >= self.concurrency:
+                            break
+                        task = self._next_task(state, now)
+                        if task is None:
+                            continue
+                        host = self._host(task.url)
+                        host.in_flight += 1
+                        host.next_at = now + host.delay
+                        state.in_flight += 1
+                        state.requests += 1
+                        running[pool.submit(self._run, task)] = task
+                        started = True
+
+                for i, state in enumerate(states):
+                    if i not in finished and not state.in_flight and not state.has_work():
+                        finished[i] = state.report(self.clock())
+                if not running:
+                    wakeup = self._next_wakeup(states, now)
+                    if wakeup is None:
+                        break
+                    self.sleep(wakeup)
+                    continue
+
+                done, _ = wait(running, timeout=self._next_wakeup(states, now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    self._host(task.url).in_flight -= 1
+                    task.state.in_flight -= 1
+                    try:
+                        self._handle(task, future.result())
+                    except Exception as e:   # หน้าเสียหน้าเดียวไม่ควรหยุดทั้งการ crawl
+                        task.state.failed[task.url] = f"error: {e}"
+                        logger.warning(" ---- Crawl error on %s: %s ---- ", task.url, e)
+
+        for i, state in enumerate(states):
+            report = finished.get(i) or state.report(self.clock())
+            logger.info(" ---- Crawled %s: %d candidate(s), %d/%d requests, %d page(s) in %.1fs ---- ",
+                        report.scope, len(report.candidates), report.requests, state.budget,
+                        report.pages, report.seconds)
+            finished[i] = report
+        return [finished[i] for i in range(len(states))]
+
+
+def resolve_seed(query: str) -> str:
+    """ชื่อ / keyword / domain ของธนาคาร -> หน้าแรก (URL เต็มใช้ตามที่ให้มา)"""
+    if '://' in query:
+        return query
+    bank = bank_registry.find_bank(query)
+    if bank is None:
+        raise ValueError(f"unknown bank '{query}' (use a URL, a domain or a name from bank_registry)")
+    return bank_registry.homepage_url(bank)
+
+
+def discover(queries: List[str], top: int = CRAWL_TOP, **options) -> List[CrawlReport]:
+    """crawl หาหน้า roster ของแต่ละธนาคาร (URL / domain / ชื่อ / keyword) พร้อมกัน"""
+    return FocusedCrawler(top=top, **options).crawl([resolve_seed(query) for query in queries])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Find bank executive / board pages with a focused crawler")
+    parser.add_argument('banks', nargs='+', help="bank keyword, Thai name, domain or start URL")
+    parser.add_argument('--top', type=int, default=CRAWL_TOP, help="pages to return per bank")
+    parser.add_argument('--budget', type=int, default=CRAWL_BUDGET, help="max requests per bank")
+    parser.add_argument('--depth', type=int, default=CRAWL_MAX_DEPTH)
+    parser.add_argument('--delay', type=float, default=CRAWL_DELAY, help="seconds between requests to one host")
+    parser.add_argument('--no-sitemap', action='store_true')
+    parser.add_argument('-o', '--output', metavar='FILE', help="write the found URLs (one per line, for cli.py -i)")
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    try:
+        reports = discover(args.banks, top=args.top, budget=args.budget, max_depth=args.depth,
+                           delay=args.delay, use_sitemaps=not args.no_sitemap)
+    except ValueError as e:
+        parser.error(str(e))
+
+    urls = []
+    for report in reports:
+        print(f"\n{report.seed} ({report.requests} requests, {report.pages} pages, "
+              f"{report.disallowed} disallowed by robots.txt, {report.seconds:.1f}s)")
+        for candidate in report.candidates:
+            print(f"  {candidate.score:>6.1f}  {candidate.names:>3} names  {candidate.url}")
+            urls.append(candidate.url)
+        if not report.candidates:
+            print("  (no executive page found)")
+        for url, reason in report.failed.items():
+            print(f"  [skip] {url}: {reason}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write("".join(f"{url}\n" for url in urls))
+    return 0 if urls else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+Record ผู้บริหาร 1 คน และชุด record ของธนาคารหนึ่ง (แทน dict 9-12 key ต่อคน)
+
+- ExecutiveRecord ใช้ __slots__ (ไม่มี __dict__ ต่อ instance) และ intern ค่าที่เหมือนกันทั้งชุด
+  (BUSI_DT, Bank_Name, Source_URL, Position_Role) ให้ทุก record ชี้ string ตัวเดียวกัน
+  รวมถึง record ที่โหลดกลับจาก checkpoint JSON ซึ่งปกติจะได้ string ใหม่ทุกแถว
+- ExecutiveBatch.of / from_table ใช้ dict cache ต่อ batch แทน sys.intern และแชร์ตำแหน่ง / คำนำหน้าด้วย
+  (ค่าซ้ำกันมากในธนาคารเดียว: dict lookup ถูกกว่า sys.intern และไม่ค้างอยู่ในตาราง intern ของ interpreter)
+- checkpoint เก็บเป็นตาราง (ExecutiveBatch.to_table: ชื่อ field ครั้งเดียว + 1 list ต่อ record)
+  JSON สั้นกว่า dict ต่อแถวและ parse เร็วกว่า ExecutiveBatch.of อ่านได้ทั้งตารางและ list ของ dict แบบเดิม
+- ยังอ่าน / เขียนแบบ dict ได้ (record['Full_Name'], record.get('Surname')) โค้ดเดิมที่รับ List[Dict] ใช้ต่อได้
+- ExecutiveBatch export เป็น CSV / Parquet / JSON โดยอ่านค่าจาก slot ตรงๆ ไม่สร้าง dict หรือ DataFrame ระหว่างทาง
+"""
+import os
+import sys
+import json
+from json.encoder import encode_basestring
+from itertools import repeat
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# ลำดับ field ของ record (ตรงกับ key ของ dict แบบเดิม)
+FIELDS = (
+    'BUSI_DT', 'Eng_Prefix', 'Full_Name', 'Thai_Prefix', 'First_Name', 'Surname',
+    'Bank_Name', 'Position', 'Source_URL', 'Recovery_Confidence', 'Position_Role', 'Position_Rank',
+)
+# field ที่ค่าเหมือนกันทั้งชุด (ต่อธนาคาร / วัน) -> sys.intern
+INTERNED_FIELDS = frozenset(['BUSI_DT', 'Bank_Name', 'Source_URL', 'Position_Role'])
+# field ที่ batch แชร์ string ตัวเดียวกันผ่าน dict cache (INTERNED_FIELDS + ตำแหน่ง / คำนำหน้า)
+SHARED_FIELDS = INTERNED_FIELDS | frozenset(['Eng_Prefix', 'Thai_Prefix', 'Position'])
+# field ที่ไม่ใช่ string (None = ไม่มีค่า เหมือน key ที่ไม่มีใน dict เดิม)
+FLOAT_FIELDS = frozenset(['Recovery_Confidence'])
+INT_FIELDS = frozenset(['Position_Rank'])
+
+_FIELD_SET = frozenset(FIELDS)
+_ALL_FIELDS = attrgetter(*FIELDS)
+# ค่าของ field ที่ไม่มีใน dict (string = "" เหมือน default ของ __init__, ตัวเลข / Position_Role = None)
+_FIELD_DEFAULTS = tuple(None if key in FLOAT_FIELDS or key in INT_FIELDS or key == 'Position_Role' else ""
+                        for key in FIELDS)
+_new = object.__new__
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class ExecutiveRecord:
+    """
+    ข้อมูลผู้บริหาร 1 คน (field ตาม FIELDS)
+    ใช้แบบ dict ได้: record['Position'], record.get('Recovery_Confidence'), record['Position_Role'] = ...
+    field ที่เป็น None นับเป็น "ไม่มี key" (in / keys() / to_dict() ไม่รวม)
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, BUSI_DT: str = "", Eng_Prefix: str = "", Full_Name: str = "", Thai_Prefix: str = "",
+                 First_Name: str = "", Surname: str = "", Bank_Name: str = "", Position: str = "",
+                 Source_URL: str = "", Recovery_Confidence: Optional[float] = None,
+                 Position_Role: Optional[str] = None, Position_Rank: Optional[int] = None):
+        self.BUSI_DT = _intern(BUSI_DT)
+        self.Eng_Prefix = Eng_Prefix
+        self.Full_Name = Full_Name
+        self.Thai_Prefix = Thai_Prefix
+        self.First_Name = First_Name
+        self.Surname = Surname
+        self.Bank_Name = _intern(Bank_Name)
+        self.Position = Position
+        self.Source_URL = _intern(Source_URL)
+        self.Recovery_Confidence = None if Recovery_Confidence is None else float(Recovery_Confidence)
+        self.Position_Role = _intern(Position_Role)
+        self.Position_Rank = Position_Rank
+
+    @classmethod
+    def from_dict(cls, data: Dict, **defaults) -> 'ExecutiveRecord':
+        """สร้างจาก dict แบบเดิม (เช่น checkpoint JSON) - key ที่ไม่รู้จักจะถูกข้าม"""
+        return _from_dict(data, defaults, None)
+
+    # ----- dict-compatible access -----
+    def __getitem__(self, key: str):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, _intern(value) if key in INTERNED_FIELDS else value)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET and getattr(self, key) is not None
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in _FIELD_SET else None
+        return default if value is None else value
+
+    def keys(self) -> List[str]:
+        return [key for key in FIELDS if getattr(self, key) is not None]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def to_dict(self) -> Dict:
+        return dict(self.items())
+
+    def copy(self) -> 'ExecutiveRecord':
+        return ExecutiveRecord(*(getattr(self, key) for key in FIELDS))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ExecutiveRecord):
+            return all(getattr(self, key) == getattr(other, key) for key in FIELDS)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ExecutiveRecord({', '.join(f'{key}={value!r}' for key, value in self.items())})"
+
+
+def _from_values(values, convert: bool = False, cache: Optional[Dict] = None) -> ExecutiveRecord:
+    """
+    สร้าง record จากค่าตามลำดับ FIELDS โดยไม่ผ่าน __init__ แบบ keyword (ทางเร็วของการโหลด checkpoint)
+    convert: แปลง Recovery_Confidence เป็น float (ค่าจาก dict ภายนอก - ตารางที่ to_table เขียนเป็น float อยู่แล้ว)
+    cache: dict ของ batch - SHARED_FIELDS ที่ค่าเท่ากันชี้ string ตัวเดียวกัน (None = sys.intern เฉพาะ INTERNED_FIELDS)
+    """
+    record = _new(ExecutiveRecord)
+    (record.BUSI_DT, record.Eng_Prefix, record.Full_Name, record.Thai_Prefix, record.First_Name, record.Surname,
+     record.Bank_Name, record.Position, record.Source_URL, record.Recovery_Confidence, record.Position_Role,
+     record.Position_Rank) = values
+    if cache is None:
+        record.BUSI_DT = _intern(record.BUSI_DT)
+        record.Bank_Name = _intern(record.Bank_Name)
+        record.Source_URL = _intern(record.Source_URL)
+        record.Position_Role = _intern(record.Position_Role)
+    else:
+        share = cache.setdefault
+        record.BUSI_DT = share(record.BUSI_DT, record.BUSI_DT)
+        record.Eng_Prefix = share(record.Eng_Prefix, record.Eng_Prefix)
+        record.Thai_Prefix = share(record.Thai_Prefix, record.Thai_Prefix)
+        record.Bank_Name = share(record.Bank_Name, record.Bank_Name)
+        record.Position = share(record.Position, record.Position)
+        record.Source_URL = share(record.Source_URL, record.Source_URL)
+        record.Position_Role = share(record.Position_Role, record.Position_Role)
+    if convert and record.Recovery_Confidence is not None:
+        record.Recovery_Confidence = float(record.Recovery_Confidence)
+    return record
+
+
+def _from_dict(data: Dict, defaults: Dict, cache: Optional[Dict]) -> ExecutiveRecord:
+    if not defaults and _FIELD_SET.issuperset(data):
+        return _from_values(map(data.get, FIELDS, _FIELD_DEFAULTS), True, cache)
+    values = {key: value for key, value in data.items() if key in _FIELD_SET}
+    for key, value in defaults.items():
+        if not values.get(key):
+            values[key] = value
+    if cache is None:
+        return ExecutiveRecord(**values)
+    return _from_values(map(values.get, FIELDS, _FIELD_DEFAULTS), True, cache)
+
+
+_JSON_KEYS = {key: encode_basestring(key) + ": " for key in FIELDS}
+
+
+def _json_value(value) -> str:
+    if type(value) is str:
+        return encode_basestring(value)
+    return json.dumps(value)
+
+
+class ExecutiveBatch(list):
+    """
+    List ของ ExecutiveRecord (ใช้แทน List[Dict] ได้ทุกที่) พร้อม export แบบคอลัมน์
+    - rows(columns) / column(name): ดึงค่าจาก slot ตรงๆ
+    - to_csv / to_parquet / to_json: เขียนไฟล์โดยไม่สร้าง dict หรือ DataFrame ระหว่างทาง
+    """
+
+    @classmethod
+    def of(cls, records: Iterable, **defaults) -> 'ExecutiveBatch':
+        """
+        แปลง records (ExecutiveRecord, dict แบบเดิม หรือตารางจาก to_table) เป็น ExecutiveBatch
+        defaults: ค่าที่ใช้แทน field ที่ว่างของ dict เช่น BUSI_DT=busi_dt
+        """
+        if isinstance(records, cls) and not defaults:
+            return records
+        if isinstance(records, dict):
+            return cls.from_table(records, **defaults)
+        cache = {}
+        return cls(
+            record if isinstance(record, ExecutiveRecord) else _from_dict(record, defaults, cache)
+            for record in records
+        )
+
+    @classmethod
+    def from_table(cls, table: Dict, **defaults) -> 'ExecutiveBatch':
+        """อ่านตารางที่ to_table เขียน (field ไม่ตรงกับ FIELDS ปัจจุบัน = checkpoint รุ่นอื่น อ่านผ่าน dict)"""
+        fields = tuple(table['fields'])
+        cache = {}
+        if fields == FIELDS and not defaults:
+            return cls(map(_from_values, table['rows'], repeat(False), repeat(cache)))
+        return cls(_from_dict(dict(zip(fields, row)), defaults, cache) for row in table['rows'])
+
+    def to_table(self) -> Dict:
+        """รูปแบบที่เก็บใน checkpoint: {'fields': FIELDS, 'rows': [ค่าตามลำดับ FIELDS ต่อ record]}"""
+        return {'fields': list(FIELDS), 'rows': list(map(_ALL_FIELDS, self))}
+
+    def rows(self, columns: Sequence[str]) -> Iterator[tuple]:
+        """tuple ต่อ record ตามลำดับ columns (string ที่ไม่มีค่าเป็น "" ตัวเลขที่ไม่มีค่าเป็น None)"""
+        getter = attrgetter(*columns)
+        if len(columns) == 1:
+            single = getter
+            getter = lambda record: (single(record),)
+        numeric = [col in FLOAT_FIELDS or col in INT_FIELDS for col in columns]
+        for record in self:
+            yield tuple(value if value is not None or is_number else ""
+                        for value, is_number in zip(getter(record), numeric))
+
+    def column(self, name: str) -> list:
+        getter = attrgetter(name)
+        if name in FLOAT_FIELDS or name in INT_FIELDS:
+            return [getter(record) for record in self]
+        return [getter(record) or "" for record in self]
+
+    def to_csv(self, output_path: str, columns: Optional[Sequence[str]] = None) -> str:
+        """CSV format เดียวกับไฟล์ส่งงาน (utf-8-sig, QUOTE_ALL) ผ่าน output_sinks.StreamingCsvWriter"""
+        from output_sinks import CSV_COLUMNS, StreamingCsvWriter
+
+        columns = list(columns or CSV_COLUMNS)
+        with StreamingCsvWriter(output_path, columns) as writer:
+            writer.write_rows(self.rows(columns))
+        return output_path
+
+    def to_arrow(self, columns: Optional[Sequence[str]] = None):
+        """pyarrow.Table (ต้องติดตั้ง pyarrow) - string ไม่เป็น null, Recovery_Confidence / Position_Rank เป็น null ได้"""
+        import pyarrow as pa
+        from output_sinks import HISTORY_COLUMNS
+
+        fields = []
+        for col in columns or HISTORY_COLUMNS:
+            if col in FLOAT_FIELDS:
+                fields.append(pa.field(col, pa.float64()))
+            elif col in INT_FIELDS:
+                fields.append(pa.field(col, pa.int64()))
+            else:
+                fields.append(pa.field(col, pa.string(), nullable=False))
+        schema = pa.schema(fields)
+        return pa.Table.from_arrays([pa.array(self.column(field.name), type=field.type) for field in schema],
+                                    schema=schema)
+
+    def to_parquet(self, output_path: str, columns: Optional[Sequence[str]] = None) -> str:
+        import pyarrow.parquet as pq
+
+        tmp_path = f"{output_path}.tmp"
+        pq.write_table(self.to_arrow(columns), tmp_path, row_group_size=max(len(self), 1))
+        os.replace(tmp_path, output_path)
+        return output_path
+
+    def iter_json(self) -> Iterator[str]:
+        """JSON object ต่อ record (field ที่เป็น None ไม่ถูกเขียน เหมือน dict แบบเดิม)"""
+        for record in self:
+            yield "{" + ", ".join(
+                _JSON_KEYS[key] + _json_value(value)
+                for key, value in zip(FIELDS, _ALL_FIELDS(record)) if value is not None
+            ) + "}"
+
+    def to_json(self, output_path: str, lines: bool = False) -> str:
+        """
+        เขียน JSON array (หรือ JSON Lines ถ้า lines=True) ทีละ record
+        """
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if lines:
+                for obj in self.iter_json():
+                    f.write(obj + "\n")
+            else:
+                f.write("[")
+                for i, obj in enumerate(self.iter_json()):
+                    f.write(",\n " + obj if i else "\n " + obj)
+                f.write("\n]\n")
+        os.replace(tmp_path, output_path)
+        return output_path
+
+
+def json_default(obj):
+    """default= ของ json.dumps: เขียน ExecutiveRecord เป็น object แบบ dict เดิม (ใช้กับ checkpoint)"""
+    if isinstance(obj, ExecutiveRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
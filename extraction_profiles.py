@@ -0,0 +1,270 @@
+import os
+import re
+import json
+import logging
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from bank_registry import registered_domain
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+PROFILE_STORE_PATH = os.path.join('profiles', 'extraction_profiles.json')
+PROFILE_MIN_SUPPORT = 3          # จำนวนคู่ชื่อ/ตำแหน่งขั้นต่ำที่ต้องใช้ pattern เดียวกันถึงจะเรียนรู้เป็น rule
+PROFILE_MIN_YIELD_RATIO = 0.8    # ถ้าได้ผลน้อยกว่าสัดส่วนนี้ของครั้งก่อน -> ทิ้ง profile แล้วใช้ heuristic ปกติ
+PROFILE_MAX_DISTANCE = 10        # ระยะห่าง (จำนวน text block) สูงสุดระหว่างชื่อกับตำแหน่งของคนเดียวกัน
+
+_CSS_IDENT = re.compile(r'-?[_a-zA-Z][\w-]*')
+
+
+def profile_key(url: str) -> str:
+    """คืนค่า domain ที่ใช้เป็น key ของ profile (domain ของธนาคารใน registry หรือ hostname ที่ไม่มี www.)"""
+    host = (urlparse(url).hostname or '').lower()
+    return registered_domain(host) or (host[4:] if host.startswith('www.') else host)
+
+
+def _element_text(element: 'Tag') -> str:
+    return re.sub(r'\s+', ' ', element.get_text(" ", strip=True)).strip()
+
+
+def _signature(element: 'Tag') -> str:
+    """สร้าง CSS selector ของ element เดียว เช่น div.caption (ข้าม class ที่ไม่ใช่ identifier ธรรมดา)"""
+    classes = [c for c in element.get('class', []) if _CSS_IDENT.fullmatch(c)]
+    return element.name + ''.join(f'.{c}' for c in classes)
+
+
+def _ancestors(element: 'Tag') -> List['Tag']:
+    """คืนค่า [element, parent, ..., root]"""
+    chain = [element]
+    chain.extend(element.parents)
+    return chain
+
+
+def _relative_path(card: 'Tag', element: 'Tag') -> str:
+    steps = []
+    for node in _ancestors(element):
+        if node is card:
+            break
+        steps.append(_signature(node))
+    return ':scope > ' + ' > '.join(reversed(steps))
+
+
+class ProfileRule:
+    """
+    Selector ชุดเดียวสำหรับ layout หนึ่งแบบในหน้าเว็บ
+    - card: container ที่ครอบชื่อและตำแหน่งของผู้บริหาร 1 คน
+    - name / position: selector ภายใน card
+    """
+    def __init__(self, card: str, name: str, position: str, support: int = 0):
+        self.card = card
+        self.name = name
+        self.position = position
+        self.support = support
+        import soupsieve as sv   # โหลดพร้อม bs4 เมื่อใช้ profile ครั้งแรก
+        self._card_sel = sv.compile(card)
+        self._name_sel = sv.compile(name)
+        self._position_sel = sv.compile(position)
+
+    def extract(self, card: 'Tag') -> Optional[Tuple[str, str]]:
+        name_el = self._name_sel.select_one(card)
+        position_el = self._position_sel.select_one(card)
+        if name_el is None or position_el is None:
+            return None
+        return _element_text(name_el), _element_text(position_el)
+
+    def to_dict(self) -> Dict:
+        return {'card': self.card, 'name': self.name, 'position': self.position, 'support': self.support}
+
+
+class ExtractionProfile:
+    """Profile ของเว็บไซต์หนึ่ง: รายการ rule ที่เรียนรู้จากการรัน heuristic ที่สำเร็จ"""
+    def __init__(self, domain: str, rules: List[ProfileRule], expected_count: int, learned_at: str = ""):
+        self.domain = domain
+        self.rules = rules
+        self.expected_count = expected_count
+        self.learned_at = learned_at or datetime.now().isoformat(timespec='seconds')
+        # รวมทุก card selector เป็นตัวเดียว เพื่อให้ได้ card ตามลำดับในเอกสาร
+        import soupsieve as sv
+        self._cards_sel = sv.compile(', '.join(rule.card for rule in rules))
+
+    def extract(self, soup, is_valid_name: Callable[[str], bool],
+                is_valid_position: Callable[[str], bool]) -> List[Tuple[str, str]]:
+        executives = []
+        for card in self._cards_sel.select(soup):
+            for rule in self.rules:
+                if not rule._card_sel.match(card):
+                    continue
+                pair = rule.extract(card)
+                if pair and is_valid_name(pair[0]) and is_valid_position(pair[1]):
+                    executives.append(pair)
+                    break
+        return executives
+
+    def accepts(self, count: int) -> bool:
+        """ตรวจสอบว่าผลจาก profile ยังได้ยอดใกล้เคียงกับครั้งก่อนหรือไม่ (ต่ำกว่านี้ -> ทิ้ง profile)"""
+        return count > 0 and count >= self.expected_count * PROFILE_MIN_YIELD_RATIO
+
+    def is_complete(self, count: int) -> bool:
+        """ได้ครบตามครั้งก่อน -> ใช้ผลจาก profile ได้เลยโดยไม่ต้องรัน generic passes"""
+        return count > 0 and count >= self.expected_count
+
+    def to_dict(self) -> Dict:
+        return {
+            'rules': [rule.to_dict() for rule in self.rules],
+            'expected_count': self.expected_count,
+            'learned_at': self.learned_at,
+        }
+
+    @classmethod
+    def from_dict(cls, domain: str, data: Dict) -> 'ExtractionProfile':
+        rules = [ProfileRule(r['card'], r['name'], r['position'], r.get('support', 0)) for r in data['rules']]
+        return cls(domain, rules, data.get('expected_count', 0), data.get('learned_at', ""))
+
+    @classmethod
+    def learn(cls, domain: str, executives: List[Tuple[str, str]],
+              text_blocks: List[Tuple[str, 'Tag']]) -> Optional['ExtractionProfile']:
+        """
+        เรียนรู้ profile จากผลลัพธ์ของ heuristic
+        - หา element ของชื่อและตำแหน่งแต่ละคู่จาก text block
+        - หา common ancestor ของทั้งคู่ (card) แล้วสร้าง selector ของ card และ path ไปยังชื่อ/ตำแหน่ง
+        - pattern ที่มีคู่รองรับ >= PROFILE_MIN_SUPPORT จะกลายเป็น rule
+        Returns:
+            ExtractionProfile หรือ None ถ้าไม่มี pattern ที่ชัดเจนพอ
+        """
+        indexes_by_text = {}
+        for i, (text, _) in enumerate(text_blocks):
+            indexes_by_text.setdefault(text, []).append(i)
+
+        patterns = Counter()
+        for name, position in executives:
+            name_indexes = indexes_by_text.get(name)
+            if not name_indexes:
+                continue
+            # ตำแหน่งมักซ้ำกันหลายแถว -> ใช้ block ของตำแหน่งที่อยู่ถัดจากชื่อ (หรือก่อนหน้าชื่อ) ที่ใกล้ที่สุด
+            i = name_indexes[0]
+            position_indexes = [k for k in indexes_by_text.get(position, []) if 0 < abs(k - i) <= PROFILE_MAX_DISTANCE]
+            if not position_indexes:
+                continue
+            j = min(position_indexes, key=lambda k: (k < i, abs(k - i)))
+            name_el = text_blocks[i][1]
+            position_el = text_blocks[j][1]
+
+            position_chain = set(map(id, _ancestors(position_el)))
+            card = next((a for a in _ancestors(name_el) if id(a) in position_chain), None)
+            if card is None or card is name_el or card is position_el or card.parent is None:
+                continue
+
+            card_selector = f"{_signature(card.parent)} > {_signature(card)}"
+            patterns[(card_selector, _relative_path(card, name_el), _relative_path(card, position_el))] += 1
+
+        rules = [
+            ProfileRule(card, name, position, support)
+            for (card, name, position), support in patterns.most_common()
+            if support >= PROFILE_MIN_SUPPORT
+        ]
+        if not rules:
+            return None
+        return cls(domain, rules, expected_count=0)
+
+
+class ProfileRegistry:
+    """
+    ที่เก็บ ExtractionProfile ของทุกเว็บไซต์ (บันทึกเป็นไฟล์ JSON)
+    - หลาย worker ใช้ไฟล์เดียวกันได้: save() จะล็อกไฟล์ อ่านของล่าสุดจาก disk แล้ว merge เฉพาะ domain ที่ตัวเองแก้
+    """
+    def __init__(self, path: str = PROFILE_STORE_PATH):
+        self.path = path
+        self.profiles: Dict[str, ExtractionProfile] = {}
+        self._changed: Dict[str, Optional[ExtractionProfile]] = {}   # domain -> profile ใหม่ (None = ลบ)
+        self._load()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _load(self):
+        try:
+            for domain, profile_data in self._read().items():
+                self.profiles[domain] = ExtractionProfile.from_dict(domain, profile_data)
+        except Exception as e:
+            logger.warning(" ---- Could not load extraction profiles (%s): %s ---- ", self.path, e)
+
+    def save(self):
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            with _file_lock(f"{self.path}.lock"):
+                data = self._read()
+                for domain, profile in self._changed.items():
+                    if profile is None:
+                        data.pop(domain, None)
+                    else:
+                        data[domain] = profile.to_dict()
+
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.profiles-', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+                tmp_path = None
+
+            # รับ profile ที่ worker อื่นเรียนรู้ไว้ด้วย
+            for domain, profile_data in data.items():
+                if domain not in self._changed:
+                    self.profiles[domain] = ExtractionProfile.from_dict(domain, profile_data)
+            self._changed.clear()
+        except Exception as e:
+            logger.warning(" ---- Could not save extraction profiles (%s): %s ---- ", self.path, e)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, domain: str) -> Optional[ExtractionProfile]:
+        return self.profiles.get(domain)
+
+    def put(self, profile: ExtractionProfile):
+        self.profiles[profile.domain] = profile
+        self._changed[profile.domain] = profile
+        self.save()
+
+    def discard(self, domain: str):
+        if self.profiles.pop(domain, None) is not None:
+            self._changed[domain] = None
+            self.save()
+
+
+@contextmanager
+def _file_lock(path: str):
+    """ล็อกไฟล์แบบ exclusive ข้าม process (fcntl บน POSIX, msvcrt บน Windows)"""
+    with open(path, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue   # LK_LOCK รอแค่ ~10 วินาทีแล้ว raise -> รอต่อ
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
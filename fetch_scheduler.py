@@ -0,0 +1,176 @@
+import time
+import random
+import logging
+from collections import deque
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from page_status import PageCheck, PageStatus, retry_hint
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy(NamedTuple):
+    base_delay: float = 5.0          # backoff ครั้งแรก (วินาที)
+    max_delay: float = 120.0         # backoff สูงสุด
+    jitter: float = 0.3              # สุ่มเพิ่ม/ลด backoff +-30% ไม่ให้ยิงพร้อมกัน
+    max_attempts: int = 3            # จำนวนครั้งสูงสุดต่อ URL
+    domain_error_budget: int = 6     # จำนวนครั้งที่ domain หนึ่ง fail ได้ทั้งหมดในรอบการรัน
+    breaker_threshold: int = 3       # โดน block ติดกันกี่ครั้งถึงตัดวงจร
+    breaker_cooldown: float = 300.0  # เวลาพักก่อนให้ลอง domain ที่ถูกตัดวงจรอีกครั้ง (half-open)
+    min_interval: float = 2.0        # ระยะห่างระหว่าง request ที่สำเร็จของ domain เดียวกัน สุ่มใน [min, max] วินาที
+    max_interval: float = 4.0
+
+
+class _DomainState:
+    def __init__(self):
+        self.failures = 0
+        self.consecutive_blocks = 0
+        self.next_allowed_at = 0.0
+        self.opened_at: Optional[float] = None
+        self.exhausted = False          # error budget หมด: เลิกลอง domain นี้ทั้งรอบการรัน
+
+
+class _Job(NamedTuple):
+    url: str
+    attempt: int
+
+
+class FetchScheduler:
+    """
+    คิว URL ที่จัดการ retry ระดับ scheduler แยกตาม domain
+    - exponential backoff + jitter ต่อ domain (URL ของ domain อื่นทำงานต่อได้ระหว่างรอ)
+    - หลัง request ที่สำเร็จ domain เดิมต้องเว้นระยะ min_interval..max_interval วินาที (สุ่ม) ก่อนยิงครั้งถัดไป
+    - error budget ต่อ domain และ circuit breaker เมื่อโดน block ติดกันหลายครั้ง
+      (ครบ breaker_cooldown แล้วปล่อย URL ของ domain นั้นไปลอง 1 ตัว (half-open): สำเร็จ = ปิดวงจร,
+      ไม่สำเร็จ = พักต่ออีก cooldown ถ้าเหลือแต่ domain ที่พักอยู่ scheduler จะรอจนถึงเวลา probe)
+    - URL ที่โดน block จะถูกเลื่อนไปท้ายคิว ให้ธนาคารที่ปกติทำเสร็จก่อน
+    - ไม่ผูกกับ Selenium: clock / sleep ส่งเข้ามาได้ (ทดสอบกับ server จำลอง: benchmarks/scheduler_harness.py)
+
+    วิธีใช้:
+        scheduler = FetchScheduler(urls)
+        for url in scheduler:
+            html = fetch(url)
+            if html: scheduler.record_success(url)
+            else: scheduler.record_failure(url, page_check)
+    """
+    def __init__(self, urls: List[str], policy: RetryPolicy = RetryPolicy(),
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.policy = policy
+        self.clock = clock
+        self.sleep = sleep
+        self.queue = deque(_Job(url, 1) for url in urls)
+        self.domains: Dict[str, _DomainState] = {}
+        self.failed: Dict[str, str] = {}      # url -> เหตุผลที่เลิกลอง
+        self._attempts: Dict[str, int] = {}
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        return (urlparse(url).hostname or url).lower()
+
+    def _state(self, url: str) -> _DomainState:
+        return self.domains.setdefault(self.domain_of(url), _DomainState())
+
+    def _is_open(self, state: _DomainState, now: float) -> bool:
+        """circuit เปิดอยู่ (ห้ามยิง) หรือไม่ - ครบ cooldown แล้วให้ลองได้ (half-open)"""
+        if state.exhausted:
+            return True
+        return state.opened_at is not None and now - state.opened_at < self.policy.breaker_cooldown
+
+    def _ready_at(self, state: _DomainState) -> float:
+        ready_at = state.next_allowed_at
+        if state.opened_at is not None:
+            ready_at = max(ready_at, state.opened_at + self.policy.breaker_cooldown)
+        return ready_at
+
+    def _backoff(self, failures: int) -> float:
+        delay = min(self.policy.max_delay, self.policy.base_delay * (2 ** max(failures - 1, 0)))
+        return delay * random.uniform(1 - self.policy.jitter, 1 + self.policy.jitter)
+
+    def __iter__(self) -> Iterator[str]:
+        while self.queue:
+            job = self._next_ready_job()
+            if job is None:
+                continue
+            self._attempts[job.url] = job.attempt
+            yield job.url
+
+    def _next_ready_job(self) -> Optional[_Job]:
+        now = self.clock()
+
+        for i, job in enumerate(self.queue):
+            state = self._state(job.url)
+            if not self._is_open(state, now) and state.next_allowed_at <= now:
+                del self.queue[i]
+                if state.opened_at is not None:
+                    # half-open: probe ตัวนี้ตัวเดียว (ตั้งเวลาพักใหม่ไว้ก่อน record_success จะปิดวงจรให้)
+                    state.opened_at = now
+                    logger.info(" ---- Half-open probe for %s: %s ---- ", self.domain_of(job.url), job.url)
+                return job
+
+        # ไม่มี URL ที่พร้อม: URL ของ domain ที่ error budget หมดแล้วเลิกเลย ที่เหลือรอ backoff / cooldown
+        for job in [job for job in self.queue if self._state(job.url).exhausted]:
+            self.queue.remove(job)
+            self.failed[job.url] = "error budget exhausted"
+            logger.warning(" ---- Skipping %s: error budget exhausted for %s ---- ", job.url, self.domain_of(job.url))
+        if not self.queue:
+            return None
+
+        wait = max(min(self._ready_at(self._state(job.url)) for job in self.queue) - now, 0)
+        logger.info(" ---- All pending domains are backing off, waiting %.1fs ---- ", wait)
+        self.sleep(wait)
+        return None
+
+    def retry_delay(self, url: str) -> float:
+        """เวลา (วินาที) ที่ domain ของ URL ยังต้องรอ backoff / cooldown ก่อนลองใหม่"""
+        state = self._state(url)
+        if state.exhausted:
+            return 0.0
+        return max(self._ready_at(state) - self.clock(), 0.0)
+
+    def record_success(self, url: str):
+        state = self._state(url)
+        state.consecutive_blocks = 0
+        state.opened_at = None
+        state.next_allowed_at = self.clock() + random.uniform(self.policy.min_interval, self.policy.max_interval)
+
+    def record_failure(self, url: str, page_check: Optional[PageCheck] = None):
+        """
+        บันทึกความล้มเหลวและตัดสินใจว่าจะลองใหม่หรือไม่
+        - 404 / captcha: ไม่ลองใหม่
+        - block: นับ consecutive_blocks ครบ threshold ตัดวงจร domain, ลองใหม่ที่ท้ายคิว
+        - error อื่น (timeout, หน้าว่าง): backoff แล้วลองใหม่จนกว่าจะหมด budget
+        """
+        state = self._state(url)
+        domain = self.domain_of(url)
+        attempt = self._attempts.get(url, 1)
+        now = self.clock()
+        reason = f"{page_check.status.value}: {page_check.reason}" if page_check else "fetch error"
+
+        state.failures += 1
+
+        if page_check and not retry_hint(page_check).retry:
+            self.failed[url] = reason
+            return
+
+        if page_check and page_check.status is PageStatus.BLOCKED:
+            state.consecutive_blocks += 1
+            if state.consecutive_blocks >= self.policy.breaker_threshold:
+                if state.opened_at is None:
+                    logger.warning(" ---- Circuit opened for %s after %s blocks ---- ", domain, state.consecutive_blocks)
+                else:
+                    logger.warning(" ---- Half-open probe for %s blocked, circuit re-opened ---- ", domain)
+                state.opened_at = now
+
+        if state.failures >= self.policy.domain_error_budget and not state.exhausted:
+            logger.warning(" ---- Error budget exhausted for %s (%s failures) ---- ", domain, state.failures)
+            state.exhausted = True
+
+        if attempt >= self.policy.max_attempts:
+            self.failed[url] = reason
+            return
+
+        state.next_allowed_at = now + self._backoff(state.failures)
+        # เลื่อนไปท้ายคิวให้ URL อื่นได้ทำก่อน
+        self.queue.append(_Job(url, attempt + 1))
+        logger.info(" ---- Deferred %s (attempt %s/%s, %s) ---- ", url, attempt + 1, self.policy.max_attempts, reason)
@@ -0,0 +1,254 @@
+import os
+import json
+import time
+import zlib
+import socket
+import logging
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from executive_record import json_default
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+JOB_QUEUE_PATH = os.path.join('output', 'jobs.sqlite')
+JOB_LEASE_SECONDS = 900    # worker ที่หายไปเกินนี้ (crash / kill) job จะกลับมาให้ worker อื่นรับต่อ
+
+# ลำดับ stage ของแต่ละ URL (checkpoint หลังจบแต่ละ stage)
+STAGES = ('fetched', 'extracted', 'verified', 'saved')
+
+
+class Job(NamedTuple):
+    url: str
+    busi_dt: str
+    stage: Optional[str]    # stage ล่าสุดที่ทำเสร็จแล้ว (None = ยังไม่เริ่ม)
+    attempts: int
+
+    def reached(self, stage: str) -> bool:
+        """ทำ stage นี้ (หรือ stage ที่อยู่หลังกว่า) เสร็จแล้วหรือยัง"""
+        return self.stage is not None and STAGES.index(self.stage) >= STAGES.index(stage)
+
+
+class JobQueue:
+    """
+    คิวงานแบบถาวรใน SQLite: 1 job ต่อ (URL, BUSI_DT) พร้อม checkpoint ของแต่ละ stage
+    - รันซ้ำวันเดิมจะข้าม URL ที่เสร็จแล้ว และทำต่อจาก stage ล่าสุดของ URL ที่ค้าง (ไม่ต้องโหลดหน้า / เรียก LLM ซ้ำ)
+    - job ที่ failed จะถูกนำกลับมาลองใหม่เมื่อ enqueue ซ้ำ (checkpoint เดิมยังอยู่)
+    - หลาย process ใช้ไฟล์เดียวกันได้: claim ด้วย BEGIN IMMEDIATE + lease ต่อ worker
+      (worker ที่ตายกลางทาง lease จะหมดอายุแล้ว worker อื่นรับไปทำต่อจาก checkpoint)
+    - job ที่ถูกคืนระหว่าง backoff / circuit breaker มี not_before: worker อื่น claim ไม่ได้จนกว่าจะถึงเวลา
+
+    วิธีใช้:
+        queue = JobQueue()
+        queue.enqueue(urls, busi_dt)
+        job = queue.claim(url, busi_dt)
+        if job and not job.reached('fetched'):
+            job = queue.checkpoint(job, 'fetched', {'html': html})
+        ...
+        queue.complete(job)
+    """
+    def __init__(self, path: str = JOB_QUEUE_PATH, worker_id: Optional[str] = None,
+                 lease_seconds: float = JOB_LEASE_SECONDS, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # isolation_level=None: จัดการ transaction เองด้วย BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT NOT NULL,
+                busi_dt TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',   -- pending / running / done / failed
+                stage TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                lease_until REAL,
+                error TEXT,
+                not_before REAL,                          -- ห้าม worker อื่น claim ก่อนเวลานี้ (backoff)
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (url, busi_dt)
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if 'not_before' not in columns:
+            # คิวที่สร้างก่อนมี not_before
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN not_before REAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                url TEXT NOT NULL,
+                busi_dt TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (url, busi_dt, stage)
+            )
+        """)
+
+    @contextmanager
+    def _transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    @staticmethod
+    def _encode(payload: Any) -> bytes:
+        return zlib.compress(json.dumps(payload, ensure_ascii=False, default=json_default).encode('utf-8'))
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def enqueue(self, urls: Iterable[str], busi_dt: str) -> int:
+        """
+        เพิ่ม URL เข้าคิวของวันทำการ (URL ที่มีอยู่แล้วไม่ถูกเพิ่มซ้ำ, job ที่ failed กลับเป็น pending)
+        Returns:
+            จำนวน job ที่ยังต้องทำ
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO jobs (url, busi_dt, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (url, busi_dt) DO UPDATE SET status = 'pending', error = NULL, not_before = NULL, updated_at = excluded.updated_at "
+                "WHERE jobs.status = 'failed'",
+                [(url, busi_dt, now) for url in urls],
+            )
+        return len(self.pending_urls(busi_dt))
+
+    def reset(self, urls: Iterable[str], busi_dt: str):
+        """ลบ job และ checkpoint ของ URL เหล่านี้ (เริ่มใหม่ตั้งแต่โหลดหน้า)"""
+        params = [(url, busi_dt) for url in urls]
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM checkpoints WHERE url = ? AND busi_dt = ?", params)
+            conn.executemany("DELETE FROM jobs WHERE url = ? AND busi_dt = ?", params)
+
+    def pending_urls(self, busi_dt: str) -> List[str]:
+        """URL ที่ยังไม่เสร็จและยังไม่มี worker อื่นถือ lease อยู่ (ตามลำดับที่ enqueue)"""
+        rows = self.conn.execute(
+            "SELECT url FROM jobs WHERE busi_dt = ? AND (status = 'pending' "
+            "OR (status = 'running' AND (lease_until < ? OR worker = ?))) ORDER BY rowid",
+            (busi_dt, self.clock(), self.worker_id),
+        ).fetchall()
+        return [url for (url,) in rows]
+
+    def claim(self, url: str, busi_dt: str) -> Optional[Job]:
+        """
+        จอง job ของ URL ให้ worker นี้
+        Returns:
+            Job (พร้อม stage ล่าสุดที่ทำเสร็จ) หรือ None ถ้าเสร็จแล้ว / failed / worker อื่นกำลังทำ
+            / worker อื่นคืนมาระหว่าง backoff และยังไม่ถึง not_before
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT status, stage, attempts, worker, lease_until, not_before FROM jobs WHERE url = ? AND busi_dt = ?",
+                (url, busi_dt),
+            ).fetchone()
+            if row is None:
+                return None
+            status, stage, attempts, worker, lease_until, not_before = row
+            if status in ('done', 'failed'):
+                return None
+            if status == 'pending' and worker != self.worker_id and (not_before or 0) > now:
+                # worker ที่คืน job (worker ยังเป็นเจ้าของเดิม) รอ backoff เองใน scheduler ของมัน
+                logger.info(" ---- %s is backing off for another %.1fs ---- ", url, not_before - now)
+                return None
+            if status == 'running' and worker != self.worker_id and (lease_until or 0) >= now:
+                return None
+            if status == 'running' and worker != self.worker_id:
+                logger.warning(" ---- Taking over %s from %s (lease expired) ---- ", url, worker)
+
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, lease_until = ?, not_before = NULL, "
+                "attempts = attempts + 1, updated_at = ? "
+                "WHERE url = ? AND busi_dt = ?",
+                (self.worker_id, now + self.lease_seconds, now, url, busi_dt),
+            )
+        return Job(url, busi_dt, stage, attempts + 1)
+
+    def checkpoint(self, job: Job, stage: str, payload: Any) -> Job:
+        """บันทึกผลของ stage (เขียนทับของเดิมได้ รันซ้ำได้ผลเหมือนเดิม) และต่ออายุ lease"""
+        now = self.clock()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (url, busi_dt, stage, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job.url, job.busi_dt, stage, self._encode(payload), now),
+            )
+            updated = conn.execute(
+                "UPDATE jobs SET stage = ?, lease_until = ?, updated_at = ? "
+                "WHERE url = ? AND busi_dt = ? AND worker = ? AND status = 'running'",
+                (stage, now + self.lease_seconds, now, job.url, job.busi_dt, self.worker_id),
+            ).rowcount
+        if not updated:
+            logger.warning(" ---- Lost the lease on %s, another worker may be processing it ---- ", job.url)
+        return job._replace(stage=stage)
+
+    def load(self, job: Job, stage: str) -> Optional[Any]:
+        row = self.conn.execute(
+            "SELECT payload FROM checkpoints WHERE url = ? AND busi_dt = ? AND stage = ?",
+            (job.url, job.busi_dt, stage),
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def _finish(self, job: Job, status: str, error: Optional[str] = None):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, worker = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE url = ? AND busi_dt = ? AND worker = ?",
+                (status, error, self.clock(), job.url, job.busi_dt, self.worker_id),
+            )
+
+    def complete(self, job: Job):
+        self._finish(job, 'done')
+
+    def fail(self, job: Job, reason: str):
+        self._finish(job, 'failed', reason)
+
+    def release(self, job: Job, delay: float = 0.0):
+        """
+        คืน job กลับเข้าคิว (ถูกเลื่อนไปลองใหม่ / ถูก interrupt) โดยเก็บ checkpoint ไว้
+        - delay: เวลา backoff ที่เหลือ (วินาที) ระหว่างนี้ worker อื่น claim ไม่ได้
+          (worker นี้ยังถูกบันทึกเป็นเจ้าของ จึงลองใหม่เองได้ตามเวลาใน scheduler)
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'pending', error = NULL, lease_until = NULL, not_before = ?, updated_at = ? "
+                "WHERE url = ? AND busi_dt = ? AND worker = ?",
+                (now + delay if delay > 0 else None, now, job.url, job.busi_dt, self.worker_id),
+            )
+
+    def results(self, busi_dt: str) -> List[Dict]:
+        """ผลสรุปที่บันทึกใน checkpoint 'saved' ของทุก job ที่เสร็จแล้ว (รวมที่ทำโดย worker อื่น / รอบก่อน)"""
+        rows = self.conn.execute(
+            "SELECT c.payload FROM jobs j JOIN checkpoints c "
+            "ON c.url = j.url AND c.busi_dt = j.busi_dt AND c.stage = 'saved' "
+            "WHERE j.busi_dt = ? AND j.status = 'done' ORDER BY j.rowid",
+            (busi_dt,),
+        ).fetchall()
+        return [self._decode(payload) for (payload,) in rows]
+
+    def failures(self, busi_dt: str) -> Dict[str, str]:
+        rows = self.conn.execute(
+            "SELECT url, error FROM jobs WHERE busi_dt = ? AND status = 'failed' ORDER BY rowid", (busi_dt,)
+        ).fetchall()
+        return {url: error or "" for url, error in rows}
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'JobQueue':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
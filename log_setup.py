@@ -0,0 +1,166 @@
+"""
+ตั้งค่า logging ของ scraper: เขียน log จาก thread แยก (QueueHandler -> QueueListener) และกำหนดระดับแยกตาม subsystem
+
+    SCRAPER_LOG_PROFILE=quiet python cli.py -i urls.txt --workers 4
+    SCRAPER_LOG_LEVELS="scraper.extract=DEBUG,verifier=WARNING" python cli.py ...
+    python cli.py --log-profile quiet --log-level scraper.extract=INFO ...
+
+- thread ที่ log แค่ใส่ record ลงคิว (ไม่รอ I/O ของ stdout) การเขียนจริงทำใน thread ของ QueueListener
+- subsystem = ชื่อ logger (ดู SUBSYSTEMS) ระดับของ logger ที่ปิดอยู่ทำให้ logger.debug(...) / info(...)
+  คืนทันทีโดยไม่จัดรูปข้อความ (โค้ดใน hot path ต้องส่งค่าเป็น argument แบบ %s ไม่ใช่ f-string)
+- process ที่ fork ออกไป (cli.py --workers) จะเริ่ม listener ของตัวเองใหม่อัตโนมัติ
+"""
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from typing import Dict, Iterable, Optional
+
+# --- CONFIG ---
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_PROFILE_ENV = 'SCRAPER_LOG_PROFILE'
+LOG_LEVELS_ENV = 'SCRAPER_LOG_LEVELS'
+DEFAULT_LOG_PROFILE = 'default'
+
+# ชื่อ logger ของแต่ละ subsystem
+SUBSYSTEMS = {
+    'scraper': "ผลลัพธ์ต่อ URL (SUCCESS / FAILED / ข้าม) และสรุปท้ายรอบ",
+    'scraper.progress': "ขั้นตอนระหว่างทำแต่ละ URL (โหลดหน้า / รอเนื้อหา / scroll / ตรวจธนาคาร / verify / recovery)",
+    'scraper.extract': "pass ต่างๆ ของการดึงชื่อ/ตำแหน่ง และผลต่อ candidate (DEBUG)",
+    'scraper.detect': "การหาชื่อธนาคารจาก URL / หน้าเว็บ",
+    'verifier': "LLM verification cascade",
+    'job_queue': "คิวงาน / checkpoint",
+    'browser_session': "Chrome session / tab pool",
+    'snapshot_store': "คลัง snapshot",
+    'output_sinks': "CSV / SQLite / Parquet / people index",
+}
+
+# profile -> {ชื่อ logger: ระดับ} ('' = root)
+LOG_PROFILES: Dict[str, Dict[str, str]] = {
+    # เหมือนเดิม: INFO ทุกอย่าง (รายชื่อต่อ candidate อยู่ที่ DEBUG)
+    'default': {'': 'INFO'},
+    # production: เหลือแค่คำเตือน / error และผลลัพธ์ต่อ URL
+    'quiet': {'': 'WARNING', 'scraper': 'INFO', 'scraper.progress': 'WARNING', 'scraper.extract': 'WARNING',
+              'scraper.detect': 'WARNING'},
+    # debug การดึงข้อมูลหน้าใหม่: ทุกอย่างรวม candidate ทีละตัว
+    'verbose': {'': 'DEBUG'},
+}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.handlers.QueueHandler] = None
+_configured: Dict[str, int] = {}
+
+
+def parse_levels(spec: Optional[str]) -> Dict[str, str]:
+    """'scraper.extract=DEBUG,verifier=WARNING' -> {'scraper.extract': 'DEBUG', 'verifier': 'WARNING'}"""
+    levels = {}
+    for item in (spec or "").split(','):
+        if not item.strip():
+            continue
+        name, sep, level = item.partition('=')
+        if not sep:
+            raise ValueError(f"invalid log level '{item}' (expected NAME=LEVEL)")
+        name = name.strip()
+        levels['' if name in ('root', '*') else name] = level.strip().upper()
+    return levels
+
+
+def _level(value) -> int:
+    level = logging.getLevelName(value) if isinstance(value, str) else value
+    if not isinstance(level, int):
+        raise ValueError(f"unknown log level '{value}'")
+    return level
+
+
+def apply_levels(levels: Dict[str, str]):
+    """ตั้งระดับของ logger ตามชื่อ (logger ที่เคยตั้งจาก profile ก่อนหน้าแต่ไม่อยู่ในชุดใหม่จะกลับเป็น NOTSET)"""
+    resolved = {name: _level(level) for name, level in levels.items()}
+    for name in _configured:
+        if name not in resolved and name:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, level in resolved.items():
+        logging.getLogger(name or None).setLevel(level)
+    _configured.clear()
+    _configured.update(resolved)
+
+
+def _start_listener(stream):
+    global _listener
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _listener = logging.handlers.QueueListener(_handler.queue, handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _restart_after_fork():
+    # thread ของ listener ไม่ตามมาใน process ลูก: สร้างคิว / thread ใหม่ (record ที่ค้างในคิวเป็นของ process แม่)
+    if _handler is None:
+        return
+    stream = _listener.handlers[0].stream if _listener else sys.stdout
+    _handler.queue = queue.SimpleQueue()
+    _start_listener(stream)
+
+
+def setup_logging(profile: Optional[str] = None, levels: Optional[Dict[str, str]] = None,
+                  stream=None, force: bool = False) -> bool:
+    """
+    ติดตั้ง queue handler บน root logger (ครั้งแรกเท่านั้น ถ้า root มี handler อยู่แล้วจะไม่แตะ เว้นแต่ force=True
+    เหมือน logging.basicConfig) แล้วตั้งระดับตาม profile + levels
+    profile / levels ที่ไม่ส่งมาอ่านจาก SCRAPER_LOG_PROFILE / SCRAPER_LOG_LEVELS
+    Returns:
+        True ถ้าติดตั้ง handler ในการเรียกครั้งนี้
+    """
+    global _handler
+    root = logging.getLogger()
+    installed = False
+    if force or not root.handlers:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            if handler is not _handler:
+                handler.close()
+        stop_logging()
+        _handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        _start_listener(stream or sys.stdout)
+        root.addHandler(_handler)
+        installed = True
+    elif profile is None and levels is None and _configured:
+        # เรียกซ้ำแบบไม่ระบุอะไร (เช่น import Ai_scraper หลัง cli.py ตั้งค่าแล้ว) ไม่ทับค่าที่ตั้งไว้
+        return False
+
+    profile = profile or os.environ.get(LOG_PROFILE_ENV) or DEFAULT_LOG_PROFILE
+    if profile not in LOG_PROFILES:
+        raise ValueError(f"unknown log profile '{profile}' (choose from {', '.join(LOG_PROFILES)})")
+    merged = dict(LOG_PROFILES[profile])
+    merged.update(parse_levels(os.environ.get(LOG_LEVELS_ENV)) if levels is None else levels)
+    apply_levels(merged)
+    return installed
+
+
+def flush_logging():
+    """รอให้ listener เขียน record ที่ค้างในคิวจนหมด (เช่น ก่อน process worker จบ) แล้วทำงานต่อ"""
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
+
+
+def stop_logging():
+    """เขียน record ที่ค้างทั้งหมดแล้วหยุด thread ของ listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def level_arguments(values: Iterable[str]) -> Dict[str, str]:
+    """รวมค่า --log-level NAME=LEVEL หลายครั้ง (แต่ละค่าคั่นด้วย , ได้)"""
+    levels = {}
+    for value in values:
+        levels.update(parse_levels(value))
+    return levels
+
+
+atexit.register(stop_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
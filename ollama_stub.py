@@ -0,0 +1,366 @@
+"""
+Ollama /api/generate แบบจำลองสำหรับทดสอบ / วัดผล Verifier โดยไม่ต้องมี Ollama จริง
+
+    python ollama_stub.py --port 11435 --replay recordings.jsonl --latency 0.5 --tokens-per-sec 40
+    Verifier(ollama_url='http://127.0.0.1:11435/api/generate')
+
+- replay: ไฟล์ JSONL ของ response ที่บันทึกจาก Ollama จริง (object ที่มี key 'response')
+  ใส่ 'match' (ข้อความที่ต้องอยู่ใน prompt) เพื่อเลือกคำตอบตาม prompt ได้ ถ้าไม่มีจะวนตามลำดับ
+- รองรับ "stream": true (NDJSON ทีละ chunk เหมือน Ollama) และ false
+- จำลอง latency ก่อน token แรก, ความเร็ว token/s, จำนวน request ที่ประมวลผลพร้อมกัน (--parallel)
+  และคิวเต็ม (--max-queue -> 503 เหมือน OLLAMA_MAX_QUEUE)
+- จำลอง prompt cache / keep_alive: --prompt-tokens-per-sec คิดเวลาเฉพาะ token ที่ต่อจาก prefix เดียวกับ prompt ก่อนหน้า
+  ของโมเดลนั้น และ --load-seconds ถูกคิดเมื่อโมเดลยังไม่ถูกโหลด, keep_alive หมดอายุ หรือ num_ctx เปลี่ยน
+- ใส่ความผิดพลาดได้: JSON เสีย (--malformed-rate), HTTP 500 (--error-rate), ค้างเกิน timeout (--stall-rate)
+"""
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+STUB_HOST = '127.0.0.1'
+STUB_PORT = 11435
+STUB_LATENCY = 0.2            # วินาทีก่อน token แรก (load + prompt eval)
+STUB_TOKENS_PER_SEC = 200.0   # ความเร็วการสร้าง token (0 = ส่งทันที)
+STUB_CHARS_PER_TOKEN = 4      # ใช้ประมาณจำนวน token จากความยาวข้อความ
+STUB_STREAM_CHUNK_TOKENS = 8
+STUB_STALL_SECONDS = 600
+STUB_PROMPT_TOKENS_PER_SEC = 0.0   # ความเร็ว prompt eval ของ token ที่ไม่อยู่ใน cache (0 = รวมอยู่ใน latency แล้ว)
+STUB_LOAD_SECONDS = 0.0            # เวลาโหลดโมเดล / สร้าง context ใหม่
+STUB_KEEP_ALIVE = 300.0            # วินาทีที่โมเดลค้างอยู่หลัง request ล่าสุด (Ollama default 5m)
+
+# คำตอบเมื่อไม่มีไฟล์ replay: ข้อมูลครบ ไม่มีชื่อตกหล่น
+DEFAULT_RESPONSE = json.dumps({"is_complete": True, "missing_names": [], "extra_names": []}, ensure_ascii=False)
+
+
+def load_recordings(path: str) -> List[Dict]:
+    """อ่านไฟล์ JSONL ของ response ที่บันทึกไว้ (บรรทัดละ object ที่มี 'response')"""
+    recordings = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or 'response' not in entry:
+                raise ValueError(f"{path}:{line_no}: expected an object with 'response'")
+            if not isinstance(entry['response'], str):
+                entry['response'] = json.dumps(entry['response'], ensure_ascii=False)
+            recordings.append(entry)
+    return recordings
+
+
+def _truncate_json(text: str, rng: random.Random) -> str:
+    """ตัด JSON ให้เสีย (เหมือนโมเดลหยุดกลางทาง / num_predict หมด)"""
+    if len(text) < 4:
+        return text + '{'
+    return text[:rng.randint(1, len(text) - 2)]
+
+
+def parse_keep_alive(value) -> Optional[float]:
+    """keep_alive ของ Ollama ('30m', '1h', '90s', 300, -1) -> วินาที (None = ค้างตลอด)"""
+    if value is None or value == '':
+        return STUB_KEEP_ALIVE
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        value = str(value).strip()
+        units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        unit = next((u for u in ('ms', 's', 'm', 'h') if value.endswith(u)), '')
+        seconds = float(value[:len(value) - len(unit)]) * units.get(unit, 1)
+    return None if seconds < 0 else seconds
+
+
+def _common_prefix(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    lo, hi = 0, limit
+    while lo < hi:      # binary search บน slice เทียบทีละก้อน (เร็วกว่าเทียบทีละตัวอักษรใน Python)
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class OllamaStub:
+    """
+    HTTP server จำลอง Ollama (/api/generate, /api/tags) รันใน thread แยก
+
+    วิธีใช้:
+        with OllamaStub(latency=0.5, malformed_rate=0.1) as stub:
+            verifier = Verifier(ollama_url=stub.url)
+            ...
+            print(stub.stats)
+    """
+    def __init__(self, recordings: Optional[List[Dict]] = None, host: str = STUB_HOST, port: int = 0,
+                 latency: float = STUB_LATENCY, tokens_per_sec: float = STUB_TOKENS_PER_SEC,
+                 parallel: int = 1, max_queue: int = 512, malformed_rate: float = 0.0,
+                 error_rate: float = 0.0, stall_rate: float = 0.0, seed: Optional[int] = None,
+                 prompt_tokens_per_sec: float = STUB_PROMPT_TOKENS_PER_SEC, load_seconds: float = STUB_LOAD_SECONDS):
+        self.recordings = recordings or [{'response': DEFAULT_RESPONSE}]
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.prompt_tokens_per_sec = prompt_tokens_per_sec
+        self.load_seconds = load_seconds
+        self.max_queue = max_queue
+        self.malformed_rate = malformed_rate
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(parallel)
+        self._cursor = 0
+        self._waiting = 0
+        self._stopped = threading.Event()
+        self._resident = {}     # model -> (num_ctx, หมดอายุเมื่อ (None = ไม่หมด), prompt ล่าสุด)
+        self.stats = {'requests': 0, 'ok': 0, 'malformed': 0, 'errors': 0, 'stalled': 0, 'rejected': 0,
+                      'max_waiting': 0, 'loads': 0, 'cached_tokens': 0}
+
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/generate"
+
+    def start(self) -> 'OllamaStub':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='ollama-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()     # ปล่อย request ที่ค้าง (stall) ให้จบ
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'OllamaStub':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _pick(self, prompt: str) -> Dict:
+        """เลือกคำตอบ: entry แรกที่ 'match' อยู่ใน prompt ไม่งั้นวนตามลำดับใน entry ที่ไม่มี 'match'"""
+        for entry in self.recordings:
+            if entry.get('match') and entry['match'] in prompt:
+                return entry
+        unmatched = [entry for entry in self.recordings if not entry.get('match')] or self.recordings
+        with self._lock:
+            entry = unmatched[self._cursor % len(unmatched)]
+            self._cursor += 1
+        return entry
+
+    def _load(self, model: str, payload: Dict, prompt: str):
+        """
+        Returns:
+            (วินาทีที่ใช้โหลดโมเดล, จำนวนตัวอักษรต้น prompt ที่อยู่ใน cache แล้ว)
+        """
+        num_ctx = (payload.get('options') or {}).get('num_ctx')
+        now = time.monotonic()
+        keep_alive = parse_keep_alive(payload.get('keep_alive'))
+        expires = None if keep_alive is None else now + keep_alive
+        with self._lock:
+            resident = self._resident.get(model)
+            loaded = resident is not None and resident[0] == num_ctx and (resident[1] is None or resident[1] > now)
+            cached = _common_prefix(resident[2], prompt) if loaded else 0
+            self._resident[model] = (num_ctx, expires, prompt)
+            if not loaded:
+                self.stats['loads'] += 1
+            self.stats['cached_tokens'] += cached // STUB_CHARS_PER_TOKEN
+        return (0.0 if loaded else self.load_seconds), cached
+
+    def _fault(self) -> Optional[str]:
+        with self._lock:
+            roll = self._rng.random()
+        for fault, rate in (('error', self.error_rate), ('stall', self.stall_rate), ('malformed', self.malformed_rate)):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                logger.debug("ollama-stub: " + format % args)
+
+            def _send_json(self, status: int, body: Dict):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.rstrip('/') in ('', '/api/tags'):
+                    self._send_json(200, {'models': [{'name': 'stub:latest', 'model': 'stub:latest'}]})
+                else:
+                    self._send_json(404, {'error': 'not found'})
+
+            def do_POST(self):
+                if self.path != '/api/generate':
+                    self._send_json(404, {'error': 'not found'})
+                    return
+                try:
+                    payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                except ValueError:
+                    self._send_json(400, {'error': 'invalid JSON body'})
+                    return
+                stub._generate(self, payload)
+
+        return Handler
+
+    def _generate(self, handler, payload: Dict):
+        self._count('requests')
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                self.stats['rejected'] += 1
+                rejected = True
+            else:
+                self._waiting += 1
+                self.stats['max_waiting'] = max(self.stats['max_waiting'], self._waiting)
+                rejected = False
+        if rejected:
+            handler._send_json(503, {'error': 'server busy, please try again. maximum pending requests exceeded'})
+            return
+
+        try:
+            # รอ slot เหมือน OLLAMA_NUM_PARALLEL
+            with self._slots:
+                with self._lock:
+                    self._waiting -= 1
+                self._respond(handler, payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass    # client ตัดการเชื่อมต่อ (timeout ฝั่ง client)
+
+    def _respond(self, handler, payload: Dict):
+        prompt = f"{payload.get('system', '')}\n{payload.get('prompt', '')}"
+        model = payload.get('model', 'stub')
+        fault = self._fault()
+        started = time.perf_counter()
+
+        if fault == 'error':
+            self._count('errors')
+            handler._send_json(500, {'error': 'stub: simulated runner failure'})
+            return
+        if fault == 'stall':
+            self._count('stalled')
+            self._stopped.wait(STUB_STALL_SECONDS)
+            return
+
+        text = self._pick(prompt)['response']
+        if fault == 'malformed':
+            with self._lock:
+                text = _truncate_json(text, self._rng)
+            self._count('malformed')
+        else:
+            self._count('ok')
+
+        load_seconds, cached_chars = self._load(model, payload, prompt)
+        time.sleep(load_seconds)
+        load_ns = int((time.perf_counter() - started) * 1e9)
+        prompt_tokens = max(1, (len(prompt) - cached_chars) // STUB_CHARS_PER_TOKEN)
+        time.sleep(self.latency + (prompt_tokens / self.prompt_tokens_per_sec if self.prompt_tokens_per_sec > 0 else 0.0))
+        prompt_eval_ns = int((time.perf_counter() - started) * 1e9) - load_ns
+        tokens = max(1, len(text) // STUB_CHARS_PER_TOKEN)
+        token_delay = 1.0 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+        def final(extra: Dict) -> Dict:
+            total_ns = int((time.perf_counter() - started) * 1e9)
+            return dict(extra, model=model, created_at=datetime.now(timezone.utc).isoformat(), done=True,
+                        done_reason='stop', total_duration=total_ns, load_duration=load_ns,
+                        prompt_eval_count=prompt_tokens, prompt_eval_duration=prompt_eval_ns, eval_count=tokens,
+                        eval_duration=max(0, total_ns - load_ns - prompt_eval_ns))
+
+        if payload.get('stream', True) is False:
+            time.sleep(tokens * token_delay)
+            handler._send_json(200, final({'response': text}))
+            return
+
+        # stream: NDJSON ทีละ chunk ปิดท้ายด้วย object ที่ done=true (chunked transfer เหมือน Ollama)
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/x-ndjson')
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+
+        def write_chunk(body: Dict):
+            data = (json.dumps(body, ensure_ascii=False) + '\n').encode('utf-8')
+            handler.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+            handler.wfile.flush()
+
+        step = STUB_STREAM_CHUNK_TOKENS * STUB_CHARS_PER_TOKEN
+        for i in range(0, len(text), step):
+            piece = text[i:i + step]
+            time.sleep(max(1, len(piece) // STUB_CHARS_PER_TOKEN) * token_delay)
+            write_chunk({'model': model, 'created_at': datetime.now(timezone.utc).isoformat(),
+                         'response': piece, 'done': False})
+        write_chunk(final({'response': ''}))
+        handler.wfile.write(b"0\r\n\r\n")
+        handler.wfile.flush()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Ollama /api/generate endpoint")
+    parser.add_argument('--host', default=STUB_HOST)
+    parser.add_argument('--port', type=int, default=STUB_PORT)
+    parser.add_argument('--replay', metavar='JSONL', help="recorded responses to replay (default: always complete)")
+    parser.add_argument('--latency', type=float, default=STUB_LATENCY, help="seconds before the first token")
+    parser.add_argument('--tokens-per-sec', type=float, default=STUB_TOKENS_PER_SEC)
+    parser.add_argument('--prompt-tokens-per-sec', type=float, default=STUB_PROMPT_TOKENS_PER_SEC,
+                        help="prompt eval speed for tokens outside the cached prefix (0 = included in --latency)")
+    parser.add_argument('--load-seconds', type=float, default=STUB_LOAD_SECONDS,
+                        help="model load time when not resident / keep_alive expired / num_ctx changed")
+    parser.add_argument('--parallel', type=int, default=1, help="requests generated at once (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument('--max-queue', type=int, default=512, help="waiting requests before 503 (OLLAMA_MAX_QUEUE)")
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help="fraction of responses with broken JSON")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests failing with HTTP 500")
+    parser.add_argument('--stall-rate', type=float, default=0.0, help="fraction of requests that never answer")
+    parser.add_argument('--seed', type=int)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    stub = OllamaStub(
+        recordings=load_recordings(args.replay) if args.replay else None, host=args.host, port=args.port,
+        latency=args.latency, tokens_per_sec=args.tokens_per_sec, parallel=args.parallel,
+        max_queue=args.max_queue, malformed_rate=args.malformed_rate, error_rate=args.error_rate,
+        stall_rate=args.stall_rate, seed=args.seed, prompt_tokens_per_sec=args.prompt_tokens_per_sec,
+        load_seconds=args.load_seconds,
+    )
+    logger.info(" ---- Ollama stub listening on %s (%s recorded response(s)) ---- ", stub.url, len(stub.recordings))
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.server.server_close()
+        logger.info(" ---- Ollama stub stopped: %s ---- ", stub.stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import os
+import csv
+import logging
+import sqlite3
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import bank_registry
+from executive_record import ExecutiveBatch
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+OUTPUT_DIR = 'output'
+SQLITE_PATH = os.path.join(OUTPUT_DIR, 'executives.sqlite')
+PARQUET_DIR = os.path.join(OUTPUT_DIR, 'parquet')
+
+# คอลัมน์ของไฟล์ CSV (ลำดับตามที่ใช้ส่งงาน)
+CSV_COLUMNS = [
+    'BUSI_DT', 'Eng_Prefix', 'Full_Name', 'Thai_Prefix',
+    'First_Name', 'Surname', 'Bank_Name', 'Position'
+]
+
+# คอลัมน์ของ history (Parquet / SQLite) เก็บ Source_URL และ Recovery_Confidence เป็นคอลัมน์ปกติ
+HISTORY_COLUMNS = CSV_COLUMNS + ['Source_URL', 'Recovery_Confidence']
+
+
+def output_month(busi_dt: str) -> str:
+    """แปลง BUSI_DT (YYYY-MM-DD) เป็น YYYYMM สำหรับชื่อไฟล์"""
+    return busi_dt.replace('-', '')[:6]
+
+
+class OutputSink:
+    """Interface ของ output backend: เขียน records ของธนาคารหนึ่งในวันทำการหนึ่ง"""
+    name = ""
+
+    def write(self, records: List[Dict], bank_name: str, busi_dt: str) -> Optional[str]:
+        """
+        Returns:
+            path ที่เขียน หรือ None ถ้าเขียนไม่สำเร็จ
+        """
+        raise NotImplementedError
+
+
+class StreamingCsvWriter:
+    """
+    เขียน CSV ทีละ record โดยไม่ต้องสร้าง DataFrame
+    - ใช้ format เดียวกับไฟล์ที่ส่งงาน: utf-8-sig, QUOTE_ALL, ลำดับคอลัมน์ตาม columns
+    - เขียนลงไฟล์ .tmp แล้ว rename ทับไฟล์จริงตอน close() (ไฟล์เดิมไม่เสียถ้าโปรแกรมล้มกลางทาง)
+    """
+    def __init__(self, output_path: str, columns: List[str] = CSV_COLUMNS):
+        self.output_path = output_path
+        self.columns = columns
+        self.count = 0
+        self._tmp_path = f"{output_path}.tmp"
+        self._file = open(self._tmp_path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.writer(self._file, quoting=csv.QUOTE_ALL, lineterminator=os.linesep)
+        self._writer.writerow(columns)
+
+    def write(self, record: Dict):
+        self._writer.writerow([record.get(col) or "" for col in self.columns])
+        self.count += 1
+
+    def write_all(self, records: Iterable[Dict]):
+        for record in records:
+            self.write(record)
+
+    def write_rows(self, rows: Iterable[tuple]):
+        """เขียนแถวที่เรียงตาม columns แล้ว (เช่น ExecutiveBatch.rows) โดยไม่ต้องผ่าน dict"""
+        for row in rows:
+            self._writer.writerow(row)
+            self.count += 1
+
+    def close(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.output_path)
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> 'StreamingCsvWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class CsvSink(OutputSink):
+    """
+    ไฟล์ output/{Bank}_{YYYYMM}.csv แบบเดิม (utf-8-sig, QUOTE_ALL, มีแถว Source_URL: ท้ายไฟล์)
+    """
+    name = 'csv'
+
+    def __init__(self, output_dir: str = OUTPUT_DIR):
+        self.output_dir = output_dir
+
+    def write(self, records: List[Dict], bank_name: str, busi_dt: str) -> Optional[str]:
+        filename = f"{bank_registry.file_bank_name(bank_name)}_{output_month(busi_dt)}.csv"
+        os.makedirs(self.output_dir, exist_ok=True)
+        output_path = os.path.join(self.output_dir, filename)
+
+        batch = ExecutiveBatch.of(records)
+        source_url = (batch[0].Source_URL or 'URL ไม่ระบุ') if batch else "URL ไม่ระบุ"
+
+        with StreamingCsvWriter(output_path) as writer:
+            writer.write_rows(batch.rows(CSV_COLUMNS))
+            writer.write({'BUSI_DT': 'Source_URL:', 'Eng_Prefix': source_url})
+        return output_path
+
+
+class SqliteSink(OutputSink):
+    """
+    ตาราง executives ใน SQLite สะสม history ทุกธนาคารทุกวันทำการ
+    - รันซ้ำวันเดิมจะแทนที่ roster ของหน้า (Source_URL) นั้นทั้งชุด ธนาคารที่มีหลายหน้าจึงเก็บได้ครบทุกหน้า
+    - unique index (Bank_Name, BUSI_DT, First_Name, Surname) กันชื่อซ้ำภายใน roster เดียวกัน
+    """
+    name = 'sqlite'
+
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        columns = ", ".join(
+            f"{col} REAL" if col == 'Recovery_Confidence' else f"{col} TEXT NOT NULL"
+            for col in HISTORY_COLUMNS
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS executives ({columns})")
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_executives_bank_dt_name "
+            "ON executives (Bank_Name, BUSI_DT, First_Name, Surname)"
+        )
+        return conn
+
+    def write(self, records: List[Dict], bank_name: str, busi_dt: str) -> Optional[str]:
+        rows = list(ExecutiveBatch.of(records, BUSI_DT=busi_dt).rows(HISTORY_COLUMNS))
+        placeholders = ", ".join("?" for _ in HISTORY_COLUMNS)
+        url_index = HISTORY_COLUMNS.index('Source_URL')
+        source_urls = {row[url_index] for row in rows}
+
+        conn = self._connect()
+        try:
+            with conn:
+                # แทนที่ roster ของหน้านี้ทั้งชุด (คนที่หายไปในการรันซ้ำต้องไม่ค้างอยู่) หน้าอื่นของธนาคารเดียวกันคงเดิม
+                conn.executemany(
+                    "DELETE FROM executives WHERE Bank_Name = ? AND BUSI_DT = ? AND Source_URL = ?",
+                    [(bank_name, busi_dt, url) for url in source_urls],
+                )
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO executives ({', '.join(HISTORY_COLUMNS)}) VALUES ({placeholders})",
+                    rows,
+                )
+        finally:
+            conn.close()
+        return self.path
+
+
+class ParquetSink(OutputSink):
+    """
+    Parquet dataset แยกโฟลเดอร์ตามวันทำการ: output/parquet/{YYYY-MM-DD}/{Bank}.parquet
+    - 1 ไฟล์ต่อธนาคารต่อวันทำการ (รันซ้ำวันเดิมจะเขียนทับเฉพาะไฟล์นั้น)
+    - อ่านทั้งหมดได้ด้วย pd.read_parquet(PARQUET_DIR)
+    - ต้องติดตั้ง pyarrow
+    """
+    name = 'parquet'
+
+    def __init__(self, root: str = PARQUET_DIR):
+        self.root = root
+
+    def write(self, records: List[Dict], bank_name: str, busi_dt: str) -> Optional[str]:
+        try:
+            import pyarrow.parquet  # noqa: F401  (ExecutiveBatch.to_parquet ใช้)
+        except ImportError:
+            logger.error(" ---- Parquet output requires 'pyarrow' (pip install pyarrow) ---- ")
+            return None
+
+        partition_dir = os.path.join(self.root, busi_dt)
+        os.makedirs(partition_dir, exist_ok=True)
+        output_path = os.path.join(partition_dir, f"{bank_registry.file_bank_name(bank_name)}.parquet")
+        return ExecutiveBatch.of(records, BUSI_DT=busi_dt).to_parquet(output_path, HISTORY_COLUMNS)
+
+
+class PeopleIndexSink(OutputSink):
+    """
+    อัปเดตดัชนีผู้บริหารข้ามธนาคาร (people_index.PeopleIndex) ด้วย roster ล่าสุด
+    และ log รายชื่อที่เข้า / ออก / เปลี่ยนตำแหน่งจากรอบก่อน
+    """
+    name = 'people'
+
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+
+    def write(self, records: List[Dict], bank_name: str, busi_dt: str) -> Optional[str]:
+        from people_index import PeopleIndex
+
+        with PeopleIndex(self.path) as index:
+            changes = index.apply_roster(records, bank_name, busi_dt)
+        if changes:
+            counts = Counter(c.change for c in changes)
+            logger.info(" ---- Roster changes for %s: %s ---- ", bank_name,
+                        ", ".join(f"{kind}={count}" for kind, count in sorted(counts.items())))
+        return self.path
+
+
+OUTPUT_SINKS = {sink.name: sink for sink in (CsvSink, SqliteSink, ParquetSink, PeopleIndexSink)}
+
+
+def load_history(path: str = SQLITE_PATH):
+    """
+    โหลด history ทั้งหมดจาก SQLite เป็น pandas DataFrame สำหรับงานวิเคราะห์
+    (import pandas เฉพาะตอนเรียกใช้ ไม่ให้กระทบเวลาเริ่มต้นของ scraper)
+    """
+    import pandas as pd
+
+    conn = sqlite3.connect(path)
+    try:
+        return pd.read_sql_query("SELECT * FROM executives ORDER BY Bank_Name, BUSI_DT", conn)
+    finally:
+        conn.close()
+
+
+def get_sinks(names: List[str]) -> List[OutputSink]:
+    """สร้าง sink ตามชื่อ เช่น ['csv', 'sqlite'] (ชื่อที่ไม่รู้จักจะถูกข้ามพร้อม warning)"""
+    sinks = []
+    for name in names:
+        sink_cls = OUTPUT_SINKS.get(name.strip().lower())
+        if sink_cls is None:
+            logger.warning(" ---- Unknown output backend '%s' (available: %s) ---- ", name, ', '.join(OUTPUT_SINKS))
+            continue
+        sinks.append(sink_cls())
+    return sinks
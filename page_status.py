@@ -0,0 +1,131 @@
+import re
+from enum import Enum
+from typing import NamedTuple, Optional
+
+
+class PageStatus(Enum):
+    OK = 'ok'
+    NOT_FOUND = 'not_found'        # หน้า 404 / ไม่พบหน้า
+    BLOCKED = 'blocked'            # WAF / edge (Akamai, Cloudflare, Incapsula, F5) ปฏิเสธการเข้าถึง
+    CAPTCHA = 'captcha'            # ต้องยืนยันตัวตน / JS challenge
+    EMPTY_SHELL = 'empty_shell'    # SPA ที่ยัง render ไม่เสร็จ หรือหน้าแทบไม่มีเนื้อหา
+
+
+class RetryHint(NamedTuple):
+    retry: bool            # ควรลองโหลดใหม่หรือไม่
+    backoff: float         # วินาทีที่ควรรอก่อนลองใหม่
+    extra_wait: float      # เวลารอ render เพิ่มเติมในการโหลดครั้งถัดไป
+    max_attempts: int      # จำนวนครั้งสูงสุดที่ควรโหลดหน้านี้ (รวมครั้งแรก)
+
+
+class PageCheck(NamedTuple):
+    status: PageStatus
+    reason: str
+
+    @property
+    def ok(self) -> bool:
+        return self.status is PageStatus.OK
+
+
+# --- CONFIG ---
+MIN_PAGE_SIZE = 500          # ขนาด HTML ขั้นต่ำ (เท่ากับเกณฑ์เดิมของ fetch_page_content)
+MIN_VISIBLE_TEXT = 200       # จำนวนตัวอักษรที่มองเห็นขั้นต่ำของหน้าที่มีเนื้อหา
+SMALL_PAGE_SIZE = 50000      # ตรวจ signature ใน body เฉพาะหน้าที่เล็กกว่านี้ (หน้าจริงอาจฝัง recaptcha ในฟอร์ม)
+
+RETRY_HINTS = {
+    PageStatus.OK: RetryHint(False, 0, 0, 1),
+    PageStatus.NOT_FOUND: RetryHint(False, 0, 0, 1),
+    PageStatus.CAPTCHA: RetryHint(False, 0, 0, 1),
+    PageStatus.BLOCKED: RetryHint(True, 15, 0, 2),      # ลองซ้ำครั้งเดียวหลังรอ ถ้ายังโดน block ก็เลิก
+    PageStatus.EMPTY_SHELL: RetryHint(True, 2, 10, 3),  # รอ render นานขึ้นในครั้งถัดไป
+}
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_OG_TITLE_RE = re.compile(r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']*)', re.IGNORECASE)
+_INVISIBLE_RE = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+_NOT_FOUND_TITLE_RE = re.compile(r'\b404\b|not found|page not found|ไม่พบหน้า', re.IGNORECASE)
+_BLOCKED_TITLE_RE = re.compile(
+    r'access denied|403 forbidden|\bforbidden\b|request rejected|request unsuccessful|'
+    r'attention required|you have been blocked',
+    re.IGNORECASE,
+)
+_CAPTCHA_TITLE_RE = re.compile(r'just a moment|captcha|verify you are human|security check', re.IGNORECASE)
+
+_BLOCKED_BODY_RE = re.compile(
+    r'errors\.edgesuite\.net|You don\'t have permission to access|Incapsula incident|'
+    r'The requested URL was rejected|cf-error-details|Sorry, you have been blocked',
+    re.IGNORECASE,
+)
+_CAPTCHA_BODY_RE = re.compile(
+    r'g-recaptcha|h-captcha|hcaptcha\.com|challenge-platform|cf-chl-|captcha-delivery',
+    re.IGNORECASE,
+)
+# ข้อความที่บอกว่าเป็นหน้ารายชื่อผู้บริหารจริง (ชื่อที่มีคำนำหน้า / คำในตำแหน่ง)
+# หน้าแบบนี้อาจฝัง recaptcha ในฟอร์มติดต่อ -> ไม่ใช้ signature ใน body ตัดสิน
+_ROSTER_TEXT_RE = re.compile(
+    r'(?:นาย|นางสาว|นาง|ดร\.|Mr\.|Mrs\.|Ms\.|Dr\.)\s*[ก-๙A-Z]|'
+    r'กรรมการ|ผู้จัดการ|ผู้บริหาร|ประธาน|\b(?:Chairman|Director|President|Chief|Officer)\b',
+)
+
+
+def _title(html: str) -> str:
+    match = _TITLE_RE.search(html)
+    return re.sub(r'\s+', ' ', match.group(1)).strip() if match else ""
+
+
+def visible_text(html: str) -> str:
+    """ข้อความที่มองเห็นได้โดยประมาณ (ตัด script / style / tag) โดยไม่ต้อง parse DOM"""
+    return _TAG_RE.sub(' ', _INVISIBLE_RE.sub(' ', html)).replace('&nbsp;', ' ')
+
+
+def visible_text_length(html: str) -> int:
+    """ประมาณจำนวนตัวอักษรที่มองเห็นได้ โดยไม่ต้อง parse DOM"""
+    return len(re.sub(r'\s+', '', visible_text(html)))
+
+
+def classify_page(html: Optional[str]) -> PageCheck:
+    """
+    จัดประเภทหน้าเว็บจาก HTML ดิบ (ก่อน parse) เพื่อตัดหน้าที่ไม่มีข้อมูลออกตั้งแต่ต้น
+    ตรวจตามลำดับ: title (block / captcha / 404) -> signature ใน body ของหน้าเล็ก -> ขนาด -> ข้อความที่มองเห็น
+    (หน้า block ของ WAF มักเล็กกว่า MIN_PAGE_SIZE จึงต้องตรวจ signature ก่อนขนาด)
+    - signature ใน body ใช้เฉพาะหน้าที่ไม่มีชื่อ / คำในตำแหน่งในข้อความที่มองเห็น
+      (captcha ไม่ถูกลองใหม่: หน้ารายชื่อที่ฝัง g-recaptcha ในฟอร์มต้องไม่ถูกตัดทิ้ง)
+    Returns:
+        PageCheck(status, reason)
+    """
+    if not html:
+        return PageCheck(PageStatus.EMPTY_SHELL, "empty page")
+
+    title = _title(html)
+    og_title = _OG_TITLE_RE.search(html)
+    titles = f"{title} | {og_title.group(1) if og_title else ''}"
+
+    if _BLOCKED_TITLE_RE.search(titles):
+        return PageCheck(PageStatus.BLOCKED, f"title: {title}")
+    if _CAPTCHA_TITLE_RE.search(titles):
+        return PageCheck(PageStatus.CAPTCHA, f"title: {title}")
+    if _NOT_FOUND_TITLE_RE.search(titles):
+        return PageCheck(PageStatus.NOT_FOUND, f"title: {title}")
+
+    if len(html) < SMALL_PAGE_SIZE and not _ROSTER_TEXT_RE.search(visible_text(html)):
+        match = _BLOCKED_BODY_RE.search(html)
+        if match:
+            return PageCheck(PageStatus.BLOCKED, f"signature: {match.group(0)}")
+        match = _CAPTCHA_BODY_RE.search(html)
+        if match:
+            return PageCheck(PageStatus.CAPTCHA, f"signature: {match.group(0)}")
+
+    if len(html) < MIN_PAGE_SIZE:
+        return PageCheck(PageStatus.EMPTY_SHELL, f"page too small ({len(html)} chars)")
+
+    text_length = visible_text_length(html)
+    if text_length < MIN_VISIBLE_TEXT:
+        return PageCheck(PageStatus.EMPTY_SHELL, f"only {text_length} visible chars")
+
+    return PageCheck(PageStatus.OK, "")
+
+
+def retry_hint(check: PageCheck) -> RetryHint:
+    return RETRY_HINTS[check.status]
@@ -0,0 +1,173 @@
+import re
+import time
+import logging
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+SCAN_TIME_BUDGET = 2.0       # วินาทีสูงสุดของการ scan ต่อหน้า (เกินแล้วคืนผลที่ได้ถึงตอนนั้น)
+FAST_PATH_MAX_LINE = 300     # บรรทัดยาวสุดที่ยังใช้ regex เดิมได้ (ยาวกว่านี้ใช้ sweep)
+FAST_PATH_BUDGET = 0.05      # วินาทีที่ regex เดิมใช้ได้ก่อนเปลี่ยนไป sweep (บรรทัดสั้นแต่มีคำนำหน้าถี่มาก)
+FAST_PATH_CHUNK = 4096       # ตัวอักษรต่อก้อนของ regex เดิม (ตรวจเวลาระหว่างก้อน)
+
+# คำนำหน้าชื่อตามลำดับ alternation ของ pattern เดิม (นาง มาก่อน นางสาว)
+TITLE_PREFIXES = ('นาย', 'นาง', 'นางสาว', 'ดร.', 'คุณ')
+POSITION_KEYWORDS = ('ผู้จัดการ', 'กรรมการ', 'ประธาน', 'ผู้บริหาร',
+                     'Director', 'Manager', 'CEO', 'CFO', 'CTO', 'COO', 'President')
+
+# ขนาดของแต่ละส่วน (เท่ากับ pattern เดิม ((?:title)[^\n]{10,80})\s+([^\n]{10,100}(?:keyword)[^\n]{0,50}))
+NAME_MIN, NAME_MAX = 10, 80          # ความยาวหลังคำนำหน้า
+LEAD_MIN, LEAD_MAX = 10, 100         # ความยาวของตำแหน่งก่อน keyword
+TAIL_MAX = 50                        # ความยาวหลัง keyword
+
+# sweep เดียวหา title / keyword / newline ทุกตัว (alternation ของ literal ล้วน ไม่มี backtracking)
+_SWEEP_RE = re.compile(
+    '|'.join(
+        [f"(?P<t{i}>{re.escape(t)})" for i, t in enumerate(sorted(set(TITLE_PREFIXES), key=len, reverse=True))]
+        + [f"(?P<k{i}>{re.escape(k)})" for i, k in enumerate(POSITION_KEYWORDS)]
+        + ["(?P<nl>\n)"]
+    ),
+    re.IGNORECASE,
+)
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+_NON_SPACE_RE = re.compile(r'\S')
+
+# pattern1 เดิมของ PASS 4 - backtrack ได้ไม่เกินความยาวบรรทัด จึงเร็วกว่า sweep เมื่อทุกบรรทัดสั้น
+_LEGACY_RE = re.compile(
+    f"((?:{'|'.join(map(re.escape, TITLE_PREFIXES))})[^\\n]{{{NAME_MIN},{NAME_MAX}}})"
+    f"\\s+([^\\n]{{{LEAD_MIN},{LEAD_MAX}}}(?:{'|'.join(map(re.escape, POSITION_KEYWORDS))})[^\\n]{{0,{TAIL_MAX}}})",
+    re.IGNORECASE,
+)
+
+# keyword ที่ซ้อนอยู่ใน keyword อื่น (เช่น 'cto' ใน 'director') - sweep ไม่เจอเพราะไม่ซ้อนกัน จึงเติมให้เอง
+_NESTED_KEYWORDS = {
+    outer.lower(): [(outer.lower().find(inner.lower()), len(inner)) for inner in POSITION_KEYWORDS
+                    if inner != outer and outer.lower().find(inner.lower()) > 0]
+    for outer in POSITION_KEYWORDS
+}
+
+
+def _title_lengths(matched: str) -> List[int]:
+    """ความยาวคำนำหน้าที่ pattern เดิมจะลองตามลำดับ (เช่น 'นางสาว' -> ลอง 'นาง' ก่อน)"""
+    return [len(t) for t in TITLE_PREFIXES if matched.startswith(t)]
+
+
+def scan_name_position_pairs(text: str, time_budget: float = SCAN_TIME_BUDGET) -> List[Tuple[str, str]]:
+    """
+    หาคู่ (ชื่อ, ตำแหน่ง) จากข้อความทั้งหน้า ได้ผลเท่ากับ regex pattern1 ของ PASS 4
+    - ทุกบรรทัดสั้น (ไม่เกิน FAST_PATH_MAX_LINE): ใช้ regex เดิม (backtrack ได้ไม่เกินความยาวบรรทัด)
+    - มีบรรทัดยาว (เช่น get_text() ของหน้า minified): ใช้ sweep เชิงเส้นที่มี time_budget
+    Returns:
+        List ของ (name, position) ที่ยังไม่ได้ clean / validate
+    """
+    if max(map(len, text.split('\n'))) > FAST_PATH_MAX_LINE:
+        return _sweep_pairs(text, time_budget)
+
+    started = time.monotonic()
+    pairs = []
+    pos = 0
+    while pos < len(text):
+        elapsed = time.monotonic() - started
+        if elapsed > FAST_PATH_BUDGET:
+            logger.debug(" ---- Pattern scan switched to sweep at char %s/%s ---- ", pos, len(text))
+            return pairs + _sweep_pairs(text[pos:], time_budget - elapsed)
+        chunk_end = text.find('\n', pos + FAST_PATH_CHUNK)
+        if chunk_end < 0:
+            chunk_end = len(text)
+        # match ที่เริ่มในก้อนนี้ข้ามได้แค่บรรทัดว่าง (ผ่าน \s+) ไปจบในบรรทัดถัดไปที่มีตัวอักษร
+        next_text = _NON_SPACE_RE.search(text, chunk_end)
+        endpos = text.find('\n', next_text.start()) if next_text else -1
+        if endpos < 0:
+            endpos = len(text)
+        resume_at = chunk_end
+        for match in _LEGACY_RE.finditer(text, pos, endpos):
+            if match.start() >= chunk_end:
+                break
+            pairs.append(match.groups())
+            resume_at = max(match.end(), chunk_end)
+        pos = resume_at
+    return pairs
+
+
+def _sweep_pairs(text: str, time_budget: float = SCAN_TIME_BUDGET) -> List[Tuple[str, str]]:
+    """
+    หาคู่ (ชื่อ, ตำแหน่ง) ในเวลาเชิงเส้น (ไม่ backtrack บนบรรทัดยาว)
+    - sweep รอบเดียวหาตำแหน่งของคำนำหน้าชื่อ, keyword ของตำแหน่ง และ newline
+    - แต่ละคำนำหน้า: หาจุดตัดชื่อ (ช่องว่างที่ห่าง 10-80 ตัวอักษร ไกลสุดก่อน) แล้วจับคู่กับ keyword
+      ตัวที่ไกลที่สุดที่อยู่ห่าง 10-100 ตัวอักษรในบรรทัดเดียวกัน (ใช้ bisect ไม่ลองทีละตัวอักษร)
+    - ผลที่ได้ไม่ซ้อนกัน (เหมือน re.findall) และหยุดเมื่อเกิน time_budget
+    Returns:
+        List ของ (name, position) ที่ยังไม่ได้ clean / validate
+    """
+    titles = []          # (start, matched text)
+    keyword_starts = []
+    keyword_ends = []
+    newlines = []
+    for match in _SWEEP_RE.finditer(text):
+        kind = match.lastgroup[0]
+        if kind == 't':
+            titles.append((match.start(), match.group()))
+        elif kind == 'k':
+            keyword_starts.append(match.start())
+            keyword_ends.append(match.end())
+            for offset, length in _NESTED_KEYWORDS[match.group().lower()]:
+                keyword_starts.append(match.start() + offset)
+                keyword_ends.append(match.start() + offset + length)
+        else:
+            newlines.append(match.start())
+
+    def line_end(pos: int) -> int:
+        i = bisect_left(newlines, pos)
+        return newlines[i] if i < len(newlines) else len(text)
+
+    deadline = time.monotonic() + time_budget
+    pairs = []
+    resume_at = 0
+
+    for count, (start, matched) in enumerate(titles):
+        if start < resume_at:
+            continue
+        if count % 256 == 0 and time.monotonic() > deadline:
+            logger.warning(" ---- Pattern scan stopped after %ss at char %s/%s ---- ", time_budget, start, len(text))
+            break
+        if bisect_left(keyword_starts, start) == len(keyword_starts):
+            break   # ไม่มี keyword หลังจากนี้แล้ว
+
+        end_of_line = line_end(start)
+        found = _match_at(text, start, matched, end_of_line, keyword_starts, keyword_ends, line_end)
+        if found:
+            name_end, position_start, position_end = found
+            pairs.append((text[start:name_end], text[position_start:position_end]))
+            resume_at = position_end
+
+    return pairs
+
+
+def _match_at(text: str, start: int, matched: str, end_of_line: int,
+              keyword_starts: List[int], keyword_ends: List[int], line_end) -> Optional[Tuple[int, int, int]]:
+    for title_length in _title_lengths(matched):
+        # ชื่อยาวที่สุดก่อน (greedy) และต้องอยู่ในบรรทัดเดียวกับคำนำหน้า
+        longest = min(start + title_length + NAME_MAX, end_of_line)
+        shortest = start + title_length + NAME_MIN
+        previous_end, run_end, tried_from = -1, -1, -1
+        for name_end in range(longest, shortest - 1, -1):
+            if name_end >= len(text) or not text[name_end].isspace():
+                continue
+            if name_end != previous_end - 1:    # เริ่ม whitespace run ใหม่
+                run_end = _WHITESPACE_RUN_RE.match(text, name_end).end()
+                tried_from = run_end + 1
+            previous_end = name_end
+            # \s+ ยอมคืนช่องว่างท้ายให้ตำแหน่งได้ (ตำแหน่งห้ามมี newline และ keyword อยู่หลังช่องว่างเสมอ
+            # จึงลองย้อนไม่เกิน LEAD_MAX ตัวอักษร) - จุดเริ่มที่ลองกับ name_end ก่อนหน้าใน run เดียวกันไม่ต้องลองซ้ำ
+            first_start = max(name_end + 1, text.rfind('\n', name_end, run_end) + 1, run_end - LEAD_MAX)
+            for position_start in range(tried_from - 1, first_start - 1, -1):
+                position_line_end = line_end(position_start)
+                # keyword ที่ไกลที่สุดที่เริ่มภายใน [position_start + 10, position_start + 100] ในบรรทัดเดียวกัน
+                i = bisect_right(keyword_starts, min(position_start + LEAD_MAX, position_line_end - 1)) - 1
+                if i < 0 or keyword_starts[i] < position_start + LEAD_MIN:
+                    continue
+                return name_end, position_start, min(keyword_ends[i] + TAIL_MAX, position_line_end)
+            tried_from = min(tried_from, first_start)
+    return None
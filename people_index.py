@@ -0,0 +1,419 @@
+import os
+import re
+import logging
+import sqlite3
+import unicodedata
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional
+
+from output_sinks import SQLITE_PATH
+from position_taxonomy import classify_position
+
+logger = logging.getLogger(__name__)
+
+_INVISIBLE_RE = re.compile(r'[\u200b-\u200f\u2060\ufeff\u00ad]')
+
+
+def person_key(first_name: str, surname: str) -> str:
+    """
+    key ของบุคคลข้ามธนาคาร: ชื่อ + นามสกุลที่ normalize แล้ว
+    (NFC, ตัด zero-width / soft hyphen ที่ติดมาจาก CMS, ยุบช่องว่าง, ตัวพิมพ์เล็ก)
+    """
+    parts = []
+    for text in (first_name, surname):
+        text = _INVISIBLE_RE.sub('', unicodedata.normalize('NFC', text or ''))
+        parts.append(re.sub(r'\s+', ' ', text).strip().lower())
+    return "|".join(parts)
+
+
+class RosterChange(NamedTuple):
+    bank_name: str
+    busi_dt: str
+    change: str                  # added / removed / position_changed / retitled (ข้อความเปลี่ยน ตำแหน่งมาตรฐานเดิม)
+    person_key: str
+    full_name: str
+    old_position: Optional[str]  # added: ตำแหน่งเดิมถ้าเคยอยู่ธนาคารนี้มาก่อน
+    new_position: Optional[str]
+    source_url: str
+
+
+class PeopleIndex:
+    """
+    ดัชนีผู้บริหารข้ามธนาคาร (ตารางอยู่ในไฟล์ SQLite เดียวกับ history ของ SqliteSink)
+    - memberships: สถานะล่าสุดของแต่ละคนในแต่ละธนาคาร (ตำแหน่ง, first_seen, last_seen, active)
+    - roster_changes: log ของการเปลี่ยนแปลงต่อรอบ (added / removed / position_changed / retitled)
+      รายงานรายเดือนอ่านจาก log นี้ ไม่ต้องเทียบ roster ทั้งหมดใหม่
+    - ตำแหน่งเทียบกันด้วยตำแหน่งมาตรฐานของ position_taxonomy: เขียนต่างกันแต่เป็นตำแหน่งเดียวกัน
+      ('กรรมการผู้จัดการใหญ่' / 'Managing Director') เป็น retitled ซึ่งไม่ถูกนับในรายงาน
+    - apply_roster() เทียบ roster ใหม่กับสมาชิก active ของธนาคาร (เฉพาะธนาคารนั้น ไม่ scan ทั้งตาราง)
+      รันซ้ำวันเดิมได้: ถอยผลของรอบเดิมออกจาก log ก่อนแล้วค่อยใส่ใหม่
+    - ธนาคารที่มีหลายหน้า (Source_URL) ในวันเดียวกัน: roster_pages เก็บรายชื่อของแต่ละหน้า
+      roster ของวันนั้นคือรวมทุกหน้า (หน้าที่สองไม่ลบคนของหน้าแรก)
+    """
+    def __init__(self, path: str = SQLITE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS roster_runs (
+                bank_name TEXT NOT NULL,
+                busi_dt TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                people INTEGER NOT NULL,
+                PRIMARY KEY (bank_name, busi_dt)
+            );
+            CREATE TABLE IF NOT EXISTS memberships (
+                person_key TEXT NOT NULL,
+                bank_name TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                surname TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                position TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                active INTEGER NOT NULL,
+                PRIMARY KEY (person_key, bank_name)
+            );
+            CREATE INDEX IF NOT EXISTS idx_memberships_bank_active ON memberships (bank_name, active);
+            CREATE TABLE IF NOT EXISTS roster_pages (
+                bank_name TEXT NOT NULL,
+                busi_dt TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                person_key TEXT NOT NULL,
+                first_name TEXT NOT NULL,
+                surname TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                position TEXT NOT NULL,
+                PRIMARY KEY (bank_name, busi_dt, source_url, person_key)
+            );
+            CREATE TABLE IF NOT EXISTS roster_changes (
+                bank_name TEXT NOT NULL,
+                busi_dt TEXT NOT NULL,
+                change TEXT NOT NULL,
+                person_key TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                old_position TEXT,
+                new_position TEXT,
+                source_url TEXT NOT NULL,
+                prev_last_seen TEXT       -- ใช้ถอยผลของรอบนี้ (added ของคนที่เคยออกไปแล้ว)
+            );
+            CREATE INDEX IF NOT EXISTS idx_roster_changes_bank_dt ON roster_changes (bank_name, busi_dt);
+            CREATE INDEX IF NOT EXISTS idx_roster_changes_dt ON roster_changes (busi_dt);
+            CREATE INDEX IF NOT EXISTS idx_roster_changes_person ON roster_changes (person_key);
+        """)
+
+    @contextmanager
+    def _transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _last_run(self, conn, bank_name: str) -> Optional[str]:
+        row = conn.execute("SELECT MAX(busi_dt) FROM roster_runs WHERE bank_name = ?", (bank_name,)).fetchone()
+        return row[0]
+
+    def apply_roster(self, records: List[Dict], bank_name: str, busi_dt: str) -> List[RosterChange]:
+        """
+        บันทึก roster ของธนาคารในวันทำการ แล้วคืนรายการที่เปลี่ยนจากรอบก่อนหน้า
+        (รอบแรกของธนาคารนับทุกคนเป็น added, วันที่เก่ากว่ารอบล่าสุดจะถูกข้าม)
+        - records แทนที่รายชื่อเฉพาะหน้า (Source_URL) ของตัวเอง แล้วเทียบด้วย roster รวมทุกหน้าของวันนั้น
+        """
+        page_roster = {}
+        for record in records:
+            key = person_key(record.get('First_Name', ''), record.get('Surname', ''))
+            if key.split('|')[0]:
+                page_roster.setdefault(key, record)
+        source_url = next((r.get('Source_URL') for r in records if r.get('Source_URL')), "")
+
+        with self._transaction() as conn:
+            last_run = self._last_run(conn, bank_name)
+            if last_run and busi_dt < last_run:
+                logger.warning(" ---- People index for %s is already at %s, skipping older roster %s ---- ",
+                               bank_name, last_run, busi_dt)
+                return []
+            if last_run == busi_dt:
+                self._seed_pages(conn, bank_name, busi_dt)
+                self._undo_run(conn, bank_name, busi_dt)
+
+            self._store_pages(conn, page_roster, bank_name, busi_dt, source_url)
+            roster = self._day_roster(conn, bank_name, busi_dt)
+            if roster:
+                source_url = next(iter(roster.values()))['Source_URL']
+
+            active = {
+                key: (position, full_name)
+                for key, position, full_name in conn.execute(
+                    "SELECT person_key, position, full_name FROM memberships WHERE bank_name = ? AND active = 1",
+                    (bank_name,),
+                )
+            }
+            changes = []
+
+            for key, record in roster.items():
+                position = record.get('Position') or ""
+                full_name = record.get('Full_Name') or ""
+                url = record.get('Source_URL') or source_url
+                if key not in active:
+                    # คนที่เคยอยู่แล้วออกไป: เก็บ last_seen / ตำแหน่งเดิมไว้ถอยผลได้
+                    previous = conn.execute(
+                        "SELECT last_seen, position FROM memberships WHERE person_key = ? AND bank_name = ?",
+                        (key, bank_name),
+                    ).fetchone()
+                    conn.execute(
+                        "INSERT INTO memberships (person_key, bank_name, first_name, surname, full_name, position, "
+                        "source_url, first_seen, last_seen, active) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1) "
+                        "ON CONFLICT (person_key, bank_name) DO UPDATE SET full_name = excluded.full_name, "
+                        "position = excluded.position, source_url = excluded.source_url, "
+                        "last_seen = excluded.last_seen, active = 1",
+                        (key, bank_name, record.get('First_Name') or "", record.get('Surname') or "",
+                         full_name, position, url, busi_dt, busi_dt),
+                    )
+                    changes.append((RosterChange(bank_name, busi_dt, 'added', key, full_name,
+                                                 previous[1] if previous else None, position, url),
+                                    previous[0] if previous else None))
+                    continue
+
+                old_position = active[key][0]
+                conn.execute(
+                    "UPDATE memberships SET full_name = ?, position = ?, source_url = ?, last_seen = ? "
+                    "WHERE person_key = ? AND bank_name = ?",
+                    (full_name, position, url, busi_dt, key, bank_name),
+                )
+                if old_position != position:
+                    same_role = classify_position(old_position).role == classify_position(position).role
+                    changes.append((RosterChange(bank_name, busi_dt, 'retitled' if same_role else 'position_changed',
+                                                 key, full_name, old_position, position, url), None))
+
+            for key, (old_position, full_name) in active.items():
+                if key not in roster:
+                    conn.execute(
+                        "UPDATE memberships SET active = 0 WHERE person_key = ? AND bank_name = ?", (key, bank_name)
+                    )
+                    changes.append((RosterChange(bank_name, busi_dt, 'removed', key, full_name,
+                                                 old_position, None, source_url), None))
+
+            conn.executemany(
+                "INSERT INTO roster_changes (bank_name, busi_dt, change, person_key, full_name, old_position, "
+                "new_position, source_url, prev_last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [tuple(change) + (prev_last_seen,) for change, prev_last_seen in changes],
+            )
+            conn.execute(
+                "INSERT INTO roster_runs (bank_name, busi_dt, source_url, people) VALUES (?, ?, ?, ?)",
+                (bank_name, busi_dt, source_url, len(roster)),
+            )
+
+        return [change for change, _ in changes]
+
+    def _store_pages(self, conn, page_roster: Dict[str, Dict], bank_name: str, busi_dt: str, source_url: str):
+        """แทนที่รายชื่อของหน้า (Source_URL) ที่อยู่ใน records ชุดนี้ หน้าอื่นของวันเดียวกันคงเดิม"""
+        rows = []
+        for key, record in page_roster.items():
+            rows.append((bank_name, busi_dt, record.get('Source_URL') or source_url, key,
+                         record.get('First_Name') or "", record.get('Surname') or "",
+                         record.get('Full_Name') or "", record.get('Position') or ""))
+        urls = {row[2] for row in rows} | {source_url}
+        conn.executemany(
+            "DELETE FROM roster_pages WHERE bank_name = ? AND busi_dt = ? AND source_url = ?",
+            [(bank_name, busi_dt, url) for url in urls],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO roster_pages (bank_name, busi_dt, source_url, person_key, first_name, surname, "
+            "full_name, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _day_roster(self, conn, bank_name: str, busi_dt: str) -> Dict[str, Dict]:
+        """roster รวมทุกหน้าของธนาคารในวันทำการ (คนที่อยู่หลายหน้าใช้ข้อมูลจากหน้าที่บันทึกก่อน)"""
+        roster = {}
+        for key, first_name, surname, full_name, position, url in conn.execute(
+            "SELECT person_key, first_name, surname, full_name, position, source_url FROM roster_pages "
+            "WHERE bank_name = ? AND busi_dt = ? ORDER BY rowid",
+            (bank_name, busi_dt),
+        ):
+            roster.setdefault(key, {'First_Name': first_name, 'Surname': surname, 'Full_Name': full_name,
+                                    'Position': position, 'Source_URL': url})
+        return roster
+
+    def _seed_pages(self, conn, bank_name: str, busi_dt: str):
+        """รอบที่บันทึกก่อนมี roster_pages: สร้างรายชื่อของหน้าเดิมจาก memberships ก่อนถอยผล"""
+        if conn.execute("SELECT 1 FROM roster_pages WHERE bank_name = ? AND busi_dt = ? LIMIT 1",
+                        (bank_name, busi_dt)).fetchone():
+            return
+        conn.execute(
+            "INSERT OR IGNORE INTO roster_pages (bank_name, busi_dt, source_url, person_key, first_name, surname, "
+            "full_name, position) SELECT bank_name, ?, source_url, person_key, first_name, surname, full_name, "
+            "position FROM memberships WHERE bank_name = ? AND active = 1 AND last_seen = ?",
+            (busi_dt, bank_name, busi_dt),
+        )
+
+    def _undo_run(self, conn, bank_name: str, busi_dt: str):
+        """ถอยผลของรอบล่าสุดของธนาคาร (ใช้ตอนรันซ้ำวันเดิม) ด้วย log ใน roster_changes"""
+        previous_run = conn.execute(
+            "SELECT MAX(busi_dt) FROM roster_runs WHERE bank_name = ? AND busi_dt < ?", (bank_name, busi_dt)
+        ).fetchone()[0]
+
+        rows = conn.execute(
+            "SELECT change, person_key, old_position, prev_last_seen FROM roster_changes "
+            "WHERE bank_name = ? AND busi_dt = ?", (bank_name, busi_dt),
+        ).fetchall()
+        for change, key, old_position, prev_last_seen in rows:
+            if change == 'added' and prev_last_seen is None:
+                conn.execute("DELETE FROM memberships WHERE person_key = ? AND bank_name = ?", (key, bank_name))
+            elif change == 'added':
+                conn.execute(
+                    "UPDATE memberships SET active = 0, last_seen = ?, position = ? WHERE person_key = ? AND bank_name = ?",
+                    (prev_last_seen, old_position, key, bank_name),
+                )
+            elif change == 'removed':
+                conn.execute(
+                    "UPDATE memberships SET active = 1 WHERE person_key = ? AND bank_name = ?", (key, bank_name)
+                )
+            elif change in ('position_changed', 'retitled'):
+                conn.execute(
+                    "UPDATE memberships SET position = ? WHERE person_key = ? AND bank_name = ?",
+                    (old_position, key, bank_name),
+                )
+
+        # สมาชิกที่อยู่ต่อจากรอบก่อน: last_seen กลับเป็นวันของรอบก่อน
+        conn.execute(
+            "UPDATE memberships SET last_seen = ? WHERE bank_name = ? AND active = 1 AND last_seen = ?",
+            (previous_run, bank_name, busi_dt),
+        )
+        conn.execute("DELETE FROM roster_changes WHERE bank_name = ? AND busi_dt = ?", (bank_name, busi_dt))
+        conn.execute("DELETE FROM roster_runs WHERE bank_name = ? AND busi_dt = ?", (bank_name, busi_dt))
+
+    def changes(self, bank_name: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+                change: Optional[str] = None) -> List[RosterChange]:
+        """
+        รายการเปลี่ยนแปลงในช่วง BUSI_DT [since, until] (ไม่นับรอบแรกของแต่ละธนาคาร ซึ่งทุกคนเป็น added
+        และไม่นับ retitled นอกจากระบุ change='retitled')
+        """
+        where = ["c.busi_dt > (SELECT MIN(r.busi_dt) FROM roster_runs r WHERE r.bank_name = c.bank_name)"]
+        params = []
+        if change is None:
+            where.append("c.change != 'retitled'")
+        for column, op, value in (('bank_name', '=', bank_name), ('busi_dt', '>=', since),
+                                  ('busi_dt', '<=', until), ('change', '=', change)):
+            if value is not None:
+                where.append(f"c.{column} {op} ?")
+                params.append(value)
+        rows = self.conn.execute(
+            "SELECT c.bank_name, c.busi_dt, c.change, c.person_key, c.full_name, c.old_position, c.new_position, "
+            f"c.source_url FROM roster_changes c WHERE {' AND '.join(where)} "
+            "ORDER BY c.busi_dt, c.bank_name, c.change, c.full_name",
+            params,
+        ).fetchall()
+        return [RosterChange(*row) for row in rows]
+
+    def additions(self, bank_name: Optional[str] = None, since: Optional[str] = None,
+                  until: Optional[str] = None) -> List[RosterChange]:
+        return self.changes(bank_name, since, until, 'added')
+
+    def removals(self, bank_name: Optional[str] = None, since: Optional[str] = None,
+                 until: Optional[str] = None) -> List[RosterChange]:
+        return self.changes(bank_name, since, until, 'removed')
+
+    def position_changes(self, bank_name: Optional[str] = None, since: Optional[str] = None,
+                         until: Optional[str] = None) -> List[RosterChange]:
+        return self.changes(bank_name, since, until, 'position_changed')
+
+    def person(self, first_name: str, surname: str) -> List[Dict]:
+        """ทุกธนาคารที่บุคคลนี้เคยอยู่ พร้อม first_seen / last_seen / ตำแหน่งล่าสุด และประวัติตำแหน่ง"""
+        key = person_key(first_name, surname)
+        self.conn.row_factory = sqlite3.Row
+        try:
+            memberships = [dict(row) for row in self.conn.execute(
+                "SELECT * FROM memberships WHERE person_key = ? ORDER BY first_seen", (key,)
+            )]
+            history = self.conn.execute(
+                "SELECT bank_name, busi_dt, change, old_position, new_position FROM roster_changes "
+                "WHERE person_key = ? ORDER BY busi_dt", (key,),
+            ).fetchall()
+        finally:
+            self.conn.row_factory = None
+        for membership in memberships:
+            membership['history'] = [
+                (row['busi_dt'], row['change'], row['old_position'], row['new_position'])
+                for row in history if row['bank_name'] == membership['bank_name']
+            ]
+        return memberships
+
+    def roster(self, bank_name: str) -> List[Dict]:
+        """roster ปัจจุบันของธนาคาร (ตามรอบล่าสุดที่บันทึก) เรียงตามลำดับตำแหน่งมาตรฐาน"""
+        rows = self.conn.execute(
+            "SELECT full_name, position, first_seen, last_seen FROM memberships "
+            "WHERE bank_name = ? AND active = 1 ORDER BY first_seen, full_name", (bank_name,),
+        ).fetchall()
+        roster = []
+        for row in rows:
+            member = dict(zip(('Full_Name', 'Position', 'first_seen', 'last_seen'), row))
+            member['Position_Role'] = classify_position(member['Position']).role
+            roster.append(member)
+        return sorted(roster, key=lambda member: classify_position(member['Position']).rank)
+
+    def rebuild_from_history(self):
+        """สร้างดัชนีใหม่ทั้งหมดจากตาราง executives ของ SqliteSink (ใช้ครั้งแรก / หลังแก้ normalization)"""
+        runs = self.conn.execute(
+            "SELECT DISTINCT Bank_Name, BUSI_DT FROM executives ORDER BY BUSI_DT, Bank_Name"
+        ).fetchall()
+        with self._transaction() as conn:
+            for table in ('roster_runs', 'memberships', 'roster_changes', 'roster_pages'):
+                conn.execute(f"DELETE FROM {table}")
+        columns = ('First_Name', 'Surname', 'Full_Name', 'Position', 'Source_URL')
+        for bank_name, busi_dt in runs:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM executives WHERE Bank_Name = ? AND BUSI_DT = ?",
+                (bank_name, busi_dt),
+            ).fetchall()
+            self.apply_roster([dict(zip(columns, row)) for row in rows], bank_name, busi_dt)
+        logger.info(" ---- People index rebuilt from %s roster(s) ---- ", len(runs))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'PeopleIndex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def format_changes(changes: List[RosterChange]) -> str:
+    """รายงานการเปลี่ยนแปลงแบบข้อความ จัดกลุ่มตามธนาคารและวันทำการ"""
+    lines = []
+    group = None
+    for c in changes:
+        if (c.bank_name, c.busi_dt) != group:
+            group = (c.bank_name, c.busi_dt)
+            lines.append(f"\n{c.bank_name} ({c.busi_dt})")
+        if c.change == 'added':
+            lines.append(f"  + {c.full_name} | {c.new_position}")
+        elif c.change == 'removed':
+            lines.append(f"  - {c.full_name} | {c.old_position}")
+        else:
+            old_role, new_role = classify_position(c.old_position or "").role, classify_position(c.new_position or "").role
+            roles = f" ({old_role} -> {new_role})" if old_role != new_role else ""
+            lines.append(f"  ~ {c.full_name} | {c.old_position} -> {c.new_position}{roles}")
+    return "\n".join(lines) if lines else "No roster changes."
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Executive roster changes from the people index")
+    parser.add_argument('--bank', help="bank name (default: all banks)")
+    parser.add_argument('--since', help="first BUSI_DT, YYYY-MM-DD")
+    parser.add_argument('--until', help="last BUSI_DT, YYYY-MM-DD")
+    parser.add_argument('--db', default=SQLITE_PATH)
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index from the executives history table")
+    args = parser.parse_args()
+
+    with PeopleIndex(args.db) as index:
+        if args.rebuild:
+            index.rebuild_from_history()
+        print(format_changes(index.changes(args.bank, args.since, args.until)))
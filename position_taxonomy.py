@@ -0,0 +1,133 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+# --- CONFIG ---
+POSITION_CACHE_SIZE = 4096    # จำนวนข้อความตำแหน่งที่ไม่ซ้ำกันที่ cache ไว้
+
+
+class PositionRole(NamedTuple):
+    role: str     # รหัสตำแหน่งมาตรฐาน เช่น 'managing_director'
+    rank: int     # ลำดับสำหรับเรียง (น้อย = อาวุโสกว่า)
+    label: str    # ชื่อตำแหน่งมาตรฐานภาษาอังกฤษ
+
+
+# ตำแหน่งมาตรฐาน -> (rank, label) - rank ตามลำดับชั้นเดิมของ _sort_executive_records
+ROLES: Dict[str, Tuple[int, str]] = {
+    'chairman': (0, 'Chairman'),
+    'executive_chairman': (1, 'Chairman of the Executive Committee'),
+    'ceo': (1, 'Chief Executive Officer'),
+    'vice_chairman': (2, 'Vice Chairman'),
+    'vice_president': (2, 'Vice President'),
+    'deputy_managing_director': (3, 'Deputy Managing Director'),
+    'chief_officer': (3, 'Chief Officer'),
+    'managing_director': (4, 'Managing Director'),
+    'assistant_managing_director': (5, 'Assistant Managing Director'),
+    'executive': (5, 'Executive'),
+    'director': (6, 'Director'),
+    'committee_chair': (7, 'Committee Chairman'),     # ประธานคณะกรรมการชุดย่อย (ตรวจสอบ / สรรหา / ...)
+    'manager': (8, 'Manager'),
+    'other': (8, 'Other'),
+}
+
+# คำเรียกตำแหน่ง -> ตำแหน่งมาตรฐาน (เรียงจากเฉพาะเจาะจงที่สุดก่อน: ตำแหน่งเดียวกันจับคำที่ยาวกว่าก่อน
+# เช่น 'รองผู้จัดการใหญ่' ไม่ถูกนับเป็น 'ผู้จัดการใหญ่') คำภาษาไทยเทียบหลังตัดช่องว่างระหว่างอักษรไทยแล้ว
+POSITION_ALIASES: List[Tuple[str, str]] = [
+    ('ประธานกรรมการบริหาร', 'executive_chairman'),
+    # คณะกรรมการชุดย่อย ต้องมาก่อน 'ประธาน' (ไม่ใช่ประธานกรรมการธนาคาร)
+    ('ประธาน(?:คณะ)?(?:อนุ)?กรรมการ(?:ตรวจสอบ|สรรหา|กำหนดค่าตอบแทน|พิจารณาค่าตอบแทน|ค่าตอบแทน|บริหารความเสี่ยง'
+     '|กำกับ|บรรษัทภิบาล|ความยั่งยืน|พัฒนาความยั่งยืน|เทคโนโลยี|สินเชื่อ|การลงทุน|ลงทุน)', 'committee_chair'),
+    ('ประธาน(?:คณะ)?อนุกรรมการ', 'committee_chair'),
+    ('ประธานเจ้าหน้าที่บริหาร', 'ceo'),
+    ('ประธานเจ้าหน้าที่', 'chief_officer'),          # ประธานเจ้าหน้าที่การเงิน / ปฏิบัติการ ...
+    ('รองประธานกรรมการ', 'vice_chairman'),
+    ('รองประธาน', 'vice_president'),
+    ('ประธาน', 'chairman'),
+    ('รองกรรมการผู้จัดการใหญ่', 'deputy_managing_director'),
+    ('รองผู้จัดการใหญ่', 'deputy_managing_director'),
+    ('รองกรรมการผู้จัดการ', 'deputy_managing_director'),
+    ('รองผู้จัดการ', 'deputy_managing_director'),
+    ('ผู้ช่วยกรรมการผู้จัดการใหญ่', 'assistant_managing_director'),
+    ('ผู้ช่วยผู้จัดการใหญ่', 'assistant_managing_director'),
+    ('ผู้ช่วยกรรมการผู้จัดการ', 'assistant_managing_director'),
+    ('ผู้ช่วยผู้จัดการ', 'assistant_managing_director'),
+    ('กรรมการผู้จัดการใหญ่', 'managing_director'),
+    ('กรรมการผู้จัดการ', 'managing_director'),
+    ('ผู้จัดการใหญ่', 'managing_director'),
+    ('ผู้บริหาร', 'executive'),
+    ('ผู้อำนวยการ', 'executive'),
+    ('หัวหน้า', 'executive'),
+    ('กรรมการ', 'director'),
+    ('ผู้จัดการ', 'manager'),
+    (r'\bexecutive chair(?:man|woman|person)\b', 'executive_chairman'),
+    (r'\bchief executive officer\b', 'ceo'),
+    (r'\bceo\b', 'ceo'),
+    (r'\b(?:vice|deputy) chair(?:man|woman|person)\b', 'vice_chairman'),
+    (r'\bchair(?:man|woman|person)? of the executive committee\b', 'executive_chairman'),
+    # ชื่อคณะกรรมการห้ามข้าม 'chair' / 'board' (เช่น 'Chairman of the Board and Chairman of the Audit Committee')
+    # แต่ข้าม 'and' ได้ ('Nomination and Remuneration Committee')
+    (r'\bchair(?:man|woman|person)? of (?:the )?(?:(?!chair|\bboard\b)[\w&, -]){0,60}?(?:sub-?)?committee\b',
+     'committee_chair'),
+    (r'\b[\w&-]+ (?:sub-?)?committee chair(?:man|woman|person)?\b', 'committee_chair'),
+    (r'\bchair(?:man|woman|person)?\b', 'chairman'),
+    (r'\bvice president\b', 'vice_president'),
+    (r'\bpresident\b', 'ceo'),
+    (r'\bdeputy (?:managing director|md)\b', 'deputy_managing_director'),
+    (r'\bassistant (?:managing director|md)\b', 'assistant_managing_director'),
+    (r'\bmanaging director\b', 'managing_director'),
+    (r'\bmd\b', 'managing_director'),
+    (r'\bchief\b(?:[\w&, -]{0,40}?\bofficer\b)?', 'chief_officer'),
+    (r'\bc[fotirmd]o\b', 'chief_officer'),
+    (r'\bexecutive\b', 'executive'),
+    (r'\bhead of\b', 'executive'),
+    (r'\bdirector\b', 'director'),
+    (r'\bmanager\b', 'manager'),
+]
+
+_ALIAS_ROLES = [role for _, role in POSITION_ALIASES]
+# pass เดียว: แต่ละคำเรียกเป็น group ของตัวเอง (lastindex บอกว่าตรงคำไหน)
+_ALIAS_RE = re.compile('|'.join(f"({pattern})" for pattern, _ in POSITION_ALIASES))
+_INVISIBLE_RE = re.compile(r'[\u200b-\u200f\u2060\ufeff\u00ad]')
+_THAI_GAP_RE = re.compile(r'(?<=[\u0E00-\u0E7F])\s+(?=[\u0E00-\u0E7F])')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+OTHER = PositionRole('other', *ROLES['other'])
+
+
+def normalize_position(position: str) -> str:
+    """NFC, ตัดอักขระที่มองไม่เห็น, ตัวพิมพ์เล็ก, ตัดช่องว่างระหว่างคำไทย และยุบช่องว่างที่เหลือ"""
+    text = _INVISIBLE_RE.sub('', unicodedata.normalize('NFC', position or '')).lower()
+    text = _THAI_GAP_RE.sub('', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=POSITION_CACHE_SIZE)
+def classify_position(position: str) -> PositionRole:
+    """
+    แปลงข้อความตำแหน่งเป็นตำแหน่งมาตรฐาน + rank
+    ถ้าข้อความมีหลายตำแหน่ง (เช่น 'กรรมการผู้จัดการใหญ่และประธานเจ้าหน้าที่บริหาร') ใช้ตำแหน่งที่อาวุโสที่สุด
+    """
+    best = OTHER
+    for match in _ALIAS_RE.finditer(normalize_position(position)):
+        role = _ALIAS_ROLES[match.lastindex - 1]
+        rank, label = ROLES[role]
+        if best is OTHER or rank < best.rank:
+            best = PositionRole(role, rank, label)
+    return best
+
+
+def tag_position(record: Dict) -> Dict:
+    """ใส่ Position_Role / Position_Rank ลงใน record (ใช้เรียงลำดับและเทียบ roster)"""
+    role = classify_position(record.get('Position') or "")
+    record['Position_Role'] = role.role
+    record['Position_Rank'] = role.rank
+    return record
+
+
+def position_rank(record: Dict) -> int:
+    """sort key ของ record: ใช้ค่าที่ tag ไว้แล้ว ถ้าไม่มี (เช่น checkpoint เก่า) ค่อยคำนวณ"""
+    rank = record.get('Position_Rank')
+    if rank is None:
+        rank = classify_position(record.get('Position') or "").rank
+    return rank
@@ -0,0 +1,122 @@
+import json
+import logging
+from collections import Counter
+from typing import List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlockingConfig(NamedTuple):
+    images: bool = True
+    media: bool = True
+    fonts: bool = True
+    trackers: bool = True
+    stylesheets: bool = False    # บางเว็บซ่อน/แสดง roster ด้วย CSS จึงไม่ block เป็นค่าเริ่มต้น
+
+
+# --- CONFIG ---
+DEFAULT_BLOCKING = ResourceBlockingConfig()
+
+_EXTENSIONS = {
+    'images': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'bmp', 'avif'],
+    'media': ['mp4', 'webm', 'mp3', 'ogg', 'wav', 'mov', 'm4v'],
+    'fonts': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'stylesheets': ['css'],
+}
+
+TRACKER_DOMAINS = [
+    'googletagmanager.com', 'google-analytics.com', 'analytics.google.com', 'doubleclick.net',
+    'googleadservices.com', 'googlesyndication.com', 'facebook.net', 'connect.facebook.com',
+    'hotjar.com', 'clarity.ms', 'tiktok.com', 'analytics.tiktok.com', 'ads-twitter.com',
+    'linkedin.com/px', 'snap.licdn.com', 'criteo.com', 'adnxs.com', 'newrelic.com', 'nr-data.net',
+]
+
+# ขนาดโดยประมาณของ resource แต่ละประเภท ใช้ประมาณ bytes ที่ประหยัดได้
+# (request ที่ถูก block ไม่ได้ดาวน์โหลด จึงวัดขนาดจริงไม่ได้)
+ESTIMATED_BYTES = {
+    'Image': 40_000, 'Media': 500_000, 'Font': 50_000,
+    'Stylesheet': 30_000, 'Script': 60_000,
+}
+ESTIMATED_BYTES_OTHER = 10_000
+
+
+def blocked_url_patterns(config: ResourceBlockingConfig = DEFAULT_BLOCKING) -> List[str]:
+    """สร้าง URL pattern (wildcard) สำหรับ Network.setBlockedURLs"""
+    patterns = []
+    for kind, extensions in _EXTENSIONS.items():
+        if getattr(config, kind):
+            for ext in extensions:
+                patterns.extend([f"*.{ext}", f"*.{ext}?*"])
+    if config.trackers:
+        patterns.extend(f"*{domain}*" for domain in TRACKER_DOMAINS)
+    return patterns
+
+
+def enable_resource_blocking(driver, config: ResourceBlockingConfig = DEFAULT_BLOCKING) -> bool:
+    """
+    เปิด request blocking ผ่าน DevTools ใน tab ปัจจุบัน (ต้องเรียกใหม่ทุกครั้งที่เปลี่ยน tab)
+    XHR / fetch ของเว็บเองไม่ถูก block เพื่อให้ roster ที่โหลดแบบ dynamic ยังแสดงได้
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(config)})
+        return True
+    except Exception as e:
+        logger.warning(" ---- Could not enable resource blocking: %s ---- ", e)
+        return False
+
+
+class NetworkStats(NamedTuple):
+    requests: int
+    blocked: Counter                 # resource type -> จำนวน request ที่ถูก block
+    bytes_transferred: int
+    estimated_bytes_saved: int
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+    def summary(self) -> str:
+        kinds = ", ".join(f"{kind}={count}" for kind, count in self.blocked.most_common())
+        return (f"{self.requests} requests, {self.blocked_total} blocked ({kinds or '-'}), "
+                f"{self.bytes_transferred / 1024:.0f} KB transferred, "
+                f"~{self.estimated_bytes_saved / 1024:.0f} KB saved")
+
+
+def drain_network_log(driver):
+    """ทิ้ง performance log ที่ค้างอยู่ ก่อนโหลดหน้าใหม่"""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def collect_network_stats(driver) -> Optional[NetworkStats]:
+    """
+    สรุป request ของหน้าที่เพิ่งโหลดจาก performance log ของ Chrome
+    (ต้องเปิด capability goog:loggingPrefs = {'performance': 'ALL'})
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None
+
+    requests = set()
+    blocked = Counter()
+    bytes_transferred = 0
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError, TypeError):
+            continue
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.requestWillBeSent':
+            requests.add(params.get('requestId'))
+        elif method == 'Network.loadingFinished':
+            bytes_transferred += int(params.get('encodedDataLength', 0))
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            blocked[params.get('type', 'Other')] += 1
+
+    estimated_saved = sum(ESTIMATED_BYTES.get(kind, ESTIMATED_BYTES_OTHER) * count for kind, count in blocked.items())
+    return NetworkStats(len(requests), blocked, bytes_transferred, estimated_saved)
@@ -0,0 +1,447 @@
+"""
+คลัง snapshot ของหน้าเว็บที่โหลดมา (สำหรับ replay / ตรวจย้อนหลัง / extract ซ้ำทั้งชุด)
+
+    python snapshot_store.py import 'snapshots/**/*.html'     # ย้าย HTML ที่บันทึกไว้เข้าคลัง
+    python snapshot_store.py ls --url https://www.kasikornbank.com/th/about/Pages/executives.aspx
+    python snapshot_store.py cat https://www.kasikornbank.com/th/about/Pages/executives.aspx > page.html
+    python snapshot_store.py stats
+
+โครงสร้างใน SNAPSHOT_DIR:
+- pages.pack: เนื้อหาหน้าเว็บ บีบอัดด้วย zstd ทีละหน้า (1 frame ต่อเนื้อหาที่ไม่ซ้ำ - หน้าเดิมที่ไม่เปลี่ยนเก็บครั้งเดียว)
+- urls.bin:   URL (UTF-8) ต่อกัน ไม่ซ้ำ
+- index.bin:  header + record ขนาดคงที่ต่อการโหลด 1 ครั้ง (fetch time, hash ของ URL / เนื้อหา, status, ตำแหน่งใน pack)
+ทุกไฟล์เขียนแบบ append อย่างเดียว และอ่านผ่าน mmap: การไล่ index ไม่ต้องโหลดทั้งคลังหรือแตกไฟล์ใด
+(อ่านเฉพาะ field ที่ใช้กรองจาก record โดยตรง แล้วแตกเฉพาะหน้าที่ต้องการ)
+"""
+import os
+import sys
+import mmap
+import time
+import zlib
+import struct
+import hashlib
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+from page_status import PageStatus
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIG ---
+SNAPSHOT_DIR = os.path.join('output', 'snapshots')
+SNAPSHOT_ZSTD_LEVEL = 10     # ระดับการบีบอัด zstd (หน้า HTML ขนาดหลายร้อย KB ยังบีบได้เร็วพอระหว่าง scrape)
+SNAPSHOT_FSYNC = False       # True = fsync ทุกครั้งที่เพิ่ม snapshot (ช้ากว่า แต่ไม่เสียข้อมูลถ้าเครื่องดับ)
+
+INDEX_MAGIC = b'SNAPIDX1'
+INDEX_VERSION = 1
+# fetched_at, url_key, url_offset, url_length, raw_length, content_hash, pack_offset, pack_length, status, codec
+_RECORD = struct.Struct('<dQQII32sQIBB2x')
+_HEADER = struct.Struct('<8sHH4x')
+_FETCHED_URL_KEY = struct.Struct('<dQ')      # อ่านแค่ 16 byte แรกของ record ตอนกรองตาม URL / เวลา
+
+CODEC_ZLIB, CODEC_ZSTD = 0, 1
+# status ของหน้าเก็บเป็น 1 byte ตามลำดับใน PageStatus (255 = ไม่ทราบ)
+STATUS_CODES = tuple(status.value for status in PageStatus)
+UNKNOWN_STATUS = 255
+
+
+class SnapshotRecord(NamedTuple):
+    row: int               # ลำดับใน index (ใช้กับ SnapshotStore.read)
+    url: str
+    fetched_at: float      # epoch seconds
+    content_hash: str      # sha256 ของ HTML (UTF-8)
+    status: str            # PageStatus.value หรือ 'unknown'
+    raw_length: int        # byte ของ HTML ก่อนบีบอัด
+    stored_length: int     # byte ใน pages.pack
+
+    @property
+    def fetched(self) -> datetime:
+        return datetime.fromtimestamp(self.fetched_at)
+
+
+def url_key(url: str) -> int:
+    """hash 64-bit ของ URL (เก็บใน record ให้กรองตาม URL ได้โดยไม่ต้องอ่าน urls.bin)"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _status_code(status: Union[PageStatus, str, None]) -> int:
+    value = status.value if isinstance(status, PageStatus) else status
+    return STATUS_CODES.index(value) if value in STATUS_CODES else UNKNOWN_STATUS
+
+
+def _status_name(code: int) -> str:
+    return STATUS_CODES[code] if code < len(STATUS_CODES) else 'unknown'
+
+
+@contextmanager
+def _file_lock(fd: int):
+    """lock ข้าม process ระหว่างเขียน (หลาย worker เขียนคลังเดียวกันได้)"""
+    if os.name == 'nt':
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _MappedFile:
+    """
+    mmap แบบอ่านอย่างเดียวของไฟล์ที่โตขึ้นเรื่อยๆ (map ใหม่เมื่อไฟล์ใหญ่ขึ้น
+    map เดิมไม่ถูกปิด: iterator ที่ยังอ่านอยู่ใช้ต่อได้ และถูกคืนเมื่อไม่มีใครอ้างถึง)
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.map = None
+        self.size = 0
+
+    def refresh(self) -> Optional[mmap.mmap]:
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size and size != self.size:
+            with open(self.path, 'rb') as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.size = size
+        return self.map
+
+    def view(self, needed: int) -> Optional[mmap.mmap]:
+        return self.map if self.map is not None and needed <= self.size else self.refresh()
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.size = 0
+
+
+class SnapshotStore:
+    """
+    คลัง snapshot แบบ content-addressed: เนื้อหาเดียวกันเก็บครั้งเดียว (sha256) บีบอัดด้วย zstd
+    และ index ขนาดคงที่ต่อการโหลดแต่ละครั้งที่อ่านผ่าน mmap
+
+    วิธีใช้:
+        with SnapshotStore() as store:
+            store.put(url, html, PageStatus.OK)
+            record = store.latest(url)
+            html = store.read(record)
+            for record in store.records(since=time.time() - 86400):
+                ...
+    """
+    def __init__(self, root: str = SNAPSHOT_DIR, level: int = SNAPSHOT_ZSTD_LEVEL):
+        self.root = root
+        self.level = level
+        self.index_path = os.path.join(root, 'index.bin')
+        self.pack_path = os.path.join(root, 'pages.pack')
+        self.urls_path = os.path.join(root, 'urls.bin')
+
+        os.makedirs(root, exist_ok=True)
+        if not os.path.exists(self.index_path):
+            with open(self.index_path, 'ab') as f:
+                if f.tell() == 0:
+                    f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, _RECORD.size))
+        self._index = _MappedFile(self.index_path)
+        self._pack = _MappedFile(self.pack_path)
+        self._urls = _MappedFile(self.urls_path)
+        self._check_header()
+
+        self._lock = threading.Lock()
+        self._writer = None           # (index, pack, urls) file objects - เปิดเมื่อเขียนครั้งแรก
+        # ตำแหน่งของเนื้อหา / URL ที่มีแล้ว (สร้างจาก index เมื่อเขียนครั้งแรก ใช้ตัดของซ้ำ)
+        self._blobs: Dict[bytes, Tuple[int, int, int, int]] = {}
+        self._url_offsets: Dict[str, Tuple[int, int]] = {}
+        self._scanned_rows = 0
+        # url_key -> rows ใน index (สร้างเมื่อค้นหาตาม URL ครั้งแรก แล้วต่อเฉพาะ record ใหม่)
+        self._rows_by_url: Dict[int, list] = {}
+        self._keyed_rows = 0
+        self._compressor = None
+
+    def _check_header(self):
+        view = self._index.refresh()
+        magic, version, record_size = _HEADER.unpack_from(view, 0)
+        if magic != INDEX_MAGIC or record_size != _RECORD.size:
+            raise ValueError(f"{self.index_path}: not a snapshot index (version {version}, record {record_size})")
+
+    def __len__(self) -> int:
+        """จำนวน snapshot (รวมที่ process อื่นเพิ่งเขียน)"""
+        self._index.refresh()
+        return (self._index.size - _HEADER.size) // _RECORD.size
+
+    def __iter__(self) -> Iterator[SnapshotRecord]:
+        return self.records()
+
+    def _offset(self, row: int) -> int:
+        return _HEADER.size + row * _RECORD.size
+
+    def _record(self, row: int) -> SnapshotRecord:
+        (fetched_at, _, url_offset, url_length, raw_length, content_hash, _, pack_length, status,
+         _) = _RECORD.unpack_from(self._index.map, self._offset(row))
+        urls = self._urls.view(url_offset + url_length)
+        url = bytes(urls[url_offset:url_offset + url_length]).decode('utf-8')
+        return SnapshotRecord(row, url, fetched_at, content_hash.hex(), _status_name(status), raw_length, pack_length)
+
+    def _url_rows(self, key: int) -> list:
+        count = len(self)
+        if self._keyed_rows < count:
+            view = self._index.map
+            for row in range(self._keyed_rows, count):
+                _, record_key = _FETCHED_URL_KEY.unpack_from(view, self._offset(row))
+                self._rows_by_url.setdefault(record_key, []).append(row)
+            self._keyed_rows = count
+        return self._rows_by_url.get(key, [])
+
+    def records(self, url: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None,
+                status: Union[PageStatus, str, None] = None) -> Iterator[SnapshotRecord]:
+        """
+        ไล่ index ตามลำดับที่บันทึก กรองตาม URL / ช่วงเวลา (epoch seconds, until ไม่รวม) / status
+        (อ่านเฉพาะ fetch time + hash ของ URL จาก mmap สร้าง SnapshotRecord เฉพาะ record ที่ตรงเงื่อนไข)
+        """
+        key = url_key(url) if url is not None else None
+        rows = self._url_rows(key)[:] if key is not None else range(len(self))
+        view = self._index.map
+        status_code = _status_code(status) if status is not None else None
+        for row in rows:
+            offset = self._offset(row)
+            fetched_at, record_key = _FETCHED_URL_KEY.unpack_from(view, offset)
+            if key is not None and record_key != key:
+                continue
+            if (since is not None and fetched_at < since) or (until is not None and fetched_at >= until):
+                continue
+            if status_code is not None and view[offset + _RECORD.size - 4] != status_code:
+                continue
+            record = self._record(row)
+            if url is None or record.url == url:
+                yield record
+
+    def latest(self, url: str, before: Optional[float] = None,
+               status: Union[PageStatus, str, None] = PageStatus.OK) -> Optional[SnapshotRecord]:
+        """snapshot ล่าสุดของ URL (ที่โหลดก่อน before และมี status ตามที่กำหนด, status=None = ทุก status)"""
+        rows = self._url_rows(url_key(url))
+        view = self._index.map
+        status_code = _status_code(status) if status is not None else None
+        best = None
+        for row in reversed(rows):
+            offset = self._offset(row)
+            fetched_at, _ = _FETCHED_URL_KEY.unpack_from(view, offset)
+            if before is not None and fetched_at >= before:
+                continue
+            if status_code is not None and view[offset + _RECORD.size - 4] != status_code:
+                continue
+            if best is None or fetched_at > best[0]:
+                best = (fetched_at, row)
+        if best is None:
+            return None
+        record = self._record(best[1])
+        return record if record.url == url else None
+
+    def urls(self) -> Iterator[str]:
+        """URL ทั้งหมดในคลัง (ไม่ซ้ำ ตามลำดับที่เจอครั้งแรก)"""
+        seen = set()
+        for record in self.records():
+            if record.url not in seen:
+                seen.add(record.url)
+                yield record.url
+
+    def read(self, record: SnapshotRecord) -> str:
+        """แตก HTML ของ snapshot (อ่านเฉพาะ frame ของหน้านั้นจาก pages.pack)"""
+        self._index.view(self._offset(record.row + 1))
+        *_, pack_offset, pack_length, _, codec = _RECORD.unpack_from(self._index.map, self._offset(record.row))
+        pack = self._pack.view(pack_offset + pack_length)
+        frame = memoryview(pack)[pack_offset:pack_offset + pack_length]
+        try:
+            if codec == CODEC_ZSTD:
+                import zstandard
+                data = zstandard.ZstdDecompressor().decompress(frame)
+            else:
+                data = zlib.decompress(frame)
+        finally:
+            frame.release()
+        return data.decode('utf-8')
+
+    def _compress(self, data: bytes) -> Tuple[bytes, int]:
+        if self._compressor is None:
+            try:
+                import zstandard
+                self._compressor = zstandard.ZstdCompressor(level=self.level)
+            except ImportError:
+                logger.warning(" ---- Snapshot store: 'zstandard' not installed, falling back to zlib "
+                               "(pip install zstandard) ---- ")
+                self._compressor = False
+        if self._compressor:
+            return self._compressor.compress(data), CODEC_ZSTD
+        return zlib.compress(data, 9), CODEC_ZLIB
+
+    def _open_writer(self):
+        if self._writer is None:
+            self._writer = tuple(open(path, 'r+b' if path == self.index_path else 'ab')
+                                 for path in (self.index_path, self.pack_path, self.urls_path))
+        return self._writer
+
+    def _scan_new_rows(self, count: int):
+        """อัปเดตตารางตัดของซ้ำด้วย record ที่เพิ่มมา (รวมที่ process อื่นเขียน)"""
+        view = self._index.map
+        for row in range(self._scanned_rows, count):
+            (_, _, url_offset, url_length, raw_length, content_hash, pack_offset, pack_length, _,
+             codec) = _RECORD.unpack_from(view, self._offset(row))
+            self._blobs.setdefault(content_hash, (pack_offset, pack_length, raw_length, codec))
+            urls = self._urls.view(url_offset + url_length)
+            url = bytes(urls[url_offset:url_offset + url_length]).decode('utf-8')
+            self._url_offsets.setdefault(url, (url_offset, url_length))
+        self._scanned_rows = count
+
+    def put(self, url: str, html: str, status: Union[PageStatus, str, None] = PageStatus.OK,
+            fetched_at: Optional[float] = None) -> SnapshotRecord:
+        """
+        บันทึกการโหลดหน้า 1 ครั้ง (เนื้อหาที่เคยเก็บแล้วจะไม่ถูกบีบอัด / เขียนซ้ำ เพิ่มแค่ record ใน index)
+        """
+        data = html.encode('utf-8')
+        content_hash = hashlib.sha256(data).digest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+
+        with self._lock:
+            index, pack, urls = self._open_writer()
+            with _file_lock(index.fileno()):
+                # record ที่เขียนไม่ครบ (process ตายกลางทาง) ถูกตัดทิ้งก่อนเขียนต่อ
+                index.seek(0, os.SEEK_END)
+                count = (index.tell() - _HEADER.size) // _RECORD.size
+                if index.tell() != self._offset(count):
+                    index.truncate(self._offset(count))
+                self._index.view(self._offset(count))
+                self._scan_new_rows(count)
+
+                blob = self._blobs.get(content_hash)
+                if blob is None:
+                    compressed, codec = self._compress(data)
+                    pack.seek(0, os.SEEK_END)
+                    blob = (pack.tell(), len(compressed), len(data), codec)
+                    pack.write(compressed)
+                    pack.flush()
+                    self._blobs[content_hash] = blob
+
+                url_location = self._url_offsets.get(url)
+                if url_location is None:
+                    encoded = url.encode('utf-8')
+                    urls.seek(0, os.SEEK_END)
+                    url_location = (urls.tell(), len(encoded))
+                    urls.write(encoded)
+                    urls.flush()
+                    self._url_offsets[url] = url_location
+
+                pack_offset, pack_length, raw_length, codec = blob
+                index.seek(self._offset(count))
+                index.write(_RECORD.pack(fetched_at, url_key(url), url_location[0], url_location[1], raw_length,
+                                         content_hash, pack_offset, pack_length, _status_code(status), codec))
+                index.flush()
+                if SNAPSHOT_FSYNC:
+                    for f in (pack, urls, index):
+                        os.fsync(f.fileno())
+                self._scanned_rows = count + 1
+
+        return SnapshotRecord(count, url, fetched_at, content_hash.hex(), _status_name(_status_code(status)),
+                              raw_length, pack_length)
+
+    def stats(self) -> Dict[str, int]:
+        """จำนวน snapshot / หน้าที่ไม่ซ้ำ / URL และขนาดก่อน-หลังบีบอัด"""
+        count = len(self)
+        view = self._index.map
+        blobs = {}
+        url_offsets = set()
+        for row in range(count):
+            (_, _, url_offset, _, raw_length, content_hash, _, pack_length, _,
+             _) = _RECORD.unpack_from(view, self._offset(row))
+            blobs[content_hash] = (raw_length, pack_length)
+            url_offsets.add(url_offset)
+        return {
+            'snapshots': count,
+            'unique_pages': len(blobs),
+            'urls': len(url_offsets),
+            'raw_bytes': sum(raw for raw, _ in blobs.values()),
+            'stored_bytes': sum(stored for _, stored in blobs.values()),
+            'index_bytes': self._offset(count),
+        }
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                for f in self._writer:
+                    f.close()
+                self._writer = None
+            for mapped in (self._index, self._pack, self._urls):
+                mapped.close()
+
+    def __enter__(self) -> 'SnapshotStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def import_files(store: SnapshotStore, paths) -> int:
+    """นำ HTML ที่บันทึกเป็นไฟล์เข้าคลัง (URL จาก canonical / og:url, เวลาโหลด = mtime ของไฟล์)"""
+    # import ตรงนี้: cli import โมดูลนี้อยู่แล้ว
+    from cli import snapshot_source_url
+    from page_status import classify_page
+
+    imported = 0
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        record = store.put(snapshot_source_url(path), html, classify_page(html).status, os.path.getmtime(path))
+        logger.info(" ---- Imported %s -> %s (%s) ---- ", path, record.url, record.content_hash[:12])
+        imported += 1
+    return imported
+
+
+def main(argv=None) -> int:
+    import glob
+
+    parser = argparse.ArgumentParser(description="Compressed, content-addressed archive of fetched pages")
+    parser.add_argument('--root', default=SNAPSHOT_DIR, help="archive directory (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_cmd = commands.add_parser('import', help="add saved HTML files to the archive")
+    import_cmd.add_argument('patterns', nargs='+', metavar='GLOB')
+    ls_cmd = commands.add_parser('ls', help="list snapshots")
+    ls_cmd.add_argument('--url')
+    ls_cmd.add_argument('--status', choices=STATUS_CODES)
+    cat_cmd = commands.add_parser('cat', help="print the latest snapshot of a URL")
+    cat_cmd.add_argument('url')
+    commands.add_parser('stats', help="archive size and deduplication")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    with SnapshotStore(args.root) as store:
+        if args.command == 'import':
+            paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern, recursive=True)})
+            print(f"imported {import_files(store, paths)} file(s) into {args.root}")
+        elif args.command == 'ls':
+            for record in store.records(url=args.url, status=args.status):
+                print(f"{record.fetched:%Y-%m-%d %H:%M:%S}  {record.status:<12}{record.content_hash[:12]}  "
+                      f"{record.raw_length:>9,}  {record.url}")
+        elif args.command == 'cat':
+            record = store.latest(args.url, status=None)
+            if record is None:
+                print(f"no snapshot of {args.url}", file=sys.stderr)
+                return 1
+            sys.stdout.write(store.read(record))
+        else:
+            stats = store.stats()
+            ratio = stats['raw_bytes'] / stats['stored_bytes'] if stats['stored_bytes'] else 0.0
+            print(f"{stats['snapshots']} snapshot(s), {stats['unique_pages']} unique page(s), {stats['urls']} URL(s)")
+            print(f"pages {stats['raw_bytes']:,} -> {stats['stored_bytes']:,} bytes ({ratio:.1f}x), "
+                  f"index {stats['index_bytes']:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,61 +1,68 @@
-import requests
+import re
 import json
+import time
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup 
+import threading
+from collections import Counter
+from typing import List, Dict, NamedTuple, Optional
+
+# requests / bs4 ถูก import ตอนเรียกใช้ครั้งแรก (verify / _create_prompt) ไม่ให้ worker ที่ไม่ใช้ LLM ต้องโหลด
 
 logger = logging.getLogger(__name__)
 
 # กำหนด URL และ Model
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
 OLLAMA_MODEL = "llama3.2"
+OLLAMA_TIMEOUT = 180    # วินาทีสูงสุดที่รอคำตอบต่อ request
+OLLAMA_NUM_CTX = 16384     # context สูงสุดของโมเดลหลัก (ใช้จริงเท่าที่ prompt ต้องการ ดู CTX_SIZES)
+VERIFY_PAGE_CHARS = 50000
+OLLAMA_KEEP_ALIVE = "30m"  # ให้โมเดลค้างใน memory ระหว่าง request (Ollama default 5m แล้ว unload)
 
-class Verifier:
-    """
-    เครื่องมือตรวจสอบความถูกต้องของข้อมูลที่ Scrape มาเทียบกับ Live Content
-    - เพิ่มการแปลง HTML เป็น Text ล้วน เพื่อให้อ่านข้อมูลได้ครบทั้งหน้า
-    """
-    def __init__(self, ollama_url: str = OLLAMA_API_URL, model: str = OLLAMA_MODEL):
-        self.ollama_url = ollama_url
-        self.model = model
-        logger.info(f" ---- Verifier initialized: Model={self.model}, API={self.ollama_url} ---- ")
+# --- PROMPT SIZING CONFIG ---
+# num_ctx ใช้เป็นขั้น: Ollama ต้องโหลดโมเดลใหม่ทุกครั้งที่ num_ctx เปลี่ยน จึงไม่ตั้งตามความยาว prompt ทุกค่า
+CTX_SIZES = (2048, 4096, 8192, 16384, 32768)
+DEFAULT_TOKENS_PER_CHAR = 0.5      # ใช้จนกว่าจะวัดได้จาก prompt_eval_count (ภาษาไทยใช้ token ต่อตัวอักษรมากกว่าอังกฤษ)
+PROMPT_TEMPLATE_TOKENS = 64        # token ของ chat template ที่ Ollama ครอบ system / prompt
+NUM_PREDICT_MIN = 512              # ความยาวคำตอบ (token): 2 เท่าของคำตอบที่ยาวที่สุดที่เคยเห็น ภายในช่วงนี้
+NUM_PREDICT_MAX = 2048
 
-    def _format_scraped_data(self, scraped_data: List[Dict]) -> str:
-        """จัดรูปแบบข้อมูลที่ Scrape มาให้ LLM อ่านง่าย"""
-        if not scraped_data:
-            return "No records were scraped."
-        return "\n".join([f"- {r['Full_Name']} | {r['Position']}" for r in scraped_data])
+# --- CASCADE CONFIG ---
+OLLAMA_FAST_MODEL = "llama3.2:1b"
+ESCALATE_BELOW_CONFIDENCE = 0.9    # คำตอบของ tier เล็กที่มี confidence ต่ำกว่านี้ส่งต่อ tier ถัดไป
 
-    def _create_prompt(self, scraped_records_string: str, live_html_content: str, bank_name: str) -> str:
-        """
-        - เพิ่มการแปลง HTML เป็น Text ล้วน เพื่อให้ AI อ่านข้อมูลได้ครบทั้งหน้า
-        """
-        # 1. ใช้ BeautifulSoup แปลง HTML เป็น Text
-        soup = BeautifulSoup(live_html_content, 'html.parser')
-        
-        # ลบส่วนที่ไม่จำเป็นออก
-        for element in soup(["script", "style", "header", "footer", "nav", "noscript", "meta"]):
-            element.decompose()
-            
-        # ดึงเฉพาะข้อความ และจัดระเบียบเว้นวรรค
-        text_content = soup.get_text(" ", strip=True)
-        # ลดช่องว่างที่ซ้ำซ้อนให้เหลือช่องเดียว
-        text_content = " ".join(text_content.split())
-        
-        # 2. เพิ่ม Limit เป็น 15,000 ตัวอักษร
-        live_snippet = text_content[:50000]
 
-        return f"""
-คุณคือผู้เชี่ยวชาญด้านการตรวจสอบข้อมูลองค์กร ที่มีความเข้มงวดสูงในการตรวจสอบความถูกต้องของข้อมูล
+class ModelTier(NamedTuple):
+    name: str
+    model: Optional[str]     # None = ตรวจแบบ deterministic (ไม่เรียก LLM)
+    timeout: float
+    num_ctx: int
+    page_chars: int          # ความยาวเนื้อหาหน้าเว็บที่ใส่ใน prompt
 
-**งานของคุณ:**
-ตรวจสอบความถูกต้องและครบถ้วนของรายชื่อผู้บริหารของ {bank_name} ที่ถูกดึงมาจากหน้าเว็บ
 
-**### รายชื่อที่ถูก Scrape มา (Scraped List)**
-{scraped_records_string}
+def default_tiers(model: str = OLLAMA_MODEL, timeout: float = OLLAMA_TIMEOUT) -> List[ModelTier]:
+    """rules -> โมเดลเล็ก (prompt สั้น) -> โมเดลหลัก (prompt เต็ม)"""
+    return [
+        ModelTier('rules', None, 0, 0, 0),
+        ModelTier('fast', OLLAMA_FAST_MODEL, min(60, timeout), 8192, 20000),
+        ModelTier('full', model, timeout, OLLAMA_NUM_CTX, VERIFY_PAGE_CHARS),
+    ]
 
-**### เนื้อหาบนหน้าเว็บ (Page Content)**
-{live_snippet}
+
+_NAME_CANDIDATE_RE = re.compile(r'(?:นางสาว|นาง|นาย|ดร\.|คุณหญิง)\s*([\u0E00-\u0E7F]{2,})\s+([\u0E00-\u0E7F]{2,})')
+_NAME_PREFIX_RE = re.compile(r'^(?:นางสาว|นาง|นาย|ดร\.?|คุณหญิง|คุณ)\s*')
+
+VERIFY_SYSTEM_PROMPT = ("You are a strict data validation expert. Extract missing executive names with their EXACT "
+                        "positions from the source content. Return ONLY valid JSON with full_name, position, and "
+                        "confidence (0.0-1.0) for each missing person. Only include entries with confidence >= 0.85.")
+
+# ส่วนคงที่ของ prompt: เหมือนกันทุกธนาคาร / ทุก request -> Ollama ใช้ KV cache ของ prefix นี้ซ้ำได้
+# (ข้อมูลที่เปลี่ยนตาม request ต้องอยู่ท้ายเท่านั้น ดู Verifier._create_prompt)
+VERIFY_INSTRUCTIONS = """
+คุณคือผู้เชี่ยวชาญด้านการตรวจสอบข้อมูลองค์กร ที่มีความเข้มงวดสูงในการตรวจสอบความถูกต้องของข้อมูล
+
+**งานของคุณ:**
+ตรวจสอบความถูกต้องและครบถ้วนของรายชื่อผู้บริหารของธนาคารที่ระบุในส่วน "ข้อมูลที่ต้องตรวจสอบ" ท้ายข้อความนี้
+โดยเทียบ Scraped List กับ Page Content ที่ให้มา
 
 **คำสั่งที่ต้องปฏิบัติอย่างเคร่งครัด:**
 
@@ -79,17 +86,17 @@ class Verifier:
    - confidence: ระดับความมั่นใจ 0.0-1.0 (ต้อง >= 0.85 เท่านั้น)
 
 **ตัวอย่าง JSON Output ที่ถูกต้อง:**
-{{
+{
   "is_complete": false,
   "missing_names": [
-    {{
+    {
       "full_name": "นางขัตติยา อินทรวิชัย",
       "position": "ประธานเจ้าหน้าที่บริหาร",
       "confidence": 0.95
-    }}
+    }
   ],
   "extra_names": [""]
-}}
+}
 
 **หลักเกณฑ์การตัดสินใจ:**
 - ถ้าข้อมูลไม่แน่ชัด confidence ต่ำกว่า 0.85 → อย่าใส่ในรายการ
@@ -100,45 +107,300 @@ class Verifier:
 - is_complete: boolean (true = ข้อมูล Scraped ครบถ้วน)
 - missing_names: array of objects (ชื่อที่หายไปพร้อมตำแหน่งและ confidence)
 - extra_names: array of strings (ชื่อที่ดึงมาเกิน)
+"""
+
+
+class Verifier:
+    """
+    เครื่องมือตรวจสอบความถูกต้องของข้อมูลที่ Scrape มาเทียบกับ Live Content
+    - เพิ่มการแปลง HTML เป็น Text ล้วน เพื่อให้อ่านข้อมูลได้ครบทั้งหน้า
+    - ตรวจแบบ cascade: rules (ชื่อทุกชื่อในหน้ามีใน list แล้ว = ครบ ไม่ต้องเรียก LLM) -> โมเดลเล็ก -> โมเดลหลัก
+      ส่งต่อ tier ถัดไปเมื่อพบชื่อตกหล่น, confidence ต่ำ หรือ JSON เสีย (tiers=[...] กำหนดเองได้)
+    """
+    def __init__(self, ollama_url: str = OLLAMA_API_URL, model: str = OLLAMA_MODEL, timeout: float = OLLAMA_TIMEOUT,
+                 tiers: Optional[List[ModelTier]] = None):
+        self.ollama_url = ollama_url
+        self.model = model
+        self.timeout = timeout
+        self.tiers = tiers or default_tiers(model, timeout)
+        self._disabled = set()
+        self._text_cache = (None, "")
+        self._stats_lock = threading.Lock()
+        self.stats = {'calls': Counter(), 'seconds': Counter(), 'resolved': Counter(), 'escalated': Counter(),
+                      'page_seconds': 0.0, 'timed': Counter(), 'ttft': Counter(), 'prompt_tokens': Counter(),
+                      'eval_tokens': Counter()}
+        # ค่าที่วัดจากคำตอบของ Ollama ต่อโมเดล: token ต่อตัวอักษรของ prompt และความยาวคำตอบสูงสุด
+        self._tokens_per_char = {}
+        self._max_eval_tokens = {}
+        logger.info(" ---- Verifier initialized: Tiers=%s, API=%s ---- ",
+                    ' -> '.join(t.model or t.name for t in self.tiers), self.ollama_url)
+
+    def _format_scraped_data(self, scraped_data: List[Dict]) -> str:
+        """จัดรูปแบบข้อมูลที่ Scrape มาให้ LLM อ่านง่าย"""
+        if not scraped_data:
+            return "No records were scraped."
+        return "\n".join([f"- {r['Full_Name']} | {r['Position']}" for r in scraped_data])
+
+    def _page_text(self, live_html_content: str) -> str:
+        """แปลง HTML เป็น Text ล้วน (จำผลของหน้าล่าสุดไว้ ทุก tier ใช้ร่วมกันไม่ต้อง parse ซ้ำ)"""
+        cached_html, cached_text = self._text_cache
+        if cached_html is live_html_content:
+            return cached_text
+
+        from bs4 import BeautifulSoup
+
+        # 1. ใช้ BeautifulSoup แปลง HTML เป็น Text
+        soup = BeautifulSoup(live_html_content, 'html.parser')
+        
+        # ลบส่วนที่ไม่จำเป็นออก
+        for element in soup(["script", "style", "header", "footer", "nav", "noscript", "meta"]):
+            element.decompose()
+            
+        # ดึงเฉพาะข้อความ และจัดระเบียบเว้นวรรค
+        text_content = soup.get_text(" ", strip=True)
+        # ลดช่องว่างที่ซ้ำซ้อนให้เหลือช่องเดียว
+        text_content = " ".join(text_content.split())
+        self._text_cache = (live_html_content, text_content)
+        return text_content
+
+    def _create_prompt(self, scraped_records_string: str, live_html_content: str, bank_name: str,
+                       page_chars: int = VERIFY_PAGE_CHARS) -> str:
         """
+        - เพิ่มการแปลง HTML เป็น Text ล้วน เพื่อให้ AI อ่านข้อมูลได้ครบทั้งหน้า
+        - คำสั่ง (VERIFY_INSTRUCTIONS) อยู่ต้น prompt, ชื่อธนาคาร / รายชื่อ / เนื้อหาหน้าเว็บอยู่ท้าย
+          ให้ทุก request มี prefix เดียวกัน (Ollama ไม่ต้อง eval คำสั่งซ้ำ)
+        """
+        # 2. ตัดเนื้อหาตามขนาด context ของ tier (โมเดลหลัก 50,000 ตัวอักษร)
+        live_snippet = self._page_text(live_html_content)[:page_chars]
+
+        return f"""{VERIFY_INSTRUCTIONS}
+**### ข้อมูลที่ต้องตรวจสอบ: {bank_name}**
+
+**### รายชื่อที่ถูก Scrape มา (Scraped List)**
+{scraped_records_string}
+
+**### เนื้อหาบนหน้าเว็บ (Page Content)**
+{live_snippet}
+"""
 
     def verify(self, scraped_data: List[Dict], live_html_content: str, bank_name: str) -> Dict:
         """
-        ส่งข้อมูลไปให้ Ollama ตรวจสอบและรับผลลัพธ์ JSON
+        ตรวจข้อมูลแบบ cascade แล้วคืนผลลัพธ์ JSON ของ tier ที่ตัดสิน (key 'tier' บอกว่า tier ไหน)
         """
+        tiers = [tier for tier in self.tiers if tier.name not in self._disabled]
+        result = {"error": "no verification tier available", "is_complete": False, "missing_names": [], "extra_names": []}
+
+        # แปลงหน้าครั้งเดียวก่อนเข้า tier แรก (ทุก tier ใช้ข้อความเดียวกัน ไม่นับเป็นเวลาของ tier ใด)
+        start = time.perf_counter()
+        self._page_text(live_html_content)
+        with self._stats_lock:
+            self.stats['page_seconds'] += time.perf_counter() - start
+
+        for i, tier in enumerate(tiers):
+            start = time.perf_counter()
+            if tier.model is None:
+                result = self._rule_check(scraped_data, live_html_content)
+            else:
+                result = self._call_model(tier, scraped_data, live_html_content, bank_name)
+            elapsed = time.perf_counter() - start
+
+            escalate = i < len(tiers) - 1 and self._needs_escalation(result)
+            with self._stats_lock:
+                self.stats['calls'][tier.name] += 1
+                self.stats['seconds'][tier.name] += elapsed
+                self.stats['escalated' if escalate else 'resolved'][tier.name] += 1
+            if not escalate:
+                result['tier'] = tier.name
+                return result
+            logger.info(" ---- Tier '%s' not conclusive (%s), escalating ---- ", tier.name, self._escalation_reason(result))
+
+        return result
+
+    def _rule_check(self, scraped_data: List[Dict], live_html_content: str) -> Dict:
+        """
+        ตรวจแบบไม่ใช้ LLM: ทุกชื่อที่มีคำนำหน้าในหน้าเว็บต้องอยู่ใน list ที่ scrape มาแล้ว
+        (ไม่เจอชื่อในหน้าเลย / มีชื่อที่ยังไม่อยู่ใน list -> ไม่สรุป ให้ tier ถัดไปตัดสิน)
+        """
+        scraped_keys = set()
+        for record in scraped_data:
+            if record.get('First_Name'):
+                key = f"{record['First_Name']}{record.get('Surname') or ''}"
+            else:
+                key = _NAME_PREFIX_RE.sub('', record.get('Full_Name') or '')
+            key = "".join(key.split())
+            if len(key) > 4:
+                scraped_keys.add(key)
+
+        candidates = {first + surname for first, surname in _NAME_CANDIDATE_RE.findall(self._page_text(live_html_content))}
+        # ชื่อในหน้าที่ติดกับตำแหน่ง (ไม่มีช่องว่างคั่น) ถือว่าครอบคลุมถ้าขึ้นต้นด้วยชื่อที่มีแล้ว
+        uncovered = [name for name in candidates
+                     if name not in scraped_keys and not any(name.startswith(key) for key in scraped_keys)]
+
+        if candidates and not uncovered:
+            return {"is_complete": True, "missing_names": [], "extra_names": []}
+        return {"is_complete": False, "missing_names": [], "extra_names": [], "inconclusive": True,
+                "unmatched_candidates": len(uncovered)}
+
+    def _call_model(self, tier: ModelTier, scraped_data: List[Dict], live_html_content: str, bank_name: str) -> Dict:
+        """ส่งข้อมูลไปให้ Ollama (โมเดลของ tier) ตรวจสอบและรับผลลัพธ์ JSON"""
+        import requests
+
         scraped_records_string = self._format_scraped_data(scraped_data)
-        user_prompt = self._create_prompt(scraped_records_string, live_html_content, bank_name)
+        user_prompt, num_ctx, num_predict = self._sized_prompt(tier, scraped_records_string, live_html_content,
+                                                               bank_name)
 
         payload = {
-            "model": self.model,
+            "model": tier.model,
             "prompt": user_prompt,
-            "system": "You are a strict data validation expert. Extract missing executive names with their EXACT positions from the source content. Return ONLY valid JSON with full_name, position, and confidence (0.0-1.0) for each missing person. Only include entries with confidence >= 0.85.",
+            "system": VERIFY_SYSTEM_PROMPT,
             "stream": False,
             "format": "json",
-            "temperature": 0.1,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
 
+            # temperature ต้องอยู่ใน options (Ollama ไม่อ่านค่าที่ระดับบนของ payload)
             "options": {
-                "num_ctx": 16384  # รองรับ Token ได้เยอะขึ้นมาก (ประมาณ 60,000 chars)
+                "temperature": 0.1,
+                "num_ctx": num_ctx,
+                "num_predict": num_predict
             }
         }
 
-        logger.info(" ---- Sending data to Ollama for verification... ---- ")
+        logger.info(" ---- Sending data to Ollama (%s) for verification... ---- ", tier.model)
         
         try:
-            response = requests.post(self.ollama_url, json=payload, timeout=180)
+            response = requests.post(self.ollama_url, json=payload, timeout=tier.timeout)
+            if response.status_code == 404 and tier.model != self.model:
+                # โมเดลยังไม่ได้ pull: ข้าม tier นี้ตลอดการทำงานที่เหลือ
+                logger.warning(" ---- Model '%s' not available, disabling tier '%s' ---- ", tier.model, tier.name)
+                self._disabled.add(tier.name)
             response.raise_for_status()
             
-            result_text = response.json().get('response', '{}')
-            result = json.loads(result_text)
-            result = self._validate_and_clean_result(result)
+            body = response.json()
+            self._record_usage(tier, len(VERIFY_SYSTEM_PROMPT) + len(user_prompt), num_ctx, body)
+            result_text = body.get('response', '{}')
+            raw_result = json.loads(result_text)
+            result = self._validate_and_clean_result(raw_result)
+            # ชื่อที่โมเดลไม่มั่นใจ (ถูกกรองทิ้งหรือใกล้เกณฑ์) ทำให้ผลดูครบทั้งที่ไม่แน่ใจ -> ให้ tier ถัดไปตรวจ
+            low_confidence = self._count_low_confidence(raw_result)
+            if low_confidence:
+                result['low_confidence'] = low_confidence
             
             logger.info(" ---- Ollama verification completed. ----")
             return result
 
         except Exception as e:
-            logger.error(f" ---- Ollama API Error: {e} ---- ")
+            logger.error(" ---- Ollama API Error: %s ---- ", e)
             return {"error": str(e), "is_complete": False, "missing_names": [], "extra_names": []}
 
+    def _estimate_tokens(self, model: str, prompt: str) -> int:
+        tokens_per_char = self._tokens_per_char.get(model, DEFAULT_TOKENS_PER_CHAR)
+        return int((len(VERIFY_SYSTEM_PROMPT) + len(prompt)) * tokens_per_char) + PROMPT_TEMPLATE_TOKENS
+
+    def _sized_prompt(self, tier: ModelTier, scraped_records_string: str, live_html_content: str, bank_name: str):
+        """
+        สร้าง prompt ให้พอดี context ของ tier และเลือก num_ctx / num_predict จากจำนวน token ที่ประมาณไว้
+        (prompt ยาวเกิน -> ตัดเนื้อหาหน้าเว็บเอง ไม่ปล่อยให้ Ollama ตัดต้น prompt ซึ่งเป็นคำสั่ง)
+        Returns:
+            (prompt, num_ctx, num_predict)
+        """
+        num_predict = min(NUM_PREDICT_MAX, max(NUM_PREDICT_MIN, 2 * self._max_eval_tokens.get(tier.model, 0)))
+        prompt = self._create_prompt(scraped_records_string, live_html_content, bank_name, tier.page_chars)
+        needed = self._estimate_tokens(tier.model, prompt) + num_predict
+
+        if needed > tier.num_ctx:
+            tokens_per_char = self._tokens_per_char.get(tier.model, DEFAULT_TOKENS_PER_CHAR)
+            page_chars = min(tier.page_chars, len(self._page_text(live_html_content)))
+            page_chars = max(0, page_chars - int((needed - tier.num_ctx) / tokens_per_char) - 1)
+            logger.info(" ---- Prompt for %s over num_ctx %s (~%s tokens), page content cut to %s chars ---- ",
+                        tier.model, tier.num_ctx, needed, page_chars)
+            prompt = self._create_prompt(scraped_records_string, live_html_content, bank_name, page_chars)
+            needed = self._estimate_tokens(tier.model, prompt) + num_predict
+
+        num_ctx = next((size for size in CTX_SIZES if size >= needed), tier.num_ctx)
+        return prompt, min(num_ctx, tier.num_ctx), num_predict
+
+    def _record_usage(self, tier: ModelTier, prompt_chars: int, num_ctx: int, body: Dict):
+        """
+        เก็บสถิติจากคำตอบของ Ollama: TTFT = load_duration + prompt_eval_duration, token ของ prompt / คำตอบ
+        และปรับค่าประมาณ token ต่อตัวอักษร (prefix ที่อยู่ใน cache ไม่ถูกนับใน prompt_eval_count
+        ค่าที่วัดได้จึงต่ำกว่าจริงได้ -> ใช้ค่าสูงสุดที่เคยเห็น)
+        """
+        prompt_tokens = body.get('prompt_eval_count') or 0
+        eval_tokens = body.get('eval_count') or 0
+        ttft = ((body.get('load_duration') or 0) + (body.get('prompt_eval_duration') or 0)) / 1e9
+        with self._stats_lock:
+            if prompt_tokens and prompt_chars:
+                measured = (prompt_tokens - PROMPT_TEMPLATE_TOKENS) / prompt_chars
+                self._tokens_per_char[tier.model] = max(self._tokens_per_char.get(tier.model, 0.0), measured)
+            if eval_tokens:
+                self._max_eval_tokens[tier.model] = max(self._max_eval_tokens.get(tier.model, 0), eval_tokens)
+            self.stats['timed'][tier.name] += 1
+            self.stats['ttft'][tier.name] += ttft
+            self.stats['prompt_tokens'][tier.name] += prompt_tokens
+            self.stats['eval_tokens'][tier.name] += eval_tokens
+        logger.info(" ---- %s: TTFT %.2fs, prompt tokens evaluated %s, eval tokens %s, num_ctx %s ---- ",
+                    tier.model, ttft, prompt_tokens, eval_tokens, num_ctx)
+
+    @staticmethod
+    def _count_low_confidence(raw_result) -> int:
+        if not isinstance(raw_result, dict) or not isinstance(raw_result.get('missing_names'), list):
+            return 0
+        count = 0
+        for item in raw_result['missing_names']:
+            try:
+                if isinstance(item, dict) and float(item.get('confidence', 0.0)) < ESCALATE_BELOW_CONFIDENCE:
+                    count += 1
+            except (TypeError, ValueError):
+                count += 1
+        return count
+
+    @staticmethod
+    def _escalation_reason(result: Dict) -> Optional[str]:
+        if result.get('error'):
+            return "error / invalid JSON"
+        if result.get('inconclusive'):
+            return f"{result.get('unmatched_candidates', 0)} unmatched name(s)"
+        if result.get('missing_names'):
+            return f"{len(result['missing_names'])} missing name(s)"
+        if result.get('low_confidence'):
+            return f"{result['low_confidence']} low-confidence name(s)"
+        if not result.get('is_complete'):
+            return "reported incomplete"
+        return None
+
+    def _needs_escalation(self, result: Dict) -> bool:
+        return self._escalation_reason(result) is not None
+
+    def cascade_summary(self) -> str:
+        """
+        สรุปการทำงานของแต่ละ tier และเวลาที่ประหยัดได้
+        (ประมาณจาก: งานที่จบก่อน tier สุดท้าย x เวลาเฉลี่ยของ tier สุดท้าย - เวลาที่ใช้ใน tier ก่อนหน้า)
+        """
+        stats = self.stats
+        lines = [f"{'tier':<8}{'model':<16}{'calls':>7}{'resolved':>10}{'escalated':>11}{'avg s':>8}"
+                 f"{'ttft s':>8}{'prompt tok':>12}{'eval tok':>10}"]
+        for tier in self.tiers:
+            calls = stats['calls'][tier.name]
+            average = stats['seconds'][tier.name] / calls if calls else 0.0
+            # ค่าเฉลี่ยต่อ request ที่ Ollama ตอบกลับมา (TTFT / token ที่ถูก eval จริง ไม่รวม prefix ที่อยู่ใน cache)
+            timed = stats['timed'][tier.name]
+            usage = (f"{stats['ttft'][tier.name] / timed:>8.2f}{stats['prompt_tokens'][tier.name] / timed:>12.0f}"
+                     f"{stats['eval_tokens'][tier.name] / timed:>10.0f}") if timed else f"{'-':>8}{'-':>12}{'-':>10}"
+            lines.append(f"{tier.name:<8}{tier.model or '-':<16}{calls:>7}{stats['resolved'][tier.name]:>10}"
+                         f"{stats['escalated'][tier.name]:>11}{average:>8.2f}{usage}")
+
+        final = self.tiers[-1].name
+        early = sum(count for name, count in stats['resolved'].items() if name != final)
+        if stats['calls'][final]:
+            full_average = stats['seconds'][final] / stats['calls'][final]
+            spent_early = sum(seconds for name, seconds in stats['seconds'].items() if name != final)
+            lines.append(f"resolved before '{final}': {early}, inference time saved ~"
+                         f"{early * full_average - spent_early:.1f}s")
+        else:
+            lines.append(f"resolved before '{final}': {early} ('{final}' not called, no timing to estimate savings)")
+        lines.append(f"page text extraction (shared by all tiers): {stats['page_seconds']:.1f}s")
+        return "\n".join(lines)
+
     def _validate_and_clean_result(self, result: Dict) -> Dict:
         """
         ตรวจสอบและทำความสะอาดผลลัพธ์จาก LLM พร้อมกรองชื่อสมมติ